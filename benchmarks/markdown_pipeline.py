@@ -0,0 +1,48 @@
+"""Benchmark the per-call overhead of the Markdown pipeline.
+
+Compares building a new Markdown pipeline for every render, which is what `mistune_renderer` used to do, with
+borrowing a pipeline from the pool.
+
+Run with:
+
+```
+python -m benchmarks.markdown_pipeline
+```
+"""
+
+import timeit
+from pathlib import Path
+
+from config.markdown_renderer import create_markdown, render_markdown
+
+CORPUS_DIR = Path(__file__).resolve().parent / "corpus"
+ROUNDS = 200
+
+
+def load_corpus() -> dict[str, str]:
+    """Load the Markdown documents in the corpus directory.
+
+    Returns:
+        dict[str, str]: The documents, keyed by file name.
+    """
+    return {path.stem: path.read_text() for path in sorted(CORPUS_DIR.glob("*.md"))}
+
+
+def render_with_new_pipeline(markdown_text: str) -> str:
+    """Render the markdown text with a freshly built pipeline."""
+    return str(create_markdown()(markdown_text))
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    corpus = load_corpus()
+
+    print(f"{'document':<32}{'new pipeline':>16}{'pooled':>16}{'speed-up':>12}")  # noqa: T201
+    for name, text in corpus.items():
+        fresh = min(timeit.repeat(lambda t=text: render_with_new_pipeline(t), number=ROUNDS, repeat=3)) / ROUNDS
+        pooled = min(timeit.repeat(lambda t=text: render_markdown(t), number=ROUNDS, repeat=3)) / ROUNDS
+        print(f"{name:<32}{fresh * 1e6:>13.1f} µs{pooled * 1e6:>13.1f} µs{fresh / pooled:>11.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
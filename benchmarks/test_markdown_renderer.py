@@ -0,0 +1,122 @@
+"""Benchmark suite for the Markdown renderer.
+
+The benchmarks are opt-in. Run them with:
+
+```
+pytest -m benchmark -s
+```
+
+Each document in the corpus is rendered without the rendered HTML and highlighted code caches, so every run exercises
+the parser, the `CustomRenderer` overrides and Pygments. The results are compared with `baseline.json`:
+
+- the SHA-256 of the rendered HTML must match, which catches changes to the output of the renderer overrides
+- the median latency must be within `BENCHMARK_TOLERANCE` (default 2.0) times the baseline
+- the peak allocations must be within 1.25 times the baseline
+
+Set `BENCHMARK_UPDATE_BASELINE=1` to write the current results to `baseline.json` instead.
+"""
+
+import gc
+import hashlib
+import json
+import os
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from pygments import highlight
+
+from benchmarks.markdown_pipeline import load_corpus
+from config import markdown_renderer
+from config.markdown_renderer import get_lexer, render_markdown
+
+pytestmark = pytest.mark.benchmark
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+ROUNDS = 50
+WARMUP_ROUNDS = 5
+LATENCY_TOLERANCE = float(os.environ.get("BENCHMARK_TOLERANCE", "2.0"))
+ALLOCATION_TOLERANCE = 1.25
+UPDATE_BASELINE = os.environ.get("BENCHMARK_UPDATE_BASELINE") == "1"
+
+CORPUS = load_corpus()
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    """Load the baseline results, and write the new results when updating the baseline."""
+    results = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    yield results
+    if UPDATE_BASELINE:
+        BASELINE_PATH.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.fixture(autouse=True)
+def uncached_highlighting(monkeypatch):
+    """Highlight code blocks with Pygments on every render, rather than using the highlight cache."""
+
+    def highlight_code(code, lang):
+        return highlight(code, get_lexer(lang), markdown_renderer.get_formatter())
+
+    monkeypatch.setattr(markdown_renderer, "highlight_code", highlight_code)
+
+
+def measure(text: str) -> dict:
+    """Render the text repeatedly and return the results."""
+    for _ in range(WARMUP_ROUNDS):
+        render_markdown(text)
+
+    gc.collect()
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter_ns()
+        render_markdown(text)
+        timings.append(time.perf_counter_ns() - start)
+
+    tracemalloc.start()
+    try:
+        html = render_markdown(text)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    p50 = statistics.median(timings)
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    return {
+        "ops_per_sec": round(1e9 / statistics.mean(timings), 1),
+        "p50_us": round(p50 / 1000, 1),
+        "p99_us": round(p99 / 1000, 1),
+        "peak_alloc_kib": round(peak / 1024, 1),
+        "html_sha256": hashlib.sha256(html.encode()).hexdigest(),
+    }
+
+
+@pytest.mark.parametrize("name", sorted(CORPUS))
+def test_render(name, baseline, capsys):
+    """Benchmark rendering a document and compare the results with the baseline."""
+    result = measure(CORPUS[name])
+
+    with capsys.disabled():
+        print(  # noqa: T201
+            f"\n{name:<40}{result['ops_per_sec']:>10.1f} ops/s"
+            f"{result['p50_us']:>10.1f} µs p50{result['p99_us']:>10.1f} µs p99"
+            f"{result['peak_alloc_kib']:>10.1f} KiB peak",
+        )
+
+    if UPDATE_BASELINE or name not in baseline:
+        baseline[name] = result
+        if not UPDATE_BASELINE:
+            pytest.skip(f"No baseline for {name}; run with BENCHMARK_UPDATE_BASELINE=1 to record one")
+        return
+
+    expected = baseline[name]
+    assert result["html_sha256"] == expected["html_sha256"], f"Rendered HTML for {name} has changed"
+    assert result["p50_us"] <= expected["p50_us"] * LATENCY_TOLERANCE, (
+        f"Median latency for {name} regressed: {result['p50_us']} µs vs baseline {expected['p50_us']} µs"
+    )
+    assert result["peak_alloc_kib"] <= expected["peak_alloc_kib"] * ALLOCATION_TOLERANCE, (
+        f"Peak allocations for {name} regressed: {result['peak_alloc_kib']} KiB vs {expected['peak_alloc_kib']} KiB"
+    )
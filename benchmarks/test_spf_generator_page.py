@@ -0,0 +1,63 @@
+"""Benchmark of rendering the SPF generator page.
+
+The benchmark is opt-in. Run it with:
+
+```
+pytest -m benchmark -s benchmarks/test_spf_generator_page.py
+```
+
+The page is rendered for the providers added by `populate_spf_data`, with the form's fields rendered for every request,
+as they were before, and with the fields rendered once for the catalogue version and cached. The median render time of
+each is compared.
+"""
+
+import io
+import statistics
+import time
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import RequestFactory
+
+from spf_generator import catalogue
+from spf_generator.catalogue import CATALOGUE_CACHE_ALIAS, get_catalogue
+from spf_generator.views import FORM_FIELDS_KEY, generate_spf_record
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 200
+# Caching the form's fields must make the page at least this much faster to render
+MIN_SPEEDUP = 1.5
+
+
+def render_times(*, cached):
+    factory = RequestFactory()
+    cache = caches[CATALOGUE_CACHE_ALIAS]
+    key = FORM_FIELDS_KEY.format(version=get_catalogue().version)
+    times = []
+    for _ in range(ROUNDS):
+        if not cached:
+            cache.delete(key)
+        request = factory.get("/spf/")
+        request.user = AnonymousUser()
+        start = time.perf_counter()
+        generate_spf_record(request)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+@pytest.mark.django_db
+def test_cached_form_fields(monkeypatch):
+    """Test the page renders faster with the form's fields cached than rendered for every request."""
+    monkeypatch.setattr(catalogue, "_catalogue", None)
+    call_command("populate_spf_data", stdout=io.StringIO())
+    render_times(cached=True)
+
+    uncached = statistics.median(render_times(cached=False)) * 1000
+    cached = statistics.median(render_times(cached=True)) * 1000
+
+    print(f"\n{len(get_catalogue().providers)} providers")  # noqa: T201
+    print(f"Fields rendered for every request: {uncached:.2f}ms\nFields cached: {cached:.2f}ms")  # noqa: T201
+    assert uncached >= cached * MIN_SPEEDUP
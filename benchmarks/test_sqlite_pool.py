@@ -0,0 +1,74 @@
+"""Benchmark of reusing SQLite connections.
+
+The benchmark is opt-in. Run it with:
+
+```
+pytest -m benchmark -s benchmarks/test_sqlite_pool.py
+```
+
+Each simulated request runs in a new thread, like a synchronous view under ASGI: it gets a new database wrapper,
+connects with the project's SQLite options, reads a post and closes the connection, as Django does at the end of each
+request. The requests per second are compared with and without the connection pool.
+"""
+
+import threading
+import time
+
+import pytest
+from django.conf import settings
+from django.db import connections
+
+from config.sqlite_backend.base import DatabaseWrapper
+
+pytestmark = pytest.mark.benchmark
+
+REQUESTS = 500
+# Pooling must make requests at least this much faster
+MIN_SPEEDUP = 1.2
+
+
+def make_wrapper(name, pool_size):
+    options = {**settings.SQLITE_OPTIONS, "pool_size": pool_size}
+    return DatabaseWrapper({**connections.settings["default"], "NAME": name, "OPTIONS": options}, alias="benchmark")
+
+
+def handle_request(name, pool_size):
+    wrapper = make_wrapper(name, pool_size)
+    with wrapper.cursor() as cursor:
+        cursor.execute("SELECT title, content FROM post WHERE id = %s", [1])
+        cursor.fetchone()
+    wrapper.close()
+
+
+def requests_per_second(name, pool_size):
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        thread = threading.Thread(target=handle_request, args=(name, pool_size))
+        thread.start()
+        thread.join()
+    return REQUESTS / (time.perf_counter() - start)
+
+
+@pytest.fixture
+def database(tmp_path, django_db_blocker):
+    name = tmp_path / "db.sqlite3"
+    with django_db_blocker.unblock():
+        wrapper = make_wrapper(name, pool_size=0)
+        with wrapper.cursor() as cursor:
+            cursor.execute("CREATE TABLE post (id INTEGER PRIMARY KEY, title TEXT, content TEXT)")
+            cursor.execute("INSERT INTO post (title, content) VALUES ('Hello', 'The first post.')")
+        wrapper.close()
+        yield name
+
+        wrapper = make_wrapper(name, pool_size=4)
+        wrapper.get_connection_params()
+        wrapper.pool.clear()
+
+
+def test_connection_reuse(database) -> None:
+    """Test reusing connections serves more requests per second than opening a connection for each request."""
+    without_reuse = requests_per_second(database, pool_size=0)
+    with_reuse = requests_per_second(database, pool_size=4)
+
+    print(f"\nWithout reuse: {without_reuse:.0f} requests/s\nWith reuse: {with_reuse:.0f} requests/s")  # noqa: T201
+    assert with_reuse >= without_reuse * MIN_SPEEDUP
@@ -0,0 +1 @@
+"""Blog tools app."""
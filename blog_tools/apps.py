@@ -0,0 +1,13 @@
+"""App configuration for the blog_tools app."""
+
+from django.apps import AppConfig
+
+
+class BlogToolsConfig(AppConfig):
+    """App configuration for the blog_tools app."""
+
+    name = "blog_tools"
+
+    def ready(self) -> None:
+        """Connect the signal handlers that regenerate the sitemaps."""
+        import blog_tools.signals  # noqa: F401, PLC0415
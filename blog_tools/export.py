@@ -0,0 +1,320 @@
+"""Exporting the DJ Press content as a single compressed stream.
+
+The export has the layout of DJ Press's `djpress_export` command: a Markdown file with YAML front matter for each post
+and page, the media files and their metadata, and the categories. Rather than writing the files to a temporary
+directory, zipping them and then compressing the zip, the content is streamed from the database in chunks and written
+straight into a gzipped tar stream, which can be a file, stdout or an upload.
+
+An incremental export only has the posts, pages and media modified since an earlier export, going by its manifest. The
+manifest is written as the last file in the archive, and is returned to be stored wherever the next export will find
+it.
+"""
+
+import io
+import json
+import logging
+import tarfile
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from django.utils import timezone
+from djpress.models import Category, Media, Post
+
+from deploy_tools.backup import COMPRESS_LEVEL
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer
+    from datetime import datetime
+
+    from django.db.models import QuerySet
+
+logger = logging.getLogger(__name__)
+
+# The number of posts fetched from the database at a time
+CHUNK_SIZE = 100
+
+EXPORT_KEY = "export-{timestamp}.tar.gz"
+MANIFEST_NAME = "export-manifest.json"
+
+
+class CountingWriter(io.RawIOBase):
+    """A stream that writes to another stream, counting the bytes written."""
+
+    def __init__(self, fileobj: Any) -> None:  # noqa: ANN401
+        """Wrap a stream.
+
+        Args:
+            fileobj (Any): The stream, which is left open.
+        """
+        super().__init__()
+        self.fileobj = fileobj
+        self.bytes_written = 0
+
+    def writable(self) -> bool:
+        """Return True, as the stream is writable."""
+        return True
+
+    def write(self, data: Buffer) -> int:
+        """Write data to the wrapped stream.
+
+        Args:
+            data (Buffer): The data.
+
+        Returns:
+            int: The number of bytes written, which is all of them.
+        """
+        data = memoryview(data)
+        self.fileobj.write(data)
+        self.bytes_written += len(data)
+        return len(data)
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    """The result of an export.
+
+    Attributes:
+        posts (int): The number of posts exported.
+        pages (int): The number of pages exported.
+        media (int): The number of media files exported.
+        size (int): The number of bytes of content, before compression.
+        written (int): The number of compressed bytes written.
+        elapsed (float): The number of seconds the export took.
+        manifest (dict[str, Any]): The manifest of the export.
+    """
+
+    posts: int
+    pages: int
+    media: int
+    size: int
+    written: int
+    elapsed: float
+    manifest: dict[str, Any]
+
+    @property
+    def rate(self) -> float:
+        """The number of compressed bytes written per second."""
+        return self.written / self.elapsed if self.elapsed else 0.0
+
+
+def yaml_value(value: object) -> str:
+    """Format a front matter value as YAML, as `djpress_export` does.
+
+    Args:
+        value (object): The value.
+
+    Returns:
+        str: The YAML.
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int | float):
+        return str(value)
+    if isinstance(value, list):
+        return "\n" + "\n".join(f"  - {item}" for item in value)
+
+    # Quote strings that contain colons or start with special characters
+    value_str = str(value)
+    if ":" in value_str or value_str.startswith(("-", "?")):
+        return f'"{value_str}"'
+    return value_str
+
+
+def page_paths() -> dict[int, str]:
+    """Return the full path of every page, from a single query rather than one for each parent of each page.
+
+    Returns:
+        dict[int, str]: The full path of each page, by its ID.
+    """
+    pages = {
+        pk: (slug, parent_id)
+        for pk, slug, parent_id in Post.admin_objects.filter(post_type="page").values_list("pk", "slug", "parent_id")
+    }
+    paths: dict[int, str] = {}
+
+    def path(pk: int) -> str:
+        if pk not in paths:
+            slug, parent_id = pages[pk]
+            paths[pk] = f"{path(parent_id)}/{slug}" if parent_id in pages else slug
+        return paths[pk]
+
+    for pk in pages:
+        path(pk)
+    return paths
+
+
+def post_file(post: Post, paths: dict[int, str]) -> tuple[str, bytes]:
+    """Render a post or page as a Markdown file with YAML front matter.
+
+    The categories, tags and author are expected to be prefetched.
+
+    Args:
+        post (Post): The post or page.
+        paths (dict[int, str]): The full path of each page, by its ID.
+
+    Returns:
+        tuple[str, bytes]: The name of the file in the archive, and its content.
+    """
+    frontmatter: dict[str, Any] = {
+        "title": post.title,
+        "date": timezone.localtime(post.published_at).isoformat(),
+        "lastmod": timezone.localtime(post.updated_at).isoformat(),
+        "status": post.status,
+        "slug": post.slug,
+        "author": post.author.get_full_name() or post.author.username,
+    }
+    if categories := [category.slug for category in post.categories.all()]:
+        frontmatter["categories"] = categories
+    if tags := [tag.slug for tag in post.tags.all()]:
+        frontmatter["tags"] = tags
+
+    if post.post_type == "page":
+        frontmatter["type"] = "page"
+        if post.menu_order != 0:
+            frontmatter["weight"] = post.menu_order
+        if post.parent_id in paths:
+            frontmatter["parent"] = paths[post.parent_id].rpartition("/")[2]
+            name = f"content/pages/{paths[post.pk]}/_index.md"
+        else:
+            name = f"content/pages/{post.slug}.md"
+    else:
+        # The local publish date used in the post's URL, as `djpress_export` names the files
+        name = f"content/posts/{post._date:%Y-%m-%d}-{post.slug}.md"  # noqa: SLF001
+
+    lines = ["---", *(f"{key}: {yaml_value(value)}" for key, value in frontmatter.items()), "---", "", post.content]
+    return name, "\n".join(lines).encode()
+
+
+def export_queryset(*, published_only: bool, since: datetime | None) -> QuerySet[Post]:
+    """Return the posts and pages to export, with what their files need.
+
+    Args:
+        published_only (bool): Whether to only export the published posts and pages.
+        since (datetime | None): Only export the posts and pages modified after this time.
+
+    Returns:
+        QuerySet[Post]: The posts and pages.
+    """
+    queryset = Post.objects.all() if published_only else Post.admin_objects.all()
+    if since is not None:
+        queryset = queryset.filter(updated_at__gt=since)
+    return queryset.select_related("author").prefetch_related("categories", "tags").order_by("pk")
+
+
+def add_file(archive: tarfile.TarFile, name: str, data: bytes, mtime: datetime | None = None) -> int:
+    """Add a file to the archive.
+
+    Returns:
+        int: The size of the file.
+    """
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(mtime.timestamp() if mtime else time.time())
+    archive.addfile(info, io.BytesIO(data))
+    return info.size
+
+
+def add_media_file(archive: tarfile.TarFile, media: Media) -> int | None:
+    """Add a media file to the archive, streamed from the storage without a copy on disk.
+
+    A file that can't be read from the storage is logged and skipped, and only its metadata is exported.
+
+    Returns:
+        int | None: The size of the file, or None if it was skipped.
+    """
+    info = tarfile.TarInfo(f"static/{media.file.name}")
+    info.mtime = int(media.updated_at.timestamp())
+    try:
+        info.size = media.file.size
+        file = media.file.open("rb")
+    except OSError:
+        logger.warning("Skipped the media file %s, which couldn't be read", media.file.name, exc_info=True)
+        return None
+
+    with file:
+        archive.addfile(info, file)
+    return info.size
+
+
+def export_content(
+    fileobj: Any,  # noqa: ANN401
+    *,
+    since: datetime | None = None,
+    now: datetime | None = None,
+    published_only: bool = False,
+    include_media: bool = True,
+) -> ExportResult:
+    """Export the content to a stream, as a gzipped tar archive.
+
+    Args:
+        fileobj (Any): The stream, which is left open.
+        since (datetime | None): Only export the posts, pages and media modified after this time.
+        now (datetime | None): When the export starts, which the next incremental export continues from.
+        published_only (bool): Whether to only export the published posts and pages.
+        include_media (bool): Whether to include the media files, rather than only their metadata.
+
+    Returns:
+        ExportResult: The result.
+    """
+    now = now or timezone.now()
+    start = time.perf_counter()
+    stream = CountingWriter(fileobj)
+    posts = pages = media_files = size = 0
+
+    with tarfile.open(fileobj=stream, mode="w|gz", compresslevel=COMPRESS_LEVEL) as archive:
+        paths = page_paths()
+        for post in export_queryset(published_only=published_only, since=since).iterator(chunk_size=CHUNK_SIZE):
+            name, data = post_file(post, paths)
+            size += add_file(archive, name, data, post.updated_at)
+            if post.post_type == "page":
+                pages += 1
+            else:
+                posts += 1
+
+        categories = [
+            {"title": c.title, "slug": c.slug, "description": c.description, "menu_order": c.menu_order}
+            for c in Category.objects.order_by("menu_order", "title")
+        ]
+        size += add_file(archive, "content/categories.json", json.dumps(categories, indent=2).encode())
+
+        metadata = {}
+        media_queryset = Media.objects.select_related("uploaded_by").exclude(file="").order_by("pk")
+        if since is not None:
+            media_queryset = media_queryset.filter(updated_at__gt=since)
+        for media in media_queryset.iterator(chunk_size=CHUNK_SIZE):
+            if include_media and (file_size := add_media_file(archive, media)) is not None:
+                size += file_size
+                media_files += 1
+
+            metadata[media.file.name] = {
+                "title": media.title,
+                "alt_text": media.alt_text,
+                "description": media.description,
+                "media_type": media.media_type,
+                "uploaded_by": media.uploaded_by.username if media.uploaded_by else None,
+                "uploaded_at": timezone.localtime(media.uploaded_at).isoformat(),
+                "updated_at": timezone.localtime(media.updated_at).isoformat(),
+                "url": media.file.url,
+            }
+        if metadata:
+            size += add_file(archive, "static/metadata.json", json.dumps(metadata, indent=2).encode())
+
+        manifest = {
+            "created": now.isoformat(),
+            "since": since.isoformat() if since else None,
+            "posts": posts,
+            "pages": pages,
+            "media": len(metadata),
+        }
+        size += add_file(archive, "manifest.json", json.dumps(manifest, indent=2).encode(), now)
+
+    return ExportResult(
+        posts=posts,
+        pages=pages,
+        media=media_files,
+        size=size,
+        written=stream.bytes_written,
+        elapsed=time.perf_counter() - start,
+        manifest=manifest,
+    )
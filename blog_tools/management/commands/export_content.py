@@ -0,0 +1,135 @@
+"""Management command to export the DJ Press content as a single compressed stream."""
+
+import contextlib
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils import timezone
+
+from blog_tools.export import EXPORT_KEY, MANIFEST_NAME, export_content
+from deploy_tools.backup import get_client, multipart_upload, read_json, write_json
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class Command(BaseCommand):
+    """Export the DJ Press content as a gzipped tar archive, streamed to a file, stdout or the S3 bucket.
+
+    The archive has the layout of `djpress_export`. An incremental export only has what was modified since the export
+    in the manifest, which is stored next to the archive, or in the bucket for uploads.
+    """
+
+    help = "Exports the DJ Press content to a file, stdout or S3 as a gzipped tar archive"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        destination = parser.add_mutually_exclusive_group(required=True)
+        destination.add_argument("-o", "--output", type=Path, help="The file to write the archive to, or - for stdout.")
+        destination.add_argument(
+            "--upload",
+            action="store_true",
+            help="Upload the archive to the S3 bucket, as export-<timestamp>.tar.gz.",
+        )
+        parser.add_argument(
+            "--manifest",
+            type=Path,
+            help=f"The manifest file. Defaults to {MANIFEST_NAME} next to the output file, or in the bucket.",
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only export what was modified since the export in the manifest.",
+        )
+        parser.add_argument("--published-only", action="store_true", help="Only export published posts and pages.")
+        parser.add_argument("--no-media", action="store_true", help="Export the media metadata without the files.")
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
+        """Handle the command execution."""
+        now = timezone.now()
+        output = options["output"]
+        to_stdout = output == Path("-")
+        # The archive itself may be on stdout
+        report = self.stderr if to_stdout else self.stdout
+
+        client = None
+        if options["upload"]:
+            if not settings.S3_BUCKET:
+                msg = "S3_BUCKET isn't set"
+                raise CommandError(msg)
+            client = get_client()
+
+        manifest_path = options["manifest"]
+        if manifest_path is None and output is not None and not to_stdout:
+            manifest_path = output.with_name(MANIFEST_NAME)
+
+        since = None
+        if options["incremental"]:
+            if client is not None:
+                manifest = read_json(client, settings.S3_BUCKET, MANIFEST_NAME)
+            elif manifest_path is not None:
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else None
+            else:
+                msg = "--incremental needs --manifest when exporting to stdout"
+                raise CommandError(msg)
+            if manifest is not None:
+                since = datetime.fromisoformat(manifest["created"])
+
+        with self.destination(output, client, now) as (fileobj, name):
+            result = export_content(
+                fileobj,
+                since=since,
+                now=now,
+                published_only=options["published_only"],
+                include_media=not options["no_media"],
+            )
+
+        manifest = {**result.manifest, "output": name}
+        if client is not None:
+            write_json(client, settings.S3_BUCKET, MANIFEST_NAME, manifest)
+        elif manifest_path is not None:
+            manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+        report.write(
+            f"Exported {result.posts} posts, {result.pages} pages and {result.media} media files "
+            f"{f'modified since {since.isoformat()} ' if since else ''}to {name}",
+        )
+        report.write(
+            self.style.SUCCESS(
+                f"Wrote {result.written:,} bytes ({result.size:,} uncompressed) in {result.elapsed:.2f}s, "
+                f"{result.rate:,.0f} bytes/sec",
+            ),
+        )
+
+    @contextlib.contextmanager
+    def destination(self, output: Path | None, client: Any, now: datetime) -> Iterator[tuple[Any, str]]:  # noqa: ANN401
+        """Open the stream the archive is written to.
+
+        Args:
+            output (Path | None): The output file, - for stdout, or None to upload.
+            client (Any): The S3 client, for uploads.
+            now (datetime): When the export started, which names the upload.
+
+        Yields:
+            tuple[Any, str]: The stream, and a description of where it goes.
+        """
+        if output is None:
+            key = EXPORT_KEY.format(timestamp=f"{now:%Y%m%d%H%M%S}")
+            with multipart_upload(client, settings.S3_BUCKET, key) as upload:
+                yield upload, f"s3://{settings.S3_BUCKET}/{key}"
+        elif output == Path("-"):
+            yield sys.stdout.buffer, "stdout"
+            sys.stdout.buffer.flush()
+        else:
+            try:
+                output.parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                msg = f"Failed to create output directory: {e}"
+                raise CommandError(msg) from e
+            with output.open("wb") as file:
+                yield file, str(output)
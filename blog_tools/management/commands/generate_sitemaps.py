@@ -0,0 +1,29 @@
+"""Management command to generate the sitemaps ahead of time."""
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from blog_tools.sitemaps import generate_sitemaps
+
+
+class Command(BaseCommand):
+    """Generate the sitemap index and every page of every sitemap section, and store them in the cache.
+
+    The sitemaps are also generated whenever the content changes, so this is only needed after a deploy or if the cache
+    has been cleared.
+    """
+
+    help = "Generates the sitemaps and stores them in the cache"
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
+        """Handle the command execution."""
+        start = time.perf_counter()
+        files = generate_sitemaps()
+        elapsed = time.perf_counter() - start
+
+        for name, sitemap in files.items():
+            self.stdout.write(f"{name}: {len(sitemap.xml)} bytes, {len(sitemap.content)} gzipped")
+
+        self.stdout.write(self.style.SUCCESS(f"Generated {len(files)} sitemap files in {elapsed:.2f}s"))
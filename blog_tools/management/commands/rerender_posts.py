@@ -0,0 +1,170 @@
+"""Management command to render every post and warm the rendered content cache."""
+
+import heapq
+import itertools
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils.module_loading import import_string
+from djpress.conf import settings as djpress_settings
+from djpress.models import Post
+from djpress.plugins import registry
+from djpress.plugins.hook_registry import PRE_RENDER_CONTENT
+
+from blog_tools.rendering import collect_batch_metadata, init_worker, render_batch
+from config.markdown_renderer import html_metadata_cache
+
+if TYPE_CHECKING:
+    from config.caching import TieredCache
+
+
+class Command(BaseCommand):
+    """Render every post through the content renderer across a pool of worker processes.
+
+    Posts are streamed from the database in batches and rendered in worker processes. If the content renderer is
+    cached, the results are written back to the cache in bulk, one write per batch. Otherwise, the metadata collected
+    from the rendered HTML is written to the HTML metadata cache instead. Both the full content and the truncated
+    content shown on index pages are rendered.
+    """
+
+    help = "Renders every post with the content renderer to warm the rendered content cache"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument(
+            "--renderer",
+            help="Dotted path to the content renderer. Defaults to the DJ Press CONTENT_RENDERER setting.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Number of posts in each batch sent to a worker process.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of worker processes. Defaults to the number of CPUs.",
+        )
+        parser.add_argument(
+            "--slowest",
+            type=int,
+            default=5,
+            help="Number of the slowest posts to report.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
+        """Handle the command execution."""
+        renderer_path = options["renderer"] or djpress_settings.CONTENT_RENDERER
+        cache = getattr(import_string(renderer_path), "cache", None)
+        task = render_batch
+        if cache is None:
+            # There's no cache of the rendered content, but the metadata of the rendered HTML is cached
+            cache = html_metadata_cache
+            task = collect_batch_metadata
+        batch_size = options["batch_size"]
+        workers = options["workers"] or os.cpu_count() or 1
+
+        posts = Post.admin_objects.order_by("pk").values_list("pk", "title", "content").iterator(chunk_size=batch_size)
+
+        post_count = 0
+        document_count = 0
+        # A min-heap of the slowest documents, so the fastest of them is the one to replace
+        slowest: list[tuple[float, int, str]] = []
+        limit = options["slowest"]
+        start = time.perf_counter()
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+            # Keep a limited number of batches in flight so we never hold every post in memory.
+            max_in_flight = workers * 2
+            in_flight: deque[tuple[list[tuple[int, str]], Future]] = deque()
+
+            for batch in itertools.batched(posts, batch_size, strict=False):
+                labels, contents = self.prepare_batch(batch)
+                in_flight.append((labels, executor.submit(task, renderer_path, contents)))
+                post_count += len(batch)
+
+                if len(in_flight) >= max_in_flight:
+                    document_count += self.write_results(cache, slowest, limit, *in_flight.popleft())
+
+            while in_flight:
+                document_count += self.write_results(cache, slowest, limit, *in_flight.popleft())
+
+        elapsed = time.perf_counter() - start
+        rate = post_count / elapsed if elapsed else 0.0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rendered {post_count} posts ({document_count} documents) in {elapsed:.2f}s: {rate:.1f} posts/sec",
+            ),
+        )
+        if task is collect_batch_metadata:
+            self.stdout.write(f"{renderer_path} is not cached, so only the HTML metadata cache was warmed")
+
+        for seconds, pk, title in sorted(slowest, reverse=True):
+            self.stdout.write(f"{seconds * 1000:9.2f} ms  post {pk}: {title}")
+
+    @staticmethod
+    def prepare_batch(batch: tuple[tuple[int, str, str], ...]) -> tuple[list[tuple[int, str]], list[str]]:
+        """Build the list of documents to render for a batch of posts.
+
+        Each post is rendered the same way as `Post.rendered_content`, after the pre-render plugin hooks have run. If
+        the post has a truncate tag, the truncated content is rendered as well.
+
+        Args:
+            batch (tuple): The post ID, title and content for each post.
+
+        Returns:
+            tuple: The post ID and title for each document, and the content of each document.
+        """
+        truncate_tag = djpress_settings.TRUNCATE_TAG
+
+        labels: list[tuple[int, str]] = []
+        contents: list[str] = []
+        for pk, title, content in batch:
+            labels.append((pk, title))
+            contents.append(registry.run_hook(PRE_RENDER_CONTENT, content))
+
+            read_more_index = content.find(truncate_tag)
+            if read_more_index != -1:
+                labels.append((pk, title))
+                contents.append(content[:read_more_index])
+
+        return labels, contents
+
+    @staticmethod
+    def write_results(
+        cache: TieredCache,
+        slowest: list[tuple[float, int, str]],
+        limit: int,
+        labels: list[tuple[int, str]],
+        future: Future,
+    ) -> int:
+        """Wait for a batch to finish rendering and write the results to the cache.
+
+        Args:
+            cache (TieredCache): The renderer's cache, or the HTML metadata cache if the renderer isn't cached.
+            slowest (list): A min-heap of the slowest render times, updated in place.
+            limit (int): The number of render times to keep in the heap.
+            labels (list): The post ID and title for each document.
+            future (Future): The future for the batch.
+
+        Returns:
+            int: The number of documents in the batch.
+        """
+        results = future.result()
+
+        for (pk, title), (_, _, seconds) in zip(labels, results, strict=True):
+            if len(slowest) < limit:
+                heapq.heappush(slowest, (seconds, pk, title))
+            elif slowest and seconds > slowest[0][0]:
+                heapq.heappushpop(slowest, (seconds, pk, title))
+
+        # The cache backend writes the batch in one statement to its own database, without locking the content
+        cache.set_many({key: value for key, value, _ in results})
+
+        return len(results)
@@ -0,0 +1,72 @@
+"""Helpers for rendering posts in worker processes."""
+
+import os
+import time
+
+import django
+from django.utils.module_loading import import_string
+
+from config.caching import content_key
+from config.markdown_renderer import collect_html_metadata
+
+
+def init_worker() -> None:
+    """Set up Django in a new worker process.
+
+    Worker processes that are spawned, rather than forked, start with a fresh interpreter.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+
+
+def render_batch(renderer_path: str, contents: list[str]) -> list[tuple[str, object, float]]:
+    """Render a batch of content with the uncached renderer.
+
+    If the renderer is cached with `config.caching.cached_renderer`, the uncached renderer is used so that the parent
+    process can write the results to the renderer's cache in bulk, exactly as the uncached renderer returned them, so
+    that any metadata is cached alongside the HTML. The worker processes still write to any caches the renderer uses
+    itself, such as the cache of highlighted code.
+
+    Args:
+        renderer_path (str): The dotted path to the content renderer.
+        contents (list[str]): The content to render.
+
+    Returns:
+        list[tuple[str, object, float]]: The cache key, the rendered content and the time taken in seconds, in the same
+            order as the contents.
+    """
+    renderer = import_string(renderer_path)
+    render = getattr(renderer, "__wrapped__", renderer)
+
+    results = []
+    for content in contents:
+        start = time.perf_counter()
+        rendered = render(content)
+        results.append((content_key(content), rendered, time.perf_counter() - start))
+
+    return results
+
+
+def collect_batch_metadata(renderer_path: str, contents: list[str]) -> list[tuple[str, object, float]]:
+    """Render a batch of content with a renderer that isn't cached, and collect the metadata from the HTML.
+
+    The metadata is what `config.markdown_renderer.get_html_metadata` caches for the HTML, keyed by a hash of the HTML.
+
+    Args:
+        renderer_path (str): The dotted path to the content renderer.
+        contents (list[str]): The content to render.
+
+    Returns:
+        list[tuple[str, object, float]]: The cache key, the metadata and the time taken in seconds, in the same order
+            as the contents.
+    """
+    render = import_string(renderer_path)
+
+    results = []
+    for content in contents:
+        start = time.perf_counter()
+        html = str(render(content))
+        metadata = collect_html_metadata(html)
+        results.append((content_key(html), metadata, time.perf_counter() - start))
+
+    return results
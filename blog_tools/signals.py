@@ -0,0 +1,19 @@
+"""Signal handlers for the blog_tools app."""
+
+from typing import Any
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from djpress.models import Category, Post
+
+from blog_tools.sitemaps import schedule_generation
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(m2m_changed, sender=Post.categories.through)
+def regenerate_sitemaps(**_: Any) -> None:  # noqa: ANN401
+    """Generate the sitemaps again when the content changes."""
+    schedule_generation()
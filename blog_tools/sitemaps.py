@@ -0,0 +1,137 @@
+"""Precomputed sitemaps.
+
+The sitemaps are generated ahead of time, when the content changes and with the `generate_sitemaps` management
+command, and stored gzipped in the cache. Each section gets its own paginated sitemap, listed in the sitemap index.
+
+A scheduled post is published when its publication date passes, without being saved, so the cached sitemaps expire
+when the next scheduled post is due and are generated again with it.
+"""
+
+import gzip
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.contrib.sitemaps.views import SitemapIndexItem
+from django.core.cache import cache
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.urls import reverse
+
+from config.sitemaps import SITEMAPS
+from page_cache.validators import get_seconds_until_next_post
+
+if TYPE_CHECKING:
+    from django.contrib.sitemaps import Sitemap
+
+SITEMAPS_CACHE_KEY = "sitemaps:files"
+# The sitemaps are generated again when the content changes, so this only limits how long they're kept otherwise
+SITEMAPS_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+INDEX = "index"
+
+
+@dataclass(frozen=True)
+class SitemapFile:
+    """A generated sitemap file.
+
+    Attributes:
+        content (bytes): The gzipped XML
+        lastmod (datetime | None): The latest modification time of the URLs in the file, if they all have one
+    """
+
+    content: bytes
+    lastmod: datetime | None
+
+    @property
+    def xml(self) -> bytes:
+        """The uncompressed XML."""
+        return gzip.decompress(self.content)
+
+
+def sitemap_name(section: str, page: int) -> str:
+    """Return the name of a sitemap file.
+
+    Args:
+        section (str): The sitemap section.
+        page (int): The page number.
+
+    Returns:
+        str: The name.
+    """
+    return f"{section}:{page}"
+
+
+def latest(dates: list[datetime | None]) -> datetime | None:
+    """Return the latest of the dates, or None if any of them are missing.
+
+    Args:
+        dates (list[datetime | None]): The dates, which may be dates rather than datetimes.
+
+    Returns:
+        datetime | None: The latest date.
+    """
+    if not dates or None in dates:
+        return None
+
+    return max(
+        date if isinstance(date, datetime) else datetime.combine(date, datetime.min.time(), tzinfo=UTC)
+        for date in dates
+    )
+
+
+def generate_sitemaps() -> dict[str, SitemapFile]:
+    """Generate every sitemap file and store them in the cache, until the next scheduled post is due.
+
+    Returns:
+        dict[str, SitemapFile]: The sitemap files, keyed by name.
+    """
+    site = SimpleNamespace(domain=settings.SITEMAP_DOMAIN)
+    files: dict[str, SitemapFile] = {}
+    index: list[SitemapIndexItem] = []
+
+    for section, sitemap_class in SITEMAPS.items():
+        sitemap: Sitemap = sitemap_class()
+        sitemap.limit = settings.SITEMAP_LIMIT
+        url = f"{sitemap.get_protocol()}://{site.domain}{reverse('sitemap-section', kwargs={'section': section})}"
+
+        for page in sitemap.paginator.page_range:
+            urls = sitemap.get_urls(page=page, site=site)
+            lastmod = latest([url_info.get("lastmod") for url_info in urls])
+            xml = render_to_string("sitemap.xml", {"urlset": urls})
+            files[sitemap_name(section, page)] = SitemapFile(gzip.compress(xml.encode(), mtime=0), lastmod)
+            index.append(SitemapIndexItem(url if page == 1 else f"{url}?p={page}", lastmod))
+
+    xml = render_to_string("sitemap_index.xml", {"sitemaps": index})
+    lastmod = latest([item.last_mod for item in index])
+    files[INDEX] = SitemapFile(gzip.compress(xml.encode(), mtime=0), lastmod)
+
+    cache.set(SITEMAPS_CACHE_KEY, files, timeout=get_seconds_until_next_post(SITEMAPS_CACHE_TIMEOUT))
+    return files
+
+
+def get_sitemaps() -> dict[str, SitemapFile]:
+    """Get the sitemap files from the cache, generating them if they aren't there.
+
+    Returns:
+        dict[str, SitemapFile]: The sitemap files, keyed by name.
+    """
+    files = cache.get(SITEMAPS_CACHE_KEY)
+    if files is None:
+        files = generate_sitemaps()
+
+    return files
+
+
+def schedule_generation() -> None:
+    """Generate the sitemaps once the current transaction commits.
+
+    However many changes are made in the transaction, the sitemaps are only generated once.
+    """
+    connection = transaction.get_connection()
+    if any(func is generate_sitemaps for _, func, _ in connection.run_on_commit):
+        return
+
+    transaction.on_commit(generate_sitemaps)
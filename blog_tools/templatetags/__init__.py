@@ -0,0 +1 @@
+"""Custom template tags for blog_tools app."""
@@ -0,0 +1,44 @@
+"""Custom template tags for blog_tools app."""
+
+from typing import TYPE_CHECKING
+
+from django import template
+from djpress.plugins import registry
+from djpress.plugins.hook_registry import PRE_RENDER_CONTENT
+from djpress.utils import get_content_renderer
+
+from config.markdown_renderer import get_html_metadata, get_markdown_metadata, mistune_renderer
+
+if TYPE_CHECKING:
+    from djpress.models import Post
+
+    from config.markdown_renderer import MarkdownMetadata
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def post_metadata(context: template.Context) -> MarkdownMetadata | None:
+    """Get the metadata for the post in the context: headings, word count, reading time and so on.
+
+    With the Markdown renderer, the metadata is collected when the post is rendered and cached with the rendered HTML,
+    so this doesn't render the post a second time. With any other content renderer, the metadata is collected from the
+    post's rendered HTML and cached by a hash of the HTML; only headings with an id are included. Use it as
+    `{% post_metadata as metadata %}`.
+
+    Args:
+        context: The template context
+
+    Returns:
+        MarkdownMetadata | None: The metadata, or None if there's no post.
+    """
+    post: Post | None = context.get("post")
+    if post is None:
+        return None
+
+    if get_content_renderer() is not mistune_renderer:
+        return get_html_metadata(post.rendered_content)
+
+    # Plugins can change the content before it is rendered, so do the same to find the cached render
+    content = registry.run_hook(PRE_RENDER_CONTENT, post.content)
+    return get_markdown_metadata(content)
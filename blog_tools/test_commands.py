@@ -0,0 +1,73 @@
+"""Tests for the blog_tools management commands."""
+
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from djpress.models import Post
+
+from config.caching import content_key
+from config.markdown_renderer import html_metadata_cache, render_cache, render_markdown
+
+
+@pytest.fixture
+def posts():
+    user = User.objects.create_user(username="testuser", password="testpass")
+    return [
+        Post.objects.create(
+            title=f"Post {i}",
+            slug=f"post-{i}",
+            content=f"# Post {i}\n\nIntro.\n\n<!--more-->\n\n```python\nprint({i})\n```",
+            author=user,
+            status="published",
+        )
+        for i in range(5)
+    ]
+
+
+@pytest.mark.django_db
+def test_rerender_posts_warms_cache(posts):
+    """Test that every post and its truncated content are rendered into the cache."""
+    render_cache.clear()
+    out = StringIO()
+
+    call_command(
+        "rerender_posts",
+        "--renderer=config.markdown_renderer.mistune_renderer",
+        "--batch-size=2",
+        "--workers=2",
+        stdout=out,
+    )
+
+    assert "Rendered 5 posts (10 documents)" in out.getvalue()
+    assert "posts/sec" in out.getvalue()
+    for post in posts:
+        assert str(render_cache.get(content_key(post.content))) == render_markdown(post.content)
+        truncated = post.content.split("<!--more-->")[0]
+        assert str(render_cache.get(content_key(truncated))) == render_markdown(truncated)
+
+
+@pytest.mark.django_db
+def test_rerender_posts_uncached_renderer(posts):
+    """Test that an uncached renderer warms the metadata cache for its HTML instead."""
+    html_metadata_cache.clear()
+    out = StringIO()
+
+    call_command("rerender_posts", "--renderer=djpress_tiptap.renderers.html_renderer", "--workers=1", stdout=out)
+
+    assert "Rendered 5 posts" in out.getvalue()
+    assert "only the HTML metadata cache was warmed" in out.getvalue()
+    assert html_metadata_cache.get(content_key(posts[0].content)).word_count > 0
+
+
+@pytest.mark.django_db
+def test_rerender_posts_reports_slowest(posts):
+    """Test that only the requested number of the slowest documents are reported, slowest first."""
+    out = StringIO()
+
+    call_command("rerender_posts", "--batch-size=2", "--workers=1", "--slowest=3", stdout=out)
+
+    times = [float(line.split()[0]) for line in out.getvalue().splitlines() if " ms  post " in line]
+    assert len(times) == 3
+    assert times == sorted(times, reverse=True)
@@ -0,0 +1,139 @@
+"""Tests for exporting the content."""
+
+import io
+import json
+import sys
+import tarfile
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from djpress.models import Category, Media, Post
+
+from blog_tools.export import export_content
+
+
+@pytest.fixture
+def content(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path / "media"
+    user = User.objects.create_user(username="testuser", password="testpass", first_name="Test", last_name="User")
+    category = Category.objects.create(title="Notes", slug="notes")
+    posts = [
+        Post.objects.create(
+            title=f"Post {i}",
+            slug=f"post-{i}",
+            content=f"# Post {i}\n\nText: {i}",
+            author=user,
+            status="published",
+            published_at=timezone.now() - timedelta(days=1),
+        )
+        for i in range(3)
+    ]
+    posts[0].categories.add(category)
+    parent = Post.objects.create(title="About", slug="about", content="About", author=user, post_type="page")
+    Post.objects.create(title="Me", slug="me", content="Me", author=user, post_type="page", parent=parent)
+    Media.objects.create(title="Logo", file=SimpleUploadedFile("logo.png", b"png"), uploaded_by=user)
+    return posts
+
+
+def archive_files(data):
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as archive:
+        return {member.name: archive.extractfile(member).read() for member in archive if member.isfile()}
+
+
+@pytest.mark.django_db
+def test_export_matches_djpress_export(content, tmp_path):
+    """Test the posts and pages are exported as `djpress_export` exports them."""
+    stream = io.BytesIO()
+    result = export_content(stream)
+    files = archive_files(stream.getvalue())
+
+    call_command("djpress_export", "--no-zip", "--output", tmp_path / "djpress", stdout=io.StringIO())
+    expected = {
+        path.relative_to(tmp_path / "djpress").as_posix(): path.read_bytes()
+        for path in (tmp_path / "djpress").rglob("*")
+        if path.is_file() and path.name != "metadata.json"
+    }
+
+    assert (result.posts, result.pages, result.media) == (3, 2, 1)
+    assert {name: data for name, data in files.items() if name in expected} == expected
+    assert len(expected) == 6
+    assert set(expected) <= set(files)
+    assert json.loads(files["static/metadata.json"])
+    assert json.loads(files["content/categories.json"])[0]["slug"] == "notes"
+    assert json.loads(files["manifest.json"])["posts"] == 3
+    assert result.written == len(stream.getvalue())
+
+
+@pytest.mark.django_db
+def test_export_queries_dont_grow_with_posts(content):
+    """Test the posts are fetched in bulk, rather than with queries for each post."""
+    with CaptureQueriesContext(connection) as queries:
+        export_content(io.BytesIO())
+
+    for i in range(3, 10):
+        post = Post.objects.create(title=f"Post {i}", slug=f"post-{i}", content="Text", author=content[0].author)
+        post.categories.add(*content[0].categories.all())
+
+    with CaptureQueriesContext(connection) as more_queries:
+        export_content(io.BytesIO())
+
+    assert len(more_queries) == len(queries)
+
+
+@pytest.mark.django_db
+def test_incremental_export_to_file(content, tmp_path):
+    """Test an incremental export only has what was modified since the export in the manifest."""
+    stdout = io.StringIO()
+    call_command("export_content", "--output", tmp_path / "full.tar.gz", stdout=stdout)
+
+    assert "Exported 3 posts, 2 pages and 1 media files" in stdout.getvalue()
+    assert "bytes/sec" in stdout.getvalue()
+    manifest = json.loads((tmp_path / "export-manifest.json").read_text())
+    assert manifest["output"] == str(tmp_path / "full.tar.gz")
+
+    content[1].content = "Edited"
+    content[1].save()
+    call_command("export_content", "--output", tmp_path / "since.tar.gz", "--incremental", stdout=stdout)
+
+    files = archive_files((tmp_path / "since.tar.gz").read_bytes())
+    assert [name for name in files if name.startswith("content/posts/")] == [
+        f"content/posts/{content[1]._date:%Y-%m-%d}-post-1.md",
+    ]
+    assert json.loads(files["manifest.json"])["since"] == manifest["created"]
+
+
+@pytest.mark.django_db
+def test_export_to_stdout(content, monkeypatch):
+    """Test the archive can be written to stdout, with the report on stderr."""
+    stdout = io.TextIOWrapper(io.BytesIO())
+    monkeypatch.setattr(sys, "stdout", stdout)
+    stderr = io.StringIO()
+
+    call_command("export_content", "--output", "-", "--no-media", stderr=stderr)
+
+    files = archive_files(stdout.buffer.getvalue())
+    assert "manifest.json" in files
+    assert not any(name.endswith(".png") for name in files)
+    assert "bytes/sec" in stderr.getvalue()
+
+
+@pytest.mark.django_db
+def test_export_skips_missing_media_files(content, caplog):
+    """Test a media file that can't be read is skipped and logged, and its metadata is still exported."""
+    media = Media.objects.get()
+    media.file.storage.delete(media.file.name)
+    output = io.BytesIO()
+
+    result = export_content(output)
+
+    files = archive_files(output.getvalue())
+    assert f"static/{media.file.name}" not in files
+    assert media.file.name in json.loads(files["static/metadata.json"])
+    assert result.media == 0
+    assert f"Skipped the media file {media.file.name}" in caplog.text
@@ -0,0 +1,142 @@
+"""Tests for the precomputed sitemaps."""
+
+import gzip
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from djpress.models import Category, Post
+
+from blog_tools.sitemaps import SITEMAPS_CACHE_KEY, SITEMAPS_CACHE_TIMEOUT, generate_sitemaps, get_sitemaps
+from config.sitemaps import StaticSitemap
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+@pytest.fixture
+def posts():
+    user = User.objects.create_user(username="testuser", password="testpass")
+    category = Category.objects.create(title="Django", slug="django")
+    posts = []
+    for i in range(5):
+        post = Post.objects.create(
+            title=f"Post {i}",
+            slug=f"post-{i}",
+            content=f"Post {i}.",
+            author=user,
+            status="published",
+        )
+        post.categories.set([category])
+        posts.append(post)
+    return posts
+
+
+@pytest.mark.django_db
+def test_sitemap_index_is_paginated(client, settings, posts):
+    """Test the index lists every page of every section."""
+    settings.SITEMAP_LIMIT = 2
+
+    response = client.get("/sitemap.xml")
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/xml"
+    content = response.content.decode()
+    assert "https://stuartm.nz/sitemap-posts.xml</loc>" in content
+    assert "https://stuartm.nz/sitemap-posts.xml?p=3</loc>" in content
+    assert "sitemap-posts.xml?p=4" not in content
+    assert "https://stuartm.nz/sitemap-static.xml</loc>" in content
+
+
+@pytest.mark.django_db
+def test_sitemap_section_pages(client, settings, posts):
+    """Test each page of a section lists its own URLs."""
+    settings.SITEMAP_LIMIT = 2
+
+    first = client.get("/sitemap-posts.xml").content.decode()
+    last = client.get("/sitemap-posts.xml?p=3").content.decode()
+
+    assert first.count("<url>") == 2
+    assert last.count("<url>") == 1
+    assert client.get("/sitemap-posts.xml?p=4").status_code == 404
+    assert client.get("/sitemap-missing.xml").status_code == 404
+
+
+@pytest.mark.django_db
+def test_sitemap_is_served_gzipped(client, posts):
+    """Test clients that accept gzip get the stored bytes."""
+    response = client.get("/sitemap-posts.xml", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response["Content-Encoding"] == "gzip"
+    assert b"post-4" in gzip.decompress(response.content)
+
+
+@pytest.mark.django_db
+def test_sitemaps_are_generated_once(client, posts, django_assert_num_queries):
+    """Test the sitemaps are served from the cache without any queries."""
+    client.get("/sitemap.xml")
+
+    with django_assert_num_queries(0):
+        assert client.get("/sitemap-categories.xml").status_code == 200
+
+
+@pytest.mark.django_db
+def test_sitemaps_are_regenerated_on_change(django_capture_on_commit_callbacks):
+    """Test changing the content regenerates the sitemaps once per transaction."""
+    user = User.objects.create_user(username="testuser", password="testpass")
+    get_sitemaps()
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        post = Post.objects.create(title="New Post", slug="new-post", content="New.", author=user, status="published")
+        post.categories.set([Category.objects.create(title="Django", slug="django")])
+
+    assert callbacks.count(generate_sitemaps) == 1
+    assert b"new-post" in cache.get(SITEMAPS_CACHE_KEY)["posts:1"].xml
+
+
+@pytest.mark.django_db
+def test_sitemaps_expire_when_the_next_post_is_due(monkeypatch, posts):
+    """Test the sitemaps are only cached until the next scheduled post is published."""
+    timeouts = []
+    cache_set = cache.set
+    monkeypatch.setattr(
+        cache, "set", lambda key, value, timeout: timeouts.append(timeout) or cache_set(key, value, timeout)
+    )
+
+    generate_sitemaps()
+    Post.objects.create(
+        title="Scheduled",
+        slug="scheduled",
+        content="Soon.",
+        author=posts[0].author,
+        status="published",
+        published_at=timezone.now() + timedelta(hours=1),
+    )
+    generate_sitemaps()
+
+    assert timeouts[0] == SITEMAPS_CACHE_TIMEOUT
+    assert 3590 < timeouts[1] <= 3600
+
+
+@pytest.mark.django_db
+def test_generate_sitemaps_command(posts):
+    """Test the command stores the sitemaps in the cache."""
+    out = StringIO()
+
+    call_command("generate_sitemaps", stdout=out)
+
+    assert "Generated 6 sitemap files" in out.getvalue()
+    assert cache.get(SITEMAPS_CACHE_KEY) is not None
+
+
+def test_static_sitemap_lastmod_is_template_mtime():
+    """Test the static pages are last modified when their templates were."""
+    sitemap = StaticSitemap()
+
+    assert all(sitemap.lastmod(item) is not None for item in sitemap.items())
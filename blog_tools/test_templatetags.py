@@ -0,0 +1,39 @@
+"""Tests for the blog_tools template tags."""
+
+import pytest
+from django.template import Context, Template
+
+from blog_tools.templatetags import blog_tools_tags
+from config.markdown_renderer import mistune_renderer
+
+
+class FakePost:
+    content = "## First\n\nSome words to read.\n\n## Second"
+    rendered_content = '<h2 id="first">First</h2><p>Some words to read.</p><h2>Second</h2>'
+
+
+TEMPLATE = Template(
+    "{% load blog_tools_tags %}{% post_metadata as metadata %}"
+    "{% for heading in metadata.headings %}{{ heading.slug }} {% endfor %}{{ metadata.reading_time }}",
+)
+
+
+@pytest.mark.django_db
+def test_post_metadata(monkeypatch):
+    """Test the tag returns the metadata when posts are rendered with the Markdown renderer."""
+    monkeypatch.setattr(blog_tools_tags, "get_content_renderer", lambda: mistune_renderer)
+
+    assert TEMPLATE.render(Context({"post": FakePost()})) == "first second 1"
+
+
+@pytest.mark.django_db
+def test_post_metadata_other_renderer(monkeypatch):
+    """Test the tag collects the metadata from the HTML when posts are rendered with a different renderer."""
+    monkeypatch.setattr(blog_tools_tags, "get_content_renderer", lambda: str)
+
+    assert TEMPLATE.render(Context({"post": FakePost()})) == "first 1"
+
+
+def test_post_metadata_without_post():
+    """Test the tag returns nothing when there's no post."""
+    assert TEMPLATE.render(Context({})) == ""
@@ -0,0 +1,58 @@
+"""Views for the blog_tools app."""
+
+from typing import TYPE_CHECKING
+
+from django.http import Http404, HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.http import require_safe
+
+from blog_tools.sitemaps import INDEX, get_sitemaps, sitemap_name
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+    from blog_tools.sitemaps import SitemapFile
+
+
+def sitemap_response(request: HttpRequest, sitemap: SitemapFile) -> HttpResponse:
+    """Return a precomputed sitemap, gzipped if the client accepts it.
+
+    Args:
+        request (HttpRequest): The request.
+        sitemap (SitemapFile): The sitemap file.
+
+    Returns:
+        HttpResponse: The response.
+    """
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        response = HttpResponse(sitemap.content, content_type="application/xml")
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(sitemap.xml, content_type="application/xml")
+
+    patch_vary_headers(response, ["Accept-Encoding"])
+    response.headers["X-Robots-Tag"] = "noindex, noodp, noarchive"
+
+    return response
+
+
+@require_safe
+def sitemap_index(request: HttpRequest) -> HttpResponse:
+    """View for the sitemap index."""
+    return sitemap_response(request, get_sitemaps()[INDEX])
+
+
+@require_safe
+def sitemap_section(request: HttpRequest, section: str) -> HttpResponse:
+    """View for a page of the sitemap for one section.
+
+    Raises:
+        Http404: If the section or page doesn't exist.
+    """
+    page = request.GET.get("p", "1")
+    sitemap = get_sitemaps().get(sitemap_name(section, int(page))) if page.isdigit() else None
+    if sitemap is None:
+        msg = f"No sitemap available for section {section!r}, page {page!r}"
+        raise Http404(msg)
+
+    return sitemap_response(request, sitemap)
@@ -1,46 +1,87 @@
-document.addEventListener('DOMContentLoaded', async function () {
-  // Dynamically import markdown-it
-  const { default: MarkdownIt } = await import('markdown-it');
-
-  // Import the core of highlight.js
-  const { default: hljs } = await import('highlight.js/lib/core');
-
-  // Register only the necessary languages
-  const { default: html } = await import('highlight.js/lib/languages/xml');
-  const { default: javascript } = await import('highlight.js/lib/languages/javascript');
-  const { default: bash } = await import('highlight.js/lib/languages/bash');
-  const { default: python } = await import('highlight.js/lib/languages/python');
-  const { default: css } = await import('highlight.js/lib/languages/css');
-
-  hljs.registerLanguage('html', html);  // Note: XML is used for HTML
-  hljs.registerLanguage('javascript', javascript);
-  hljs.registerLanguage('bash', bash);
-  hljs.registerLanguage('python', python);
-  hljs.registerLanguage('css', css);
-
+document.addEventListener('DOMContentLoaded', function () {
   const editor = document.getElementById('editor');
   const preview = document.getElementById('preview');
 
-  const md = new MarkdownIt({
-    html: true,
-    highlight: function (str, lang) {
-      if (lang && hljs.getLanguage(lang)) {
-        try {
-          return hljs.highlight(str, { language: lang }).value;
-        } catch (__) { }
+  // The preview is rendered on the server, by the renderer used for posts. Each block of the document is rendered on
+  // its own, and the server leaves out the HTML of the blocks we already have, so only the edited blocks are rendered,
+  // sent and patched into the page.
+  const previewUrl = preview.dataset.previewUrl;
+  const csrfToken = preview.dataset.csrfToken;
+
+  // The rendered HTML of each block, by the hash of its markdown
+  let renderedBlocks = new Map();
+  // The hash and element of each block shown in the preview, in document order
+  let shownBlocks = [];
+  let pendingRequest = null;
+  let updateTimer = null;
+
+  function blockElement(html) {
+    const element = document.createElement('div');
+    // The wrapper doesn't change the layout of the rendered HTML
+    element.style.display = 'contents';
+    element.innerHTML = html;
+    return element;
+  }
+
+  function patchPreview(blocks) {
+    // The elements of the blocks that are already shown, which are moved rather than rendered again
+    const elements = new Map();
+    for (const block of shownBlocks) {
+      if (!elements.has(block.hash)) {
+        elements.set(block.hash, []);
       }
+      elements.get(block.hash).push(block.element);
+    }
+
+    const nextRenderedBlocks = new Map();
+    shownBlocks = blocks.map((block) => {
+      const html = block.html ?? renderedBlocks.get(block.hash) ?? '';
+      nextRenderedBlocks.set(block.hash, html);
+      const element = elements.get(block.hash)?.shift() ?? blockElement(html);
+      return { hash: block.hash, element: element };
+    });
+    renderedBlocks = nextRenderedBlocks;
+
+    preview.replaceChildren(...shownBlocks.map((block) => block.element));
+  }
 
-      return ''; // use external default escaping
+  async function updatePreview() {
+    clearTimeout(updateTimer);
+
+    // A newer edit replaces a preview that hasn't arrived yet
+    pendingRequest?.abort();
+    pendingRequest = new AbortController();
+
+    try {
+      const response = await fetch(previewUrl, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json', 'X-CSRFToken': csrfToken },
+        body: JSON.stringify({ markdown: editor.value, known: [...renderedBlocks.keys()] }),
+        signal: pendingRequest.signal,
+      });
+      if (!response.ok) {
+        throw new Error(`Preview failed: ${response.status}`);
+      }
+      const data = await response.json();
+      patchPreview(data.blocks);
+    } catch (err) {
+      if (err.name !== 'AbortError') {
+        console.error('Failed to update the preview: ', err);
+      }
     }
-  });
+  }
+
+  function schedulePreview() {
+    // Typing only sends a preview request once there's a short pause
+    clearTimeout(updateTimer);
+    updateTimer = setTimeout(updatePreview, 150);
+  }
 
-  function updatePreview() {
-    const markdownText = editor.value;
-    const html = md.render(markdownText);
-    preview.innerHTML = html;
+  function previewHtml() {
+    return shownBlocks.map((block) => renderedBlocks.get(block.hash)).join('\n');
   }
 
-  editor.addEventListener('input', updatePreview);
+  editor.addEventListener('input', schedulePreview);
   updatePreview();
 
   // Toolbar Functions
@@ -160,7 +201,7 @@ document.addEventListener('DOMContentLoaded', async function () {
   });
 
   document.getElementById('copyhtml-button').addEventListener('click', function () {
-    navigator.clipboard.writeText(preview.innerHTML)
+    navigator.clipboard.writeText(previewHtml())
       .catch(err => console.error('Failed to copy text: ', err));
   });
 
@@ -8,8 +8,22 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
+from config.startup import log_phases, phase
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
-application = get_asgi_application()
+with phase("django.setup"):
+    django_application = get_asgi_application()
+
+# Django has to be set up before these are imported
+from deploy_tools.asgi import LifespanApplication
+from deploy_tools.warmup import warm_up
+
+if settings.STARTUP_PROFILE:
+    log_phases()
+
+# Each worker warms up before it accepts any connections
+application = LifespanApplication(django_application, on_startup=warm_up)
@@ -0,0 +1,396 @@
+"""Two-tier Django cache backend: an in-process LRU cache in front of a dedicated SQLite database.
+
+The front tier is a bounded LRU cache in each process, so most reads never leave the process. The back tier is a
+SQLite database in its own file, shared by every worker process, so cache writes never compete with content writes for
+the main database's write lock.
+
+Example:
+    CACHES = {
+        "default": {
+            "BACKEND": "config.cache_backend.TieredSQLiteCache",
+            "LOCATION": BASE_DIR / "db" / "cache.sqlite3",
+            "OPTIONS": {
+                "MAX_ENTRIES": 50000,
+                "MEMORY_MAX_ENTRIES": 2000,
+                "MEMORY_TIMEOUT": 10,
+                "CULL_INTERVAL": 300,
+            },
+        },
+    }
+
+Options:
+    MAX_ENTRIES: The maximum number of values in the SQLite tier, enforced when the tier is culled.
+    CULL_FREQUENCY: When the SQLite tier is over MAX_ENTRIES, 1/CULL_FREQUENCY of the values are removed.
+    MEMORY_MAX_ENTRIES: The maximum number of values in each process's in-memory tier.
+    MEMORY_TIMEOUT: The maximum number of seconds a value is kept in the in-memory tier. Values deleted or changed by
+        another process can be served from the in-memory tier for up to this long.
+    CULL_INTERVAL: The number of seconds between culls of the SQLite tier, which run in a background thread.
+"""
+
+import pickle
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from itertools import batched
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+from config.caching import LRUCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# SQLite limits the number of parameters in a statement, so batched lookups are split into chunks of this size.
+SQLITE_BATCH_SIZE = 500
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires)",
+)
+
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 5000",
+)
+
+STAT_NAMES = ("memory_hits", "sqlite_hits", "misses", "sets", "deletes")
+
+
+class TieredSQLiteCache(BaseCache):
+    """A Django cache backend with an in-process LRU tier and a SQLite tier.
+
+    Each thread has its own connection to the SQLite database, which stays open for the life of the thread. Expired
+    values are ignored when they are read, and removed by a background thread every CULL_INTERVAL seconds so that
+    culling never happens on the request path.
+    """
+
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, location: str | Path, params: dict[str, Any]) -> None:
+        """Initialize the cache.
+
+        Args:
+            location (str | Path): The path to the SQLite database file.
+            params (dict[str, Any]): The cache settings.
+        """
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.path = Path(location)
+        self.memory_timeout = float(options.get("MEMORY_TIMEOUT", 10))
+        self.cull_interval = float(options.get("CULL_INTERVAL", 300))
+        self.memory = LRUCache(int(options.get("MEMORY_MAX_ENTRIES", 1000)))
+
+        self._local = threading.local()
+        self._stats: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self._stats_lock = threading.Lock()
+        self._culler: threading.Thread | None = None
+        self._culler_lock = threading.Lock()
+
+    # SQLite tier
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection to the SQLite database, creating the database if needed."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit mode: writes that need a transaction open one explicitly
+            connection = sqlite3.connect(self.path, isolation_level=None, timeout=5)
+            for statement in (*PRAGMAS, *SCHEMA):
+                connection.execute(statement)
+            self._local.connection = connection
+            self._start_culler()
+
+        return connection
+
+    def create_database(self) -> None:
+        """Create the SQLite database and its table, if they don't already exist."""
+        self._connection()
+
+    def _select(self, keys: Iterable[str]) -> dict[str, tuple[bytes, float | None]]:
+        """Read values that haven't expired from the SQLite tier, in batches.
+
+        Args:
+            keys (Iterable[str]): The cache keys.
+
+        Returns:
+            dict[str, tuple[bytes, float | None]]: The pickled value and expiry time for each key that was found.
+        """
+        connection = self._connection()
+        now = time.time()
+        rows = {}
+        for batch in batched(keys, SQLITE_BATCH_SIZE, strict=False):
+            placeholders = ", ".join("?" * len(batch))
+            cursor = connection.execute(
+                f"SELECT key, value, expires FROM cache WHERE key IN ({placeholders}) "  # noqa: S608
+                "AND (expires IS NULL OR expires > ?)",
+                (*batch, now),
+            )
+            rows.update((key, (value, expires)) for key, value, expires in cursor)
+
+        return rows
+
+    def _upsert(self, rows: list[tuple[str, bytes, float | None]]) -> None:
+        """Write values to the SQLite tier in a single transaction.
+
+        Args:
+            rows (list[tuple[str, bytes, float | None]]): The cache key, pickled value and expiry time for each value.
+        """
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                "INSERT INTO cache (key, value, expires) VALUES (?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value, expires = excluded.expires",
+                rows,
+            )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _delete_rows(self, keys: list[str]) -> int:
+        """Delete values from the SQLite tier.
+
+        Args:
+            keys (list[str]): The cache keys.
+
+        Returns:
+            int: The number of values that were deleted.
+        """
+        connection = self._connection()
+        deleted = 0
+        for batch in batched(keys, SQLITE_BATCH_SIZE, strict=False):
+            placeholders = ", ".join("?" * len(batch))
+            deleted += connection.execute(f"DELETE FROM cache WHERE key IN ({placeholders})", batch).rowcount  # noqa: S608
+
+        return deleted
+
+    def cull(self) -> int:
+        """Remove expired values from the SQLite tier, and the values that expire soonest if it has too many values.
+
+        This runs in a background thread every CULL_INTERVAL seconds, but can also be called directly.
+
+        Returns:
+            int: The number of values removed.
+        """
+        connection = self._connection()
+        removed = connection.execute("DELETE FROM cache WHERE expires <= ?", (time.time(),)).rowcount
+
+        (count,) = connection.execute("SELECT COUNT(*) FROM cache").fetchone()
+        if count > self._max_entries:
+            excess = count - self._max_entries
+            # Remove at least the excess, and otherwise a fraction of the values, like Django's other backends
+            limit = max(excess, count // self._cull_frequency) if self._cull_frequency else count
+            removed += connection.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY expires IS NULL, expires LIMIT ?)",
+                (limit,),
+            ).rowcount
+
+        return removed
+
+    def _start_culler(self) -> None:
+        """Start the background thread that culls the SQLite tier, if it isn't already running."""
+        if not self.cull_interval:
+            return
+
+        with self._culler_lock:
+            if self._culler is None or not self._culler.is_alive():
+                self._culler = threading.Thread(target=self._cull_forever, name="cache-culler", daemon=True)
+                self._culler.start()
+
+    def _cull_forever(self) -> None:
+        """Cull the SQLite tier every CULL_INTERVAL seconds."""
+        while True:
+            time.sleep(self.cull_interval)
+            try:
+                self.cull()
+            except sqlite3.Error:
+                # The database was busy; try again next time
+                continue
+
+    # In-memory tier
+
+    def _remember(self, key: str, pickled: bytes, expires: float | None) -> None:
+        """Add a value to the in-memory tier, for no longer than MEMORY_TIMEOUT.
+
+        Args:
+            key (str): The cache key.
+            pickled (bytes): The pickled value.
+            expires (float | None): The time the value expires, or None if it never expires.
+        """
+        timeout = self.memory_timeout if expires is None else min(self.memory_timeout, expires - time.time())
+        self.memory.set(key, pickled, timeout)
+
+    # Stats
+
+    def _count(self, key: str, stat: str, amount: int = 1) -> None:
+        """Add to one of the counters for the key's prefix.
+
+        Args:
+            key (str): The key, as passed to the cache.
+            stat (str): The name of the counter.
+            amount (int): The amount to add.
+        """
+        prefix = key.split(":", 1)[0] if ":" in key else ""
+        with self._stats_lock:
+            self._stats[prefix][stat] += amount
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return the counters for this process, grouped by key prefix.
+
+        The prefix is the part of the key before the first colon, or an empty string for keys without a colon.
+
+        Returns:
+            dict[str, dict[str, int]]: The memory hits, SQLite hits, misses, sets and deletes for each prefix.
+        """
+        with self._stats_lock:
+            return {prefix: {stat: self._stats[prefix][stat] for stat in STAT_NAMES} for prefix in sorted(self._stats)}
+
+    # Django cache API
+
+    def get(self, key: str, default: Any = None, version: int | None = None) -> Any:  # noqa: ANN401
+        """Get a value from the cache."""
+        return self.get_many([key], version=version).get(key, default)
+
+    def get_many(self, keys: Iterable[str], version: int | None = None) -> dict[str, Any]:
+        """Get several values from the cache, using a single query for the values not in the in-memory tier."""
+        key_map = {self.make_and_validate_key(key, version=version): key for key in keys}
+
+        found: dict[str, bytes] = {}
+        missing = []
+        for cache_key, key in key_map.items():
+            pickled = self.memory.get(cache_key)
+            if pickled is None:
+                missing.append(cache_key)
+            else:
+                found[key] = pickled
+                self._count(key, "memory_hits")
+
+        if missing:
+            rows = self._select(missing)
+            for cache_key in missing:
+                key = key_map[cache_key]
+                if cache_key in rows:
+                    pickled, expires = rows[cache_key]
+                    self._remember(cache_key, pickled, expires)
+                    found[key] = pickled
+                    self._count(key, "sqlite_hits")
+                else:
+                    self._count(key, "misses")
+
+        return {key: pickle.loads(pickled) for key, pickled in found.items()}  # noqa: S301
+
+    def set(self, key: str, value: Any, timeout: float | None = DEFAULT_TIMEOUT, version: int | None = None) -> None:  # noqa: ANN401
+        """Add a value to the cache."""
+        self.set_many({key: value}, timeout=timeout, version=version)
+
+    def set_many(
+        self,
+        data: dict[str, Any],
+        timeout: float | None = DEFAULT_TIMEOUT,
+        version: int | None = None,
+    ) -> list[str]:
+        """Add several values to the cache, in a single transaction.
+
+        Returns:
+            list[str]: The keys that couldn't be added, which is always empty.
+        """
+        expires = self.get_backend_timeout(timeout)
+        rows = []
+        for key, value in data.items():
+            cache_key = self.make_and_validate_key(key, version=version)
+            pickled = pickle.dumps(value, self.pickle_protocol)
+            rows.append((cache_key, pickled, expires))
+            self._remember(cache_key, pickled, expires)
+            self._count(key, "sets")
+
+        if rows:
+            self._upsert(rows)
+
+        return []
+
+    def add(self, key: str, value: Any, timeout: float | None = DEFAULT_TIMEOUT, version: int | None = None) -> bool:  # noqa: ANN401
+        """Add a value to the cache if the key doesn't already have a value.
+
+        Returns:
+            bool: True if the value was added.
+        """
+        cache_key = self.make_and_validate_key(key, version=version)
+        expires = self.get_backend_timeout(timeout)
+        pickled = pickle.dumps(value, self.pickle_protocol)
+
+        # Insert the value, or replace a value that has expired
+        added = (
+            self._connection()
+            .execute(
+                "INSERT INTO cache (key, value, expires) VALUES (?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value, expires = excluded.expires "
+                "WHERE cache.expires <= ?",
+                (cache_key, pickled, expires, time.time()),
+            )
+            .rowcount
+            == 1
+        )
+        if added:
+            self._remember(cache_key, pickled, expires)
+            self._count(key, "sets")
+
+        return added
+
+    def touch(self, key: str, timeout: float | None = DEFAULT_TIMEOUT, version: int | None = None) -> bool:
+        """Update the timeout for a value.
+
+        Returns:
+            bool: True if the key has a value.
+        """
+        cache_key = self.make_and_validate_key(key, version=version)
+        self.memory.delete(cache_key)
+        return (
+            self._connection()
+            .execute(
+                "UPDATE cache SET expires = ? WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (self.get_backend_timeout(timeout), cache_key, time.time()),
+            )
+            .rowcount
+            == 1
+        )
+
+    def delete(self, key: str, version: int | None = None) -> bool:
+        """Delete a value from the cache.
+
+        Returns:
+            bool: True if the key had a value.
+        """
+        cache_key = self.make_and_validate_key(key, version=version)
+        self.memory.delete(cache_key)
+        self._count(key, "deletes")
+        return self._delete_rows([cache_key]) > 0
+
+    def delete_many(self, keys: Iterable[str], version: int | None = None) -> None:
+        """Delete several values from the cache."""
+        cache_keys = []
+        for key in keys:
+            cache_key = self.make_and_validate_key(key, version=version)
+            self.memory.delete(cache_key)
+            self._count(key, "deletes")
+            cache_keys.append(cache_key)
+
+        if cache_keys:
+            self._delete_rows(cache_keys)
+
+    def has_key(self, key: str, version: int | None = None) -> bool:
+        """Return True if the key has a value."""
+        cache_key = self.make_and_validate_key(key, version=version)
+        return self.memory.get(cache_key) is not None or cache_key in self._select([cache_key])
+
+    def clear(self) -> None:
+        """Delete every value from the cache.
+
+        The in-memory tiers of other processes aren't cleared, so they can serve old values for up to MEMORY_TIMEOUT.
+        """
+        self.memory.clear()
+        self._connection().execute("DELETE FROM cache")
@@ -0,0 +1,306 @@
+"""In-process caching helpers."""
+
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.core.cache import caches
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.core.cache.backends.base import BaseCache
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """A snapshot of the counters for a cache.
+
+    Attributes:
+        hits (int): Number of lookups that found a value
+        misses (int): Number of lookups that did not find a value
+        evictions (int): Number of values removed to make room for new ones
+        size (int): Number of values currently in the cache
+        maxsize (int): Maximum number of values the cache will hold
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the stats as a dictionary."""
+        return asdict(self)
+
+
+class LRUCache:
+    """A thread-safe, size-bounded, least recently used cache.
+
+    When the cache is full, adding a new value evicts the value that was used least recently. Values can also be given
+    a timeout, after which they are treated as missing.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize (int): The maximum number of values to hold.
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict[Any, tuple[Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the cache."""
+        return len(self._data)
+
+    def get(self, key: Any, default: Any = None) -> Any:  # noqa: ANN401
+        """Get a value from the cache.
+
+        Args:
+            key (Any): The key to look up.
+            default (Any): The value to return if the key is not in the cache.
+
+        Returns:
+            Any: The cached value, or the default.
+        """
+        with self._lock:
+            value, expires = self._data.get(key, (_MISSING, None))
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                value = _MISSING
+
+            if value is _MISSING:
+                self._misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Any, value: Any, timeout: float | None = None) -> None:  # noqa: ANN401
+        """Add a value to the cache, evicting the least recently used value if the cache is full.
+
+        Args:
+            key (Any): The key.
+            value (Any): The value.
+            timeout (float | None): The number of seconds before the value expires, or None to never expire.
+        """
+        expires = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: Any) -> bool:  # noqa: ANN401
+        """Remove a value from the cache.
+
+        Args:
+            key (Any): The key.
+
+        Returns:
+            bool: True if the key was in the cache.
+        """
+        with self._lock:
+            return self._data.pop(key, _MISSING) is not _MISSING
+
+    def clear(self) -> None:
+        """Remove all values from the cache and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._data),
+                maxsize=self.maxsize,
+            )
+
+
+class TieredCache:
+    """An in-process LRU cache in front of a persistent Django cache.
+
+    Values are looked up in the in-process tier first and then in the persistent tier, which is shared by all worker
+    processes and survives worker restarts. Values found in the persistent tier are copied into the in-process tier.
+
+    The persistent tier is only used once Django's settings are configured, so the cache can also be used from
+    scripts that don't set up Django.
+    """
+
+    def __init__(self, prefix: str, maxsize: int, alias: str = "default", timeout: int | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            prefix (str): The prefix for keys in the persistent tier.
+            maxsize (int): The maximum number of values in the in-process tier.
+            alias (str): The Django cache to use for the persistent tier.
+            timeout (int | None): The timeout for values in the persistent tier, or None to never expire.
+        """
+        self.prefix = prefix
+        self.alias = alias
+        self.timeout = timeout
+        self.memory = LRUCache(maxsize)
+        self._lock = threading.Lock()
+        self._persistent_hits = 0
+        self._persistent_misses = 0
+
+    def _persistent_cache(self) -> BaseCache | None:
+        """Return the persistent tier, or None if Django isn't configured."""
+        if not settings.configured:
+            return None
+        return caches[self.alias]
+
+    def _persistent_key(self, key: str) -> str:
+        """Return the key used in the persistent tier."""
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Any:  # noqa: ANN401
+        """Get a value from the cache.
+
+        Args:
+            key (str): The key to look up.
+
+        Returns:
+            Any: The cached value, or None if it isn't cached.
+        """
+        value = self.memory.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        persistent = self._persistent_cache()
+        if persistent is None:
+            return None
+
+        value = persistent.get(self._persistent_key(key), _MISSING)
+        with self._lock:
+            if value is _MISSING:
+                self._persistent_misses += 1
+                return None
+            self._persistent_hits += 1
+
+        self.memory.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Add a value to both tiers of the cache.
+
+        Args:
+            key (str): The key.
+            value (Any): The value.
+        """
+        self.memory.set(key, value)
+
+        persistent = self._persistent_cache()
+        if persistent is not None:
+            persistent.set(self._persistent_key(key), value, self.timeout)
+
+    def set_many(self, mapping: dict[str, Any]) -> None:
+        """Add several values to both tiers of the cache, using a single call to the persistent tier.
+
+        Args:
+            mapping (dict[str, Any]): The keys and values.
+        """
+        for key, value in mapping.items():
+            self.memory.set(key, value)
+
+        persistent = self._persistent_cache()
+        if persistent is not None:
+            persistent.set_many(
+                {self._persistent_key(key): value for key, value in mapping.items()},
+                self.timeout,
+            )
+
+    def get_or_set(self, key: str, default: Callable[[], Any]) -> Any:  # noqa: ANN401
+        """Get a value from the cache, calculating and caching it if it isn't cached.
+
+        Args:
+            key (str): The key to look up.
+            default (Callable[[], Any]): Called to calculate the value if it isn't cached.
+
+        Returns:
+            Any: The cached or calculated value.
+        """
+        value = self.get(key)
+        if value is None:
+            value = default()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Clear the in-process tier and reset the counters.
+
+        The persistent tier is left alone: it is shared with the other worker processes.
+        """
+        self.memory.clear()
+        with self._lock:
+            self._persistent_hits = self._persistent_misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the cache counters.
+
+        Returns:
+            dict[str, int]: The in-process counters, plus the hits and misses for the persistent tier.
+        """
+        stats = self.memory.stats().as_dict()
+        with self._lock:
+            stats["persistent_hits"] = self._persistent_hits
+            stats["persistent_misses"] = self._persistent_misses
+        return stats
+
+
+def content_key(content: str) -> str:
+    """Return the cache key for a piece of content.
+
+    Args:
+        content (str): The content.
+
+    Returns:
+        str: The SHA-256 hash of the content.
+    """
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def cached_renderer(cache: TieredCache) -> Callable[[Callable[[str], object]], Callable[[str], str]]:
+    """Decorator to cache the output of a content renderer, keyed by a hash of the content.
+
+    Like `functools.lru_cache`, the uncached renderer is available as `__wrapped__`. The cache is available as
+    `cache`, so that tools such as the `rerender_posts` management command can fill it in bulk.
+
+    The renderer may return any object whose string value is the rendered HTML, so that other data worked out during
+    the render can be cached alongside the HTML. The cached renderer always returns the string value.
+
+    Args:
+        cache (TieredCache): The cache to use.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(renderer: Callable[[str], object]) -> Callable[[str], str]:
+        @functools.wraps(renderer)
+        def wrapper(content: str) -> str:
+            return str(cache.get_or_set(content_key(content), lambda: renderer(content)))
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
@@ -0,0 +1,107 @@
+"""Routing the reads of public pages to a read-only connection to the SQLite database.
+
+In WAL mode, readers never wait for the writer, but a connection that has started a write transaction holds the write
+lock, and Django's connections for public pages would otherwise queue behind admin saves for up to `busy_timeout`. The
+`reader` database alias opens the same SQLite file read-only, with `PRAGMA query_only`. `ReadOnlyRequestMiddleware`
+marks GET and HEAD requests to the public views, and `ReadWriteRouter` sends the reads made while handling them to the
+reader. Every write, and every other request, uses the `default` alias and its `IMMEDIATE` transactions.
+
+Example:
+    DATABASES["reader"] = {
+        **DATABASES["default"],
+        "NAME": f"{DB_NAME.as_uri()}?mode=ro",
+        "OPTIONS": {"init_command": "PRAGMA query_only = ON;"},
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_ROUTERS = ["config.db_router.ReadWriteRouter"]
+"""
+
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.urls import Resolver404, resolve
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.db.models import Model
+    from django.http import HttpRequest, HttpResponse
+
+READER_ALIAS = "reader"
+
+# The URL namespaces, and the URL names outside a namespace, of the views whose reads use the reader
+READ_ONLY_NAMESPACES = frozenset({"djpress", "spf_generator", "healthcheck_app"})
+READ_ONLY_URL_NAMES = frozenset({"sitemap", "sitemap-section"})
+
+# Whether the current request only reads from the database, apart from writes that are routed to the writer
+read_only_request: ContextVar[bool] = ContextVar("read_only_request", default=False)
+
+
+def is_read_only_request(request: HttpRequest) -> bool:
+    """Return True if the request is a GET or HEAD request to one of the public views.
+
+    Args:
+        request (HttpRequest): The request.
+
+    Returns:
+        bool: Whether the request's reads can use the reader.
+    """
+    if request.method not in {"GET", "HEAD"}:
+        return False
+
+    try:
+        match = resolve(request.path_info)
+    except Resolver404:
+        return False
+
+    return bool(READ_ONLY_NAMESPACES.intersection(match.namespaces)) or match.url_name in READ_ONLY_URL_NAMES
+
+
+class ReadOnlyRequestMiddleware:
+    """Mark the requests whose reads use the reader, for `ReadWriteRouter`."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Initialize the middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Handle the request with reads routed to the reader, if it's a read-only request."""
+        token = read_only_request.set(is_read_only_request(request))
+        try:
+            return self.get_response(request)
+        finally:
+            read_only_request.reset(token)
+
+
+class ReadWriteRouter:
+    """Route the reads of read-only requests to the reader, and everything else to the writer."""
+
+    def db_for_read(self, model: type[Model], **hints: Any) -> str | None:  # noqa: ANN401, ARG002
+        """Return the reader for reads in a read-only request.
+
+        Reads inside a transaction on the writer stay on the writer, so they see the transaction's writes.
+        """
+        if not read_only_request.get() or READER_ALIAS not in settings.DATABASES:
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        return READER_ALIAS
+
+    def db_for_write(self, model: type[Model], **hints: Any) -> str:  # noqa: ANN401, ARG002
+        """Return the writer, as the reader can't write."""
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> bool | None:  # noqa: ANN401, ARG002
+        """Allow relations between objects read from either alias, as they're the same database."""
+        databases = {DEFAULT_DB_ALIAS, READER_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:  # noqa: SLF001
+            return True
+        return None
+
+    def allow_migrate(self, db: str, app_label: str, model_name: str | None = None, **hints: Any) -> bool | None:  # noqa: ANN401, ARG002
+        """Only migrate the writer, as the reader is the same database."""
+        if db == READER_ALIAS:
+            return False
+        return None
@@ -1,45 +1,363 @@
 """Default Markdown Renderer."""
 
+import hashlib
+import math
+import queue
+import threading
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field, replace
+from functools import cache
+from html import unescape
+from html.parser import HTMLParser
+from importlib.metadata import version
 from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import mistune
+from django.utils.text import slugify
 from mistune.util import escape as escape_text
 from mistune.util import safe_entity, striptags
 
-# Check if Pygments is available
+from config.caching import TieredCache, cached_renderer, content_key
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from pygments.formatters.html import HtmlFormatter
+    from pygments.lexer import Lexer
+
+# Check if Pygments is available. It's only imported when the first code block is highlighted.
 PYGMENTS_AVAILABLE = find_spec("pygments") is not None
 
-if PYGMENTS_AVAILABLE:
-    # Ignore Pylance for missing imports
-    from pygments import highlight, lexers
-    from pygments.formatters import html
-    from pygments.util import ClassNotFound
+# The Mistune plugins used by the Markdown pipeline.
+MARKDOWN_PLUGINS = (
+    "strikethrough",
+    "table",
+    "footnotes",
+)
+
+# Maximum number of idle Markdown pipelines kept around for re-use.
+MARKDOWN_POOL_SIZE = 8
+
+# Rendered HTML cache: the number of documents kept in each process, and the Django cache used as the persistent tier.
+MARKDOWN_CACHE_SIZE = 512
+MARKDOWN_CACHE_ALIAS = "default"
+MARKDOWN_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+
+# Highlighted code cache: the number of code blocks kept in each process. The persistent tier and timeout are the same
+# as the rendered HTML cache.
+HIGHLIGHT_CACHE_SIZE = 2048
+
+# Metadata collected from HTML rendered by other content renderers: the number of documents kept in each process.
+HTML_METADATA_CACHE_SIZE = 512
+
+# Average reading speed, in words per minute, used to estimate the reading time.
+WORDS_PER_MINUTE = 230
+
+# Options for the Pygments HTML formatter.
+FORMATTER_OPTIONS: dict[str, str | bool | int] = {}
+
+# The languages used in posts, which are loaded into the lexer registry when the first pipeline is created.
+PRELOAD_LANGUAGES = (
+    "bash",
+    "console",
+    "css",
+    "diff",
+    "django",
+    "dockerfile",
+    "html",
+    "ini",
+    "javascript",
+    "json",
+    "python",
+    "pycon",
+    "shell",
+    "sql",
+    "text",
+    "toml",
+    "yaml",
+)
+
+
+def get_renderer_fingerprint() -> str:
+    """Return a fingerprint of the renderer configuration.
+
+    The fingerprint changes whenever the output of the renderer could change: a new version of Mistune or Pygments, a
+    change to the list of plugins, or any change to this module.
+
+    Returns:
+        str: The fingerprint.
+    """
+    parts = [
+        mistune.__version__,
+        version("pygments") if PYGMENTS_AVAILABLE else "",
+        ",".join(MARKDOWN_PLUGINS),
+        hashlib.sha256(Path(__file__).read_bytes()).hexdigest(),
+    ]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
+
+
+RENDERER_FINGERPRINT = get_renderer_fingerprint()
+
+highlight_cache = TieredCache(
+    prefix=f"pygments:{RENDERER_FINGERPRINT}",
+    maxsize=HIGHLIGHT_CACHE_SIZE,
+    alias=MARKDOWN_CACHE_ALIAS,
+    timeout=MARKDOWN_CACHE_TIMEOUT,
+)
+
+# Process-wide lexer registry, keyed by the lower-case language name. Languages that Pygments doesn't know are
+# registered with the text lexer so that we only look them up once.
+_lexer_registry: dict[str, Lexer] = {}
+_lexer_registry_lock = threading.Lock()
+
+
+@cache
+def get_formatter() -> HtmlFormatter:
+    """Get the Pygments HTML formatter, which is shared by every pipeline.
+
+    Returns:
+        HtmlFormatter: The formatter.
+    """
+    from pygments.formatters.html import HtmlFormatter  # noqa: PLC0415
+
+    return HtmlFormatter(**FORMATTER_OPTIONS)
+
+
+def get_lexer(lang: str) -> Lexer:
+    """Get the Pygments lexer for a language from the lexer registry.
+
+    Args:
+        lang (str): The language name or alias, e.g. "python" or "py".
+
+    Returns:
+        Lexer: The lexer, or the text lexer if Pygments doesn't know the language.
+    """
+    key = lang.lower()
+    lexer = _lexer_registry.get(key)
+    if lexer is None:
+        from pygments import lexers  # noqa: PLC0415
+        from pygments.util import ClassNotFound  # noqa: PLC0415
+
+        try:
+            lexer = lexers.get_lexer_by_name(key, stripall=True)
+        except ClassNotFound:
+            # Fallback to text lexer if we can't find the lexer
+            lexer = lexers.TextLexer()
+
+        with _lexer_registry_lock:
+            lexer = _lexer_registry.setdefault(key, lexer)
+
+    return lexer
+
+
+def warm_lexers(languages: Iterable[str] = PRELOAD_LANGUAGES) -> None:
+    """Load lexers into the lexer registry.
+
+    Loading a lexer imports its module, which is slow the first time, so we do it up front for the languages we use.
+
+    Args:
+        languages (Iterable[str]): The language names.
+    """
+    if PYGMENTS_AVAILABLE:
+        for lang in languages:
+            get_lexer(lang)
+
+
+@cache
+def warm_preloaded_lexers() -> None:
+    """Load the lexers for the languages we use into the lexer registry, once per process.
+
+    This is called when the first code block is highlighted rather than when a pipeline is created, so Pygments isn't
+    imported by processes that never highlight any code.
+    """
+    warm_lexers()
+
+
+def highlight_code(code: str, lang: str) -> str:
+    """Highlight code with Pygments, using the highlight cache.
+
+    The cache key is a hash of the language, the formatter options and the code.
+
+    Args:
+        code (str): The code.
+        lang (str): The language name.
+
+    Returns:
+        str: The highlighted code.
+    """
+    options = ",".join(f"{name}={value}" for name, value in sorted(FORMATTER_OPTIONS.items()))
+    key = hashlib.sha256(f"{lang.lower()}\0{options}\0{code}".encode()).hexdigest()
+    warm_preloaded_lexers()
+    from pygments import highlight  # noqa: PLC0415
+
+    return highlight_cache.get_or_set(key, lambda: highlight(code, get_lexer(lang), get_formatter()))
+
+
+def unique_slug(title: str, used: set[str]) -> str:
+    """Return a slug for a heading that hasn't been used yet, and mark it as used.
+
+    Args:
+        title (str): The heading text.
+        used (set[str]): The slugs that have already been used in the document.
+
+    Returns:
+        str: The slug, with a numeric suffix if the same slug has already been used.
+    """
+    base = slugify(title) or "section"
+    slug = base
+    suffix = 0
+    while slug in used:
+        suffix += 1
+        slug = f"{base}-{suffix}"
+
+    used.add(slug)
+    return slug
+
+
+@dataclass(frozen=True)
+class Heading:
+    """A heading in a Markdown document.
+
+    Attributes:
+        level (int): The heading level, from 1 to 6
+        title (str): The heading text, without any markup
+        slug (str): The anchor slug, which is used as the heading's id attribute
+    """
+
+    level: int
+    title: str
+    slug: str
+
+
+@dataclass(frozen=True)
+class MarkdownMetadata:
+    """Metadata collected while rendering a Markdown document.
+
+    Attributes:
+        headings (tuple[Heading, ...]): The headings, in document order
+        word_count (int): The number of words of text, not including code blocks
+        first_image (str | None): The URL of the first image, if there is one
+        code_languages (tuple[str, ...]): The languages of the code blocks, in order of first use
+        footnotes (tuple[str, ...]): The keys of the footnotes that are referenced, in the order they're numbered
+    """
+
+    headings: tuple[Heading, ...] = ()
+    word_count: int = 0
+    first_image: str | None = None
+    code_languages: tuple[str, ...] = ()
+    footnotes: tuple[str, ...] = ()
+
+    @property
+    def reading_time(self) -> int:
+        """The estimated reading time in minutes, rounded up."""
+        if not self.word_count:
+            return 0
+        return max(1, math.ceil(self.word_count / WORDS_PER_MINUTE))
+
+
+@dataclass(frozen=True)
+class RenderedMarkdown:
+    """The output of a single render: the HTML and the metadata collected along the way.
+
+    This is what we cache, so the metadata is never calculated separately from the HTML.
+
+    Attributes:
+        html (str): The rendered HTML
+        metadata (MarkdownMetadata): The metadata
+    """
+
+    html: str
+    metadata: MarkdownMetadata = field(default_factory=MarkdownMetadata)
+
+    def __str__(self) -> str:
+        """Return the rendered HTML."""
+        return self.html
 
 
 class CustomRenderer(mistune.HTMLRenderer):
-    """Custom renderer for Pygments syntax highlighting."""
+    """Custom renderer for Pygments syntax highlighting.
+
+    The renderer also collects metadata about the document as it renders it. Call `reset_metadata` before each render
+    and `get_metadata` afterwards.
+    """
 
     def __init__(self, *, escape: bool = False, **kwargs: dict) -> None:
         """Initialize the renderer."""
         super().__init__(escape=escape, allow_harmful_protocols=None, **kwargs)
 
-        if PYGMENTS_AVAILABLE:
-            # create a cache for lexers to improve performance
-            self._lexer_cache = {
-                "example": lexers.TextLexer(),
-            }
-            self._formatter = html.HtmlFormatter()
-            self._text_lexer = lexers.TextLexer()
-
         self._escape = escape
         self._mistune_escape = mistune.escape
+        self.reset_metadata()
+
+    def reset_metadata(self) -> None:
+        """Forget the metadata collected during the previous render."""
+        self._headings: list[Heading] = []
+        self._slugs: set[str] = set()
+        self._word_count = 0
+        self._first_image: str | None = None
+        self._code_languages: dict[str, None] = {}
+
+    def get_metadata(self) -> MarkdownMetadata:
+        """Return the metadata collected during the current render.
+
+        Returns:
+            MarkdownMetadata: The metadata.
+        """
+        return MarkdownMetadata(
+            headings=tuple(self._headings),
+            word_count=self._word_count,
+            first_image=self._first_image,
+            code_languages=tuple(self._code_languages),
+        )
+
+    def _unique_slug(self, title: str) -> str:
+        """Return a slug for a heading that is unique within the document.
+
+        Args:
+            title (str): The heading text.
+
+        Returns:
+            str: The slug, with a numeric suffix if the same slug has already been used.
+        """
+        return unique_slug(title, self._slugs)
+
+    def text(self, text: str) -> str:
+        """Override the text renderer to count the words.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            str: The text.
+        """
+        self._word_count += len(text.split())
+        return super().text(text)
+
+    def heading(self, text: str, level: int, **attrs: Any) -> str:  # noqa: ANN401
+        """Override the heading renderer to add an anchor slug and record the heading.
+
+        Args:
+            text (str): The rendered heading text.
+            level (int): The heading level.
+            **attrs (Any): Other attributes of the heading.
+
+        Returns:
+            str: The heading.
+        """
+        title = unescape(striptags(text)).strip()
+        attrs["id"] = attrs.get("id") or self._unique_slug(title)
+        self._headings.append(Heading(level=level, title=title, slug=attrs["id"]))
+        return super().heading(text, level, **attrs)
 
     def block_code(self, code: str, info=None) -> str:  # noqa: ANN001
         """Override the code block renderer.
 
         Checks if Pygments is available and highlights the code block if possible.
 
-        If Pygments is available, we override the default block_code method to highlight the code.
+        If Pygments is available, we override the default block_code method to highlight the code. Lexers come from
+        the process-wide lexer registry and highlighted code is cached.
 
         Args:
             code (str): The code.
@@ -54,22 +372,8 @@ class CustomRenderer(mistune.HTMLRenderer):
 
             if info:
                 lang = info.split(None, 1)[0]
-
-                # Get from cache or fallback to text lexer
-                lexer = self._lexer_cache.get(lang.lower())
-
-                if lexer is None:
-                    try:
-                        lexer = lexers.get_lexer_by_name(lang, stripall=True)
-
-                        # Cache successful lexer lookups
-                        self._lexer_cache[info.lower()] = lexer
-                    except ClassNotFound:
-                        # Fallback to text lexer if we can't find the lexer
-                        lexer = self._text_lexer
-
-                highlighted = highlight(code, lexer, self._formatter)
-                return highlighted + "\n"
+                self._code_languages.setdefault(lang.lower())
+                return highlight_code(code, lang) + "\n"
 
         # Fallback to basic code block
         html = "<pre><code"
@@ -77,6 +381,7 @@ class CustomRenderer(mistune.HTMLRenderer):
             info = safe_entity(info.strip())
             if info:
                 lang = info.split(None, 1)[0]
+                self._code_languages.setdefault(lang.lower())
                 html += ' class="language-' + lang + '"'
         return html + ">" + escape_text(code) + "</code></pre>\n"
 
@@ -95,7 +400,12 @@ class CustomRenderer(mistune.HTMLRenderer):
             str: The image tag.
         """
         src = self.safe_url(url)
-        alt = escape_text(striptags(text))
+        if self._first_image is None:
+            self._first_image = src
+        alt = striptags(text)
+        # The alt text has already been through the text renderer, but it isn't part of the reading text
+        self._word_count -= len(alt.split())
+        alt = escape_text(alt)
         s = '<img src="' + src + '" alt="' + alt + '"'
         if title:
             s += ' title="' + safe_entity(title) + '"'
@@ -125,10 +435,75 @@ class CustomRenderer(mistune.HTMLRenderer):
         return "<br>\n"
 
 
-def mistune_renderer(markdown_text: str) -> str:
-    """Render markdown text using Mistune.
+def create_markdown() -> mistune.Markdown:
+    """Create a new Markdown pipeline.
+
+    The pipeline uses our custom renderer with the same defaults as the Mistune renderer.
+
+    Returns:
+        mistune.Markdown: The Markdown pipeline.
+    """
+    return mistune.create_markdown(
+        escape=False,
+        renderer=CustomRenderer(),
+        plugins=list(MARKDOWN_PLUGINS),
+    )
 
-    We use our custom rendered with the same defaults as the Mistune renderer.
+
+_markdown_pool: queue.Queue[mistune.Markdown] = queue.Queue(maxsize=MARKDOWN_POOL_SIZE)
+
+
+@contextmanager
+def borrow_markdown() -> Iterator[mistune.Markdown]:
+    """Borrow a Markdown pipeline from the process-wide pool.
+
+    Building a pipeline compiles the parser rules, loads the plugins and creates a new renderer, so we keep idle
+    pipelines in a pool and re-use them. Each pipeline is only ever used by one caller at a time: Mistune creates a
+    fresh parser state for every call and the renderer's metadata is reset when the pipeline is borrowed, so nothing
+    leaks from one render into the next. If the pool is empty a new pipeline is created, and if the pool is full when
+    it is returned, the pipeline is discarded.
+
+    Yields:
+        mistune.Markdown: A Markdown pipeline that is exclusive to the caller until the context exits.
+    """
+    try:
+        markdown = _markdown_pool.get_nowait()
+    except queue.Empty:
+        markdown = create_markdown()
+
+    markdown.renderer.reset_metadata()
+    try:
+        yield markdown
+    finally:
+        with suppress(queue.Full):
+            _markdown_pool.put_nowait(markdown)
+
+
+def render_markdown_document(markdown_text: str) -> RenderedMarkdown:
+    """Render markdown text using Mistune and collect its metadata, without using the cache.
+
+    We use a pooled Markdown pipeline with our custom renderer, which collects the metadata during the same pass that
+    renders the HTML.
+
+    Args:
+        markdown_text (str): The markdown text.
+
+    Returns:
+        RenderedMarkdown: The rendered HTML and the metadata.
+    """
+    with borrow_markdown() as markdown:
+        markdown_content, state = markdown.parse(markdown_text)
+        metadata = markdown.renderer.get_metadata()
+
+    # The footnotes plugin numbers the footnotes in the parser state rather than in the renderer
+    footnotes = tuple(state.env.get("footnotes") or ())
+    if footnotes:
+        metadata = replace(metadata, footnotes=footnotes)
+    return RenderedMarkdown(html=str(markdown_content), metadata=metadata)
+
+
+def render_markdown(markdown_text: str) -> str:
+    """Render markdown text using Mistune, without using the cache.
 
     Args:
         markdown_text (str): The markdown text.
@@ -136,16 +511,144 @@ def mistune_renderer(markdown_text: str) -> str:
     Returns:
         str: The rendered markdown text.
     """
-    renderer = CustomRenderer()
-    markdown = mistune.create_markdown(
-        escape=False,
-        renderer=renderer,
-        plugins=[
-            "strikethrough",
-            "table",
-            "footnotes",
-        ],
-    )
-    markdown_content = markdown(markdown_text)
+    return render_markdown_document(markdown_text).html
+
 
-    return str(markdown_content)
+render_cache = TieredCache(
+    prefix=f"markdown:{RENDERER_FINGERPRINT}",
+    maxsize=MARKDOWN_CACHE_SIZE,
+    alias=MARKDOWN_CACHE_ALIAS,
+    timeout=MARKDOWN_CACHE_TIMEOUT,
+)
+
+
+@cached_renderer(render_cache)
+def mistune_renderer(markdown_text: str) -> RenderedMarkdown:
+    """Render markdown text using Mistune.
+
+    The rendered HTML and its metadata are cached together, keyed by a hash of the markdown text. The renderer
+    fingerprint is part of the cache key prefix, so cached HTML is ignored as soon as the renderer configuration
+    changes. The cached renderer returns the HTML; use `get_markdown_metadata` for the metadata.
+
+    Args:
+        markdown_text (str): The markdown text.
+
+    Returns:
+        RenderedMarkdown: The rendered markdown text and its metadata.
+    """
+    return render_markdown_document(markdown_text)
+
+
+def get_markdown_metadata(markdown_text: str) -> MarkdownMetadata:
+    """Get the metadata for markdown text, from the same cache entry as the rendered HTML.
+
+    Args:
+        markdown_text (str): The markdown text.
+
+    Returns:
+        MarkdownMetadata: The metadata.
+    """
+    rendered = render_cache.get_or_set(content_key(markdown_text), lambda: render_markdown_document(markdown_text))
+    return rendered.metadata
+
+
+html_metadata_cache = TieredCache(
+    prefix="html-metadata",
+    maxsize=HTML_METADATA_CACHE_SIZE,
+    alias=MARKDOWN_CACHE_ALIAS,
+    timeout=MARKDOWN_CACHE_TIMEOUT,
+)
+
+
+class MetadataParser(HTMLParser):
+    """Collect the same metadata as `CustomRenderer` from HTML rendered by another content renderer.
+
+    Only headings with an id attribute are collected, as the others can't be linked to. Text inside `code` and `pre`
+    elements isn't counted, just as the Markdown renderer doesn't count code.
+    """
+
+    HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+    CODE_TAGS = frozenset({"code", "pre", "script", "style"})
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        super().__init__(convert_charrefs=True)
+        self._headings: list[Heading] = []
+        self._heading: tuple[int, str] | None = None
+        self._heading_text: list[str] = []
+        self._code_depth = 0
+        self._word_count = 0
+        self._first_image: str | None = None
+        self._code_languages: dict[str, None] = {}
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Record headings, images and code blocks as they start."""
+        attributes = dict(attrs)
+        if tag in self.HEADING_TAGS and attributes.get("id"):
+            self._heading = (int(tag[1]), attributes["id"] or "")
+            self._heading_text = []
+        elif tag == "img" and self._first_image is None and attributes.get("src"):
+            self._first_image = attributes["src"]
+        elif tag in self.CODE_TAGS:
+            self._code_depth += 1
+            for name in (attributes.get("class") or "").split():
+                if name.startswith("language-") and len(name) > len("language-"):
+                    self._code_languages.setdefault(name.removeprefix("language-").lower())
+
+    def handle_endtag(self, tag: str) -> None:
+        """Finish headings and code blocks."""
+        if tag in self.HEADING_TAGS and self._heading is not None:
+            level, slug = self._heading
+            self._headings.append(Heading(level=level, title="".join(self._heading_text).strip(), slug=slug))
+            self._heading = None
+        elif tag in self.CODE_TAGS and self._code_depth:
+            self._code_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        """Count the words of text outside code, and collect the heading text."""
+        if self._heading is not None:
+            self._heading_text.append(data)
+        if not self._code_depth:
+            self._word_count += len(data.split())
+
+    def get_metadata(self) -> MarkdownMetadata:
+        """Return the metadata collected from the HTML fed to the parser.
+
+        Returns:
+            MarkdownMetadata: The metadata.
+        """
+        return MarkdownMetadata(
+            headings=tuple(self._headings),
+            word_count=self._word_count,
+            first_image=self._first_image,
+            code_languages=tuple(self._code_languages),
+        )
+
+
+def collect_html_metadata(html: str) -> MarkdownMetadata:
+    """Collect the metadata from rendered HTML, without using the cache.
+
+    Args:
+        html (str): The rendered HTML.
+
+    Returns:
+        MarkdownMetadata: The metadata.
+    """
+    parser = MetadataParser()
+    parser.feed(html)
+    parser.close()
+    return parser.get_metadata()
+
+
+def get_html_metadata(html: str) -> MarkdownMetadata:
+    """Get the metadata for HTML rendered by a content renderer other than the Markdown renderer.
+
+    The metadata is cached, keyed by a hash of the HTML.
+
+    Args:
+        html (str): The rendered HTML.
+
+    Returns:
+        MarkdownMetadata: The metadata.
+    """
+    return html_metadata_cache.get_or_set(content_key(html), lambda: collect_html_metadata(html))
@@ -2,16 +2,17 @@
 
 from pathlib import Path
 
-import logfire
-import sentry_sdk
 from django.contrib.messages import constants as messages
-from environs import env
-from sentry_sdk.integrations.django import DjangoIntegration
+
+from config.startup import instrument_app_registry, phase
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-# The following line isn't necessary if reading environment variables from memory!
-env.read_env()
+with phase("settings: environs"):
+    from environs import env
+
+    # The following line isn't necessary if reading environment variables from memory!
+    env.read_env()
 
 # set casting, default value
 SECRET_KEY = env.str("SECRET_KEY", "this_is_just_a_temporary_secret_key")
@@ -26,13 +27,19 @@ EMAIL_HOST_USER = env.str("EMAIL_HOST_USER", "")
 EMAIL_HOST_PASSWORD = env.str("EMAIL_HOST_PASSWORD", "")
 EMAIL_USE_TLS = env.bool("EMAIL_USE_TLS", True)
 DEFAULT_FROM_EMAIL = env.str("DEFAULT_FROM_EMAIL", "")
-DB_ENGINE = env.str("DB_ENGINE", "django.db.backends.sqlite3")
+DB_ENGINE = env.str("DB_ENGINE", "config.sqlite_backend")
 DB_NAME = env.str("DB_NAME", "db")
 DB_USER = env.str("DB_USER", "")
 DB_PASSWORD = env.str("DB_PASSWORD", "")
 DB_HOST = env.str("DB_HOST", "")
 DB_PORT = env.str("DB_PORT", "")
 WHITENOISE_STATIC = env.bool("WHITENOISE_STATIC", False)
+PAGE_CACHE_ENABLED = env.bool("PAGE_CACHE_ENABLED", True)
+CONDITIONAL_GET_ENABLED = env.bool("CONDITIONAL_GET_ENABLED", True)
+PAGE_CACHE_TIMEOUT = env.int("PAGE_CACHE_TIMEOUT", 60 * 60 * 24)
+WARMUP_ENABLED = env.bool("WARMUP_ENABLED", True)
+SITEMAP_DOMAIN = env.str("SITEMAP_DOMAIN", "stuartm.nz")
+SITEMAP_LIMIT = env.int("SITEMAP_LIMIT", 1000)
 ADMIN_URL = env.str("ADMIN_URL", "admin")
 SITE_TITLE = env.str("SITE_TITLE", "stuartm.nz")
 POST_PREFIX = env.str("POST_PREFIX", "{{ year }}/{{ month }}")
@@ -50,15 +57,27 @@ AWS_SECRET_ACCESS_KEY = env.str("AWS_SECRET_ACCESS_KEY", "")
 AWS_STORAGE_BUCKET_NAME = env.str("AWS_STORAGE_BUCKET_NAME", "")
 AWS_ENDPOINT_URL = env.str("AWS_ENDPOINT_URL", "")
 S3_BUCKET = env.str("S3_BUCKET", "")
+# Restore the database as it was at this ISO 8601 time, when the bootstrap command restores it
+RESTORE_TO = env.str("RESTORE_TO", "")
+STARTUP_PROFILE = env.bool("STARTUP_PROFILE", False)
+SPF_RESOLVER = env.str("SPF_RESOLVER", "spf_generator.resolvers.DohResolver")
+
+if STARTUP_PROFILE:
+    instrument_app_registry()
 
+# The optional integrations are only imported when they're configured, as they're slow to import
 
 if SENTRY_DSN:
-    sentry_sdk.init(
-        dsn=SENTRY_DSN,
-        integrations=[DjangoIntegration()],
-        environment=SENTRY_ENVIRONMENT,
-        traces_sample_rate=SENTRY_TRACES_SAMPLE_RATE,
-    )
+    with phase("settings: sentry_sdk.init"):
+        import sentry_sdk
+        from sentry_sdk.integrations.django import DjangoIntegration
+
+        sentry_sdk.init(
+            dsn=SENTRY_DSN,
+            integrations=[DjangoIntegration()],
+            environment=SENTRY_ENVIRONMENT,
+            traces_sample_rate=SENTRY_TRACES_SAMPLE_RATE,
+        )
 
 APP_NAME = "stuartm.nz"
 
@@ -81,6 +100,9 @@ INSTALLED_APPS = [
     "spf_generator",
     "home",
     "debugging_app",
+    "blog_tools",
+    "page_cache",
+    "deploy_tools",
     "djpress_blog_theme",
     "djpress_tiptap",
 ]
@@ -96,10 +118,10 @@ MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
 ]
 
-# Whitenoise
+# Whitenoise, serving the hashed and precompressed files built by collectstatic
 if WHITENOISE_STATIC:
     MIDDLEWARE += [
-        "whitenoise.middleware.WhiteNoiseMiddleware",
+        "deploy_tools.middleware.StaticFilesMiddleware",
     ]
 
 # django-debug-toolbar
@@ -109,6 +131,11 @@ if DEBUG:
     ]
 
 MIDDLEWARE += [
+    # Must come before any middleware that reads from the database
+    "config.db_router.ReadOnlyRequestMiddleware",
+    # Must come before the session middleware: 304s and cached pages are only served to visitors without a session
+    "page_cache.middleware.ConditionalGetMiddleware",
+    "page_cache.middleware.PageCacheMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -153,6 +180,9 @@ SQLITE_OPTIONS = {
         "PRAGMA cache_size = 2000;"
     ),
     "transaction_mode": "IMMEDIATE",
+    # Used by config.sqlite_backend, which runs the PRAGMAs above once per pooled connection
+    "pool_size": env.int("DB_POOL_SIZE", 4),
+    "optimize_interval": env.int("DB_OPTIMIZE_INTERVAL", 3600),
 }
 DATABASES = {
     "default": {
@@ -164,8 +194,33 @@ DATABASES = {
         "PORT": DB_PORT,
     },
 }
+if DB_ENGINE == "config.sqlite_backend":
+    DATABASES["default"]["OPTIONS"] = SQLITE_OPTIONS
+elif "sqlite" in DB_ENGINE:
+    DATABASES["default"]["OPTIONS"] = {key: SQLITE_OPTIONS[key] for key in ("init_command", "transaction_mode")}
+
+# A read-only connection to the same SQLite file, used by GET requests to the public views. See config.db_router.
+SQLITE_READER_OPTIONS = {
+    **SQLITE_OPTIONS,
+    "init_command": (
+        "PRAGMA query_only = ON;"
+        "PRAGMA busy_timeout = 5000;"
+        "PRAGMA temp_store = MEMORY;"
+        "PRAGMA mmap_size = 134217728;"
+        "PRAGMA cache_size = 2000;"
+    ),
+    "transaction_mode": None,
+    # PRAGMA optimize can write to the database, which a query_only connection refuses
+    "optimize_interval": 0,
+}
 if "sqlite" in DB_ENGINE:
-    DATABASES["default"].update(SQLITE_OPTIONS)
+    DATABASES["reader"] = {
+        **DATABASES["default"],
+        "NAME": f"{DB_NAME.as_uri()}?mode=ro",
+        "OPTIONS": {key: SQLITE_READER_OPTIONS[key] for key in DATABASES["default"]["OPTIONS"]},
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_ROUTERS = ["config.db_router.ReadWriteRouter"]
 
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -271,9 +326,14 @@ DJPRESS_SETTINGS = {
     "DATABASE_SETTINGS_ENABLED": True,
     "AUTHOR_ENABLED": True,
     "CONTENT_RENDERER": "djpress_tiptap.renderers.html_renderer",
+    # The publishing plugins, and the API clients they import, are only loaded when they have credentials
     "PLUGINS": [
-        "djpress_publish_mastodon",
-        "djpress_publish_bluesky",
+        plugin
+        for plugin, credentials in (
+            ("djpress_publish_mastodon", MASTODON_ACCESS_TOKEN),
+            ("djpress_publish_bluesky", BLUESKY_APP_PASSWORD),
+        )
+        if credentials
     ],
     "PLUGIN_SETTINGS": {
         "djpress_publish_mastodon": {
@@ -328,11 +388,14 @@ SECURE_HSTS_PRELOAD = True
 # Logfire
 # Logfire
 if LOGFIRE_API_KEY:
-    logfire.configure(environment=LOGFIRE_ENVIRONMENT, token=LOGFIRE_API_KEY)
-    logfire.instrument_django(
-        capture_headers=True,
-        excluded_urls="/healthcheck",
-    )
+    with phase("settings: logfire.configure"):
+        import logfire
+
+        logfire.configure(environment=LOGFIRE_ENVIRONMENT, token=LOGFIRE_API_KEY)
+        logfire.instrument_django(
+            capture_headers=True,
+            excluded_urls="/healthcheck",
+        )
 
 # Django Storages
 # AWS_ACCESS_KEY_ID
@@ -353,14 +416,30 @@ if not DEBUG:
                 "custom_domain": "s.stuartm.nz",
             },
         },
+        # Content-hashed names, served with `Cache-Control: immutable`, and gzip and Zstandard variants
         "staticfiles": {
-            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+            "BACKEND": "deploy_tools.storage.CompressedManifestStorage",
         },
     }
 
+    # The S3 storage, which imports boto3, is only used when it has credentials
+    if not AWS_ACCESS_KEY_ID:
+        STORAGES["default"] = {"BACKEND": "django.core.files.storage.FileSystemStorage"}
+
+# The cache has its own SQLite database, so cache writes don't compete with content writes for the write lock
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
-        "LOCATION": "stuartm_nz_django_cache",
+        "BACKEND": "config.cache_backend.TieredSQLiteCache",
+        "LOCATION": BASE_DIR / "db" / "cache.sqlite3",
+        "OPTIONS": {
+            "MAX_ENTRIES": 50000,
+            "MEMORY_MAX_ENTRIES": 2000,
+            "MEMORY_TIMEOUT": 10,
+            "CULL_INTERVAL": 300,
+        },
     }
 }
+
+# Full-page cache for anonymous visitors. Invalidated pages can be served by the other worker processes for up to the
+# cache's MEMORY_TIMEOUT.
+PAGE_CACHE_ALIAS = "default"
@@ -8,14 +8,32 @@ DATABASES = {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
     },
+    "reader": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {"MIRROR": "default"},
+    },
 }
 
 PASSWORD_HASHERS: list[str] = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
 ]
 
+# The tests don't collect static files, so there's no manifest
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
 CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
 
+# Cached pages and validators would outlive the test database, so they are only enabled by their own tests
+PAGE_CACHE_ENABLED = False
+CONDITIONAL_GET_ENABLED = False
+
+# Flattening SPF records never looks up real DNS records in the tests
+SPF_RESOLVER = "spf_generator.resolvers.StaticResolver"
+
 # DJPress settings
 DJPRESS_SETTINGS = {
     "POST_PREFIX": "{{ year }}/{{ month }}",
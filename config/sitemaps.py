@@ -1,7 +1,18 @@
 """Sitemap for stuartm.nz."""
 
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import ClassVar
+
 from django.contrib.sitemaps import Sitemap
+from django.template.loader import get_template
 from django.urls import reverse
+from djpress.sitemaps import (
+    CategorySitemap,
+    DateBasedSitemap,
+    PageSitemap,
+    PostSitemap,
+)
 
 
 class StaticSitemap(Sitemap):
@@ -10,19 +21,32 @@ class StaticSitemap(Sitemap):
     changefreq = "monthly"
     protocol = "https"
 
+    # The URL names that you want to include, and the template that each one renders.
+    pages: ClassVar[dict[str, str]] = {
+        "timezone_converter:converter": "timezone_converter/converter.html",
+        "markdown_editor:markdown_editor": "markdown_editor/markdown_editor.html",
+        "spf_generator:spf_generator": "spf_generator/generator.html",
+        "home:home": "home/home.html",
+    }
+
     def items(self) -> list:
         """Return a list of URL names that you want to include."""
-        return [
-            "timezone_converter:converter",
-            "markdown_editor:markdown_editor",
-            "spf_generator:spf_generator",
-            "home:home",
-        ]
+        return list(self.pages)
 
     def location(self, item: str) -> str:
         """Generate the URL for each item using Django's reverse."""
         return reverse(item)
 
-    def lastmod(self, _: dict) -> None:
-        """Return the last modification time for each item."""
-        return
+    def lastmod(self, item: str) -> datetime:
+        """Return the last modification time for each item, which is when its template was last modified."""
+        template = get_template(self.pages[item])
+        return datetime.fromtimestamp(Path(template.origin.name).stat().st_mtime, tz=UTC)
+
+
+SITEMAPS = {
+    "posts": PostSitemap,
+    "pages": PageSitemap,
+    "categories": CategorySitemap,
+    "archives": DateBasedSitemap,
+    "static": StaticSitemap,
+}
@@ -0,0 +1 @@
+"""SQLite database backend that reuses connections."""
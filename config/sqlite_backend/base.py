@@ -0,0 +1,246 @@
+"""SQLite database backend that keeps a pool of long-lived connections in each worker process.
+
+Django closes its connection at the end of each request, and under ASGI each request runs its synchronous code in a
+new thread, so every request would otherwise open a new SQLite connection and run the PRAGMAs in `init_command` again.
+With this backend, a closed connection is returned to a pool shared by every thread in the process, and the next
+connection is taken from the pool. The PRAGMAs are run once, when a connection is first opened.
+
+Example:
+    DATABASES = {
+        "default": {
+            "ENGINE": "config.sqlite_backend",
+            "NAME": BASE_DIR / "db" / "db.sqlite3",
+            "OPTIONS": {
+                "init_command": "PRAGMA journal_mode = WAL;PRAGMA synchronous = NORMAL;",
+                "pool_size": 4,
+                "optimize_interval": 3600,
+            },
+        },
+    }
+
+Options:
+    pool_size: The maximum number of idle connections kept in the pool. 0, the default, closes every connection like
+        Django's own SQLite backend. In-memory databases are never pooled.
+    optimize_interval: The number of seconds between runs of `PRAGMA optimize` on each pooled connection, which run
+        when the connection is returned to the pool. 0 disables it.
+
+The backend is otherwise Django's SQLite backend, and takes the same options.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+from django.db.backends.sqlite3 import base
+from django.utils.asyncio import async_unsafe
+
+DEFAULT_POOL_SIZE = 0
+DEFAULT_OPTIMIZE_INTERVAL = 3600
+
+STAT_NAMES = ("hits", "opens", "closes", "optimizes")
+
+
+class ConnectionPool:
+    """A pool of idle connections to one SQLite database.
+
+    Connections can be used by any thread, as Django's SQLite backend opens them with `check_same_thread=False` and
+    only one thread uses a connection at a time.
+    """
+
+    def __init__(self, size: int, optimize_interval: float) -> None:
+        """Initialize the pool.
+
+        Args:
+            size (int): The maximum number of idle connections.
+            optimize_interval (float): The number of seconds between runs of `PRAGMA optimize` on each connection.
+        """
+        self.size = size
+        self.optimize_interval = optimize_interval
+        self._idle: list[sqlite3.Connection] = []
+        # When each open connection was last optimized, by the connection's id
+        self._optimized: dict[int, float] = {}
+        self._stats: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> sqlite3.Connection | None:
+        """Take an idle connection from the pool.
+
+        Returns:
+            sqlite3.Connection | None: The connection used most recently, or None if there are no idle connections.
+        """
+        with self._lock:
+            if not self._idle:
+                return None
+            self._stats["hits"] += 1
+            return self._idle.pop()
+
+    def opened(self, connection: sqlite3.Connection) -> None:
+        """Record a new connection, which will be returned to the pool when it's closed.
+
+        Args:
+            connection (sqlite3.Connection): The connection.
+        """
+        with self._lock:
+            self._stats["opens"] += 1
+            self._optimized[id(connection)] = time.monotonic()
+
+    def release(self, connection: sqlite3.Connection) -> None:
+        """Return a connection to the pool, or close it if the pool is full or the connection can't be reset.
+
+        Args:
+            connection (sqlite3.Connection): The connection.
+        """
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+            self._optimize(connection)
+        except sqlite3.Error:
+            self.close(connection)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(connection)
+                return
+
+        self.close(connection)
+
+    def close(self, connection: sqlite3.Connection) -> None:
+        """Close a connection instead of returning it to the pool.
+
+        Args:
+            connection (sqlite3.Connection): The connection.
+        """
+        with self._lock:
+            self._stats["closes"] += 1
+            self._optimized.pop(id(connection), None)
+        connection.close()
+
+    def _optimize(self, connection: sqlite3.Connection) -> None:
+        """Run `PRAGMA optimize` on a connection, if it's been long enough since it was last run on the connection.
+
+        Args:
+            connection (sqlite3.Connection): The connection.
+        """
+        if not self.optimize_interval:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            if now - self._optimized.get(id(connection), now) < self.optimize_interval:
+                return
+            self._optimized[id(connection)] = now
+            self._stats["optimizes"] += 1
+
+        connection.execute("PRAGMA optimize")
+
+    def clear(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            self.close(connection)
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the pool counters.
+
+        Returns:
+            dict[str, int]: The hits, opens, closes and optimizes, and the number of idle connections.
+        """
+        with self._lock:
+            stats = {stat: self._stats[stat] for stat in STAT_NAMES}
+            stats["idle"] = len(self._idle)
+        return stats
+
+
+# The pools in this process, by database and connection settings
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(key: str, size: int, optimize_interval: float) -> ConnectionPool:
+    """Return the pool for a database, creating it if needed.
+
+    Args:
+        key (str): The database and connection settings. Connections are only shared between identical settings.
+        size (int): The maximum number of idle connections, if the pool is created.
+        optimize_interval (float): The number of seconds between optimizations, if the pool is created.
+
+    Returns:
+        ConnectionPool: The pool.
+    """
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(size, optimize_interval)
+        return _pools[key]
+
+
+def pool_stats() -> dict[str, dict[str, int]]:
+    """Return the counters of every pool in this process.
+
+    Returns:
+        dict[str, dict[str, int]]: The counters for each pool, by database name.
+    """
+    with _pools_lock:
+        pools = dict(_pools)
+    return {key.split("\0", 1)[0]: pool.stats() for key, pool in pools.items()}
+
+
+def _forget_pools() -> None:
+    """Forget the pools inherited from the parent process, as SQLite connections can't be used across a fork."""
+    _pools.clear()
+
+
+os.register_at_fork(after_in_child=_forget_pools)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """Django's SQLite backend, with closed connections returned to a pool instead."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the database wrapper."""
+        super().__init__(*args, **kwargs)
+        self.pool: ConnectionPool | None = None
+
+    def get_connection_params(self) -> dict[str, Any]:
+        """Return the arguments for `sqlite3.connect`, and find the pool for them."""
+        kwargs = super().get_connection_params()
+        pool_size = int(kwargs.pop("pool_size", DEFAULT_POOL_SIZE))
+        optimize_interval = float(kwargs.pop("optimize_interval", DEFAULT_OPTIMIZE_INTERVAL))
+
+        self.pool = None
+        if pool_size and not self.is_in_memory_db():
+            key = "\0".join((str(kwargs["database"]), repr(sorted(kwargs.items())), *self.init_commands))
+            self.pool = get_pool(key, pool_size, optimize_interval)
+        return kwargs
+
+    @async_unsafe
+    def get_new_connection(self, conn_params: dict[str, Any]) -> sqlite3.Connection:
+        """Take a connection from the pool, or open a new one."""
+        if self.pool is None:
+            return super().get_new_connection(conn_params)
+
+        connection = self.pool.acquire()
+        if connection is None:
+            connection = super().get_new_connection(conn_params)
+            self.pool.opened(connection)
+        return connection
+
+    def _close(self) -> None:
+        """Return the connection to the pool.
+
+        A connection closed inside an atomic block is really closed, as Django keeps using the closed connection until
+        the block exits.
+        """
+        if self.pool is None or self.connection is None:
+            return super()._close()
+
+        with self.wrap_database_errors:
+            if self.in_atomic_block:
+                self.pool.close(self.connection)
+            else:
+                self.pool.release(self.connection)
+        return None
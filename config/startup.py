@@ -0,0 +1,72 @@
+"""Startup phase timings.
+
+Timing a phase is cheap, so the phases are always recorded. The `profile_startup` management command reports them,
+and so does the ASGI application when `STARTUP_PROFILE` is set.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django.apps import AppConfig
+
+logger = logging.getLogger(__name__)
+
+# The time taken by each phase, in seconds, in the order they finished
+PHASES: dict[str, float] = {}
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a phase of starting up.
+
+    Args:
+        name (str): The name of the phase. The time is added to any earlier time for a phase with the same name.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        PHASES[name] = PHASES.get(name, 0.0) + time.perf_counter() - start
+
+
+def instrument_app_registry() -> None:
+    """Time importing, importing the models of, and getting ready, each app in `INSTALLED_APPS`.
+
+    This has to be called before the app registry is populated, which is why it's called from the settings.
+    """
+    from django.apps import AppConfig  # noqa: PLC0415
+
+    create = AppConfig.create.__func__
+    import_models = AppConfig.import_models
+
+    def timed_create(cls: type[AppConfig], entry: str) -> AppConfig:
+        start = time.perf_counter()
+        app_config = create(cls, entry)
+        PHASES[f"apps: {app_config.name} (import)"] = time.perf_counter() - start
+
+        ready = app_config.ready
+
+        def timed_ready() -> None:
+            with phase(f"apps: {app_config.name} (ready)"):
+                ready()
+
+        app_config.ready = timed_ready
+        return app_config
+
+    def timed_import_models(self: AppConfig) -> None:
+        with phase(f"apps: {self.name} (models)"):
+            import_models(self)
+
+    AppConfig.create = classmethod(timed_create)
+    AppConfig.import_models = timed_import_models
+
+
+def log_phases() -> None:
+    """Log the phases, slowest first."""
+    for name, seconds in sorted(PHASES.items(), key=lambda item: item[1], reverse=True):
+        logger.info("Startup phase %s: %.1f ms", name, seconds * 1000)
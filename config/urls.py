@@ -3,20 +3,13 @@
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.contrib.sitemaps.views import sitemap
 from django.urls import include, path
 from django.views.generic import TemplateView
 from djpress.admin import PostAdmin
 from djpress.models import Post
-from djpress.sitemaps import (
-    CategorySitemap,
-    DateBasedSitemap,
-    PageSitemap,
-    PostSitemap,
-)
 from djpress_tiptap.widgets import DjTiptapWidget
 
-from config.sitemaps import StaticSitemap
+from blog_tools.views import sitemap_index, sitemap_section
 
 """Custom admin configuration."""
 admin.site.unregister(Post)
@@ -28,14 +21,6 @@ class TiptapPostAdmin(PostAdmin):
         kwargs["widgets"] = {"content": DjTiptapWidget()}
         return super().get_form(request, obj, change, **kwargs)
 
-sitemaps = {
-    "posts": PostSitemap,
-    "pages": PageSitemap,
-    "categories": CategorySitemap,
-    "archives": DateBasedSitemap,
-    "static": StaticSitemap,
-}
-
 urlpatterns = []
 
 if settings.DEBUG:
@@ -53,8 +38,9 @@ urlpatterns += [
     path("utils/spf/", view=include("spf_generator.urls")),
     path("utils/home/", view=include("home.urls")),
     path("utils/__debugging__/", view=include("debugging_app.urls")),
-    path("robots.txt", TemplateView.as_view(template_name="robots.txt", content_type="text/plain")),
-    path("sitemap.xml", sitemap, {"sitemaps": sitemaps}, name="django.contrib.sitemaps.views.sitemap"),
+    path("robots.txt", TemplateView.as_view(template_name="robots.txt", content_type="text/plain"), name="robots"),
+    path("sitemap.xml", sitemap_index, name="sitemap"),
+    path("sitemap-<slug:section>.xml", sitemap_section, name="sitemap-section"),
     path("media/", include("djpress_tiptap.urls")),
     path("", include("djpress.urls")),
     *static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT),
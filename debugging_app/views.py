@@ -2,13 +2,31 @@
 
 from typing import TYPE_CHECKING
 
+from django.core.cache import cache
 from django.shortcuts import render
 
+from config.markdown_renderer import highlight_cache, render_cache
+from config.sqlite_backend.base import pool_stats
+
 if TYPE_CHECKING:
     from django.http import HttpRequest, HttpResponse
 
 
 def debugging_app(request: HttpRequest) -> HttpResponse:
     """View function for the debugging page."""
-    context = {"meta": request.META}
+    cache_stats = {
+        "Rendered Markdown": render_cache.stats(),
+        "Highlighted code": highlight_cache.stats(),
+    }
+    # The tiered cache backend keeps counters for each key prefix
+    if hasattr(cache, "stats"):
+        for prefix, stats in cache.stats().items():
+            cache_stats[f"Cache keys: {prefix or '(no prefix)'}"] = stats
+    for database, stats in pool_stats().items():
+        cache_stats[f"Database connections: {database}"] = stats
+
+    context = {
+        "meta": request.META,
+        "cache_stats": cache_stats,
+    }
     return render(request, "debugging_app/debugging.html", context)
@@ -0,0 +1 @@
+"""Deploy tools app."""
@@ -0,0 +1,13 @@
+"""App configuration for the deploy_tools app."""
+
+from django.apps import AppConfig
+
+
+class DeployToolsConfig(AppConfig):
+    """App configuration for the deploy_tools app."""
+
+    name = "deploy_tools"
+
+    def ready(self) -> None:
+        """Register the system checks."""
+        import deploy_tools.checks  # noqa: F401, PLC0415
@@ -0,0 +1,60 @@
+"""ASGI lifespan support for the Django application."""
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from asgiref.sync import sync_to_async
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    Scope = dict[str, Any]
+    Receive = Callable[[], Awaitable[dict[str, Any]]]
+    Send = Callable[[dict[str, Any]], Awaitable[None]]
+    ASGIApplication = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+logger = logging.getLogger(__name__)
+
+
+class LifespanApplication:
+    """Wrap an ASGI application to handle the lifespan protocol, which Django doesn't support.
+
+    The startup function runs when the server starts the worker, before the worker accepts any connections. It's run in
+    a thread, as it's synchronous Django code.
+    """
+
+    def __init__(self, application: ASGIApplication, on_startup: Callable[[], object]) -> None:
+        """Initialise the application.
+
+        Args:
+            application (ASGIApplication): The Django application, which handles every other kind of connection.
+            on_startup (Callable[[], object]): The function to run at startup.
+        """
+        self.application = application
+        self.on_startup = on_startup
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a connection.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): Receives the next event.
+            send (Send): Sends an event.
+        """
+        if scope["type"] != "lifespan":
+            await self.application(scope, receive, send)
+            return
+
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await sync_to_async(self.on_startup, thread_sensitive=True)()
+                except Exception as exc:
+                    logger.exception("Startup failed")
+                    await send({"type": "lifespan.startup.failed", "message": str(exc)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
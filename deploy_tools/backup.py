@@ -0,0 +1,389 @@
+"""Backing up the SQLite database to S3 while the site is running.
+
+The database is copied with SQLite's online backup API, a few pages at a time, so writers are only held up for one
+step at a time rather than for a whole `VACUUM INTO`. The copy is compressed into a tar archive as it's uploaded, as
+the parts of a multipart upload, so nothing is written to disk.
+
+The backups keep the retention scheme of the old `db-backup.sh` script: an hourly backup that's overwritten a day later,
+a daily backup at midnight that's overwritten a month later, and a monthly backup at midnight on the first of the month
+that's overwritten a year later. A manifest records the SHA-256 of the latest backup. When the database hasn't changed,
+the latest backup is copied to this hour's keys by S3 rather than uploaded again.
+"""
+
+import hashlib
+import io
+import json
+import sqlite3
+import tarfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer, Iterator
+    from datetime import datetime
+    from pathlib import Path
+
+    from botocore.client import BaseClient
+
+# The number of pages copied in each step of the online backup, and the pause between steps, when writers can write
+BACKUP_PAGES = 256
+BACKUP_SLEEP = 0.005
+
+# S3 requires every part of a multipart upload, other than the last, to be at least 5 MiB
+PART_SIZE = 8 * 1024 * 1024
+
+COMPRESS_LEVEL = 6
+
+BACKUP_KEY = "backup-{db_name}-{suffix}.tar.gz"
+MANIFEST_KEY = "backup-{db_name}-manifest.json"
+
+
+def get_client() -> BaseClient:
+    """Return an S3 client for the backup bucket.
+
+    Returns:
+        BaseClient: The client, using the `AWS_` settings.
+    """
+    import boto3  # noqa: PLC0415
+
+    return boto3.client(
+        "s3",
+        endpoint_url=settings.AWS_ENDPOINT_URL or None,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID or None,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY or None,
+    )
+
+
+def read_json(client: BaseClient, bucket: str, key: str) -> Any:  # noqa: ANN401
+    """Read a JSON object, such as a manifest, from the bucket.
+
+    Args:
+        client (BaseClient): The S3 client.
+        bucket (str): The bucket.
+        key (str): The key of the object.
+
+    Returns:
+        Any: The decoded JSON, or None if there's no such object.
+    """
+    try:
+        response = client.get_object(Bucket=bucket, Key=key)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in {"NoSuchKey", "404"}:
+            return None
+        raise
+
+    return json.loads(response["Body"].read())
+
+
+def write_json(client: BaseClient, bucket: str, key: str, value: object) -> None:
+    """Write a JSON object, such as a manifest, to the bucket.
+
+    Args:
+        client (BaseClient): The S3 client.
+        bucket (str): The bucket.
+        key (str): The key of the object.
+        value (object): The value to encode as JSON.
+    """
+    client.put_object(Bucket=bucket, Key=key, Body=json.dumps(value).encode(), ContentType="application/json")
+
+
+def backup_keys(db_name: str, now: datetime) -> list[str]:
+    """Return the keys a backup taken now is stored under, following the retention scheme.
+
+    Args:
+        db_name (str): The name of the database, without the extension.
+        now (datetime): When the backup is taken.
+
+    Returns:
+        list[str]: The hourly key, then the daily and monthly keys if they're due.
+    """
+    keys = [BACKUP_KEY.format(db_name=db_name, suffix=f"{now:%H}")]
+    if now.hour == 0:
+        keys.append(BACKUP_KEY.format(db_name=db_name, suffix=f"{now:%d-%H}"))
+        if now.day == 1:
+            keys.append(BACKUP_KEY.format(db_name=db_name, suffix=f"{now:%m-%d-%H}"))
+
+    return keys
+
+
+def snapshot(path: Path, pages: int = BACKUP_PAGES, sleep: float = BACKUP_SLEEP) -> bytes:
+    """Copy the database with the online backup API.
+
+    Args:
+        path (Path): The path to the database.
+        pages (int): The number of pages copied in each step.
+        sleep (float): The number of seconds to pause between steps.
+
+    Returns:
+        bytes: The copy of the database file.
+    """
+    source = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    target = sqlite3.connect(":memory:")
+    try:
+        source.backup(target, pages=pages, sleep=sleep)
+        return target.serialize()
+    finally:
+        target.close()
+        source.close()
+
+
+class MultipartUpload(io.RawIOBase):
+    """A stream that uploads what's written to it as the parts of an S3 multipart upload.
+
+    Use `multipart_upload()`, which completes the upload when the stream is closed, or aborts it on an exception.
+    """
+
+    def __init__(self, client: BaseClient, bucket: str, key: str, metadata: dict[str, str], part_size: int) -> None:
+        """Start the upload.
+
+        Args:
+            client (BaseClient): The S3 client.
+            bucket (str): The bucket.
+            key (str): The key of the object being uploaded.
+            metadata (dict[str, str]): The object's metadata.
+            part_size (int): The size of each part, other than the last.
+        """
+        super().__init__()
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = part_size
+        self.bytes_written = 0
+        self._buffer = bytearray()
+        self._parts: list[dict[str, str | int]] = []
+        self._upload_id = client.create_multipart_upload(Bucket=bucket, Key=key, Metadata=metadata)["UploadId"]
+
+    def writable(self) -> bool:
+        """Return True, as the stream is writable."""
+        return True
+
+    def write(self, data: Buffer) -> int:
+        """Buffer data, uploading a part whenever a part's worth has been buffered.
+
+        Args:
+            data (Buffer): The data.
+
+        Returns:
+            int: The number of bytes written, which is all of them.
+        """
+        data = memoryview(data)
+        self._buffer += data
+        self.bytes_written += len(data)
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[: self.part_size]))
+            del self._buffer[: self.part_size]
+
+        return len(data)
+
+    def _upload_part(self, body: bytes) -> None:
+        """Upload the next part."""
+        part_number = len(self._parts) + 1
+        response = self.client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+    def close(self) -> None:
+        """Upload the last part and complete the upload."""
+        if self.closed:
+            return
+
+        if self._buffer or not self._parts:
+            self._upload_part(bytes(self._buffer))
+            self._buffer.clear()
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+        super().close()
+
+    def abort(self) -> None:
+        """Abort the upload, so the parts that were uploaded are removed."""
+        self.client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id)
+        self._buffer.clear()
+        super().close()
+
+
+@contextmanager
+def multipart_upload(
+    client: BaseClient,
+    bucket: str,
+    key: str,
+    metadata: dict[str, str] | None = None,
+    part_size: int = PART_SIZE,
+) -> Iterator[MultipartUpload]:
+    """Upload what's written to the stream, completing the upload at the end of the block, or aborting it on error.
+
+    Args:
+        client (BaseClient): The S3 client.
+        bucket (str): The bucket.
+        key (str): The key of the object being uploaded.
+        metadata (dict[str, str] | None): The object's metadata.
+        part_size (int): The size of each part, other than the last.
+
+    Yields:
+        MultipartUpload: The stream.
+    """
+    upload = MultipartUpload(client, bucket, key, metadata or {}, part_size)
+    try:
+        yield upload
+    except BaseException:
+        upload.abort()
+        raise
+    upload.close()
+
+
+def write_archive(data: bytes, name: str, fileobj: io.RawIOBase) -> None:
+    """Write a copy of the database to a stream as a compressed tar archive, as `tar --gzip -xf` expects.
+
+    Args:
+        data (bytes): The copy of the database file.
+        name (str): The name of the file in the archive.
+        fileobj (io.RawIOBase): The stream.
+    """
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    with tarfile.open(fileobj=fileobj, mode="w|gz", compresslevel=COMPRESS_LEVEL) as archive:
+        archive.addfile(info, io.BytesIO(data))
+
+
+@dataclass(frozen=True)
+class BackupResult:
+    """The result of a backup.
+
+    Attributes:
+        keys (list[str]): The keys the backup was stored under.
+        sha256 (str): The SHA-256 of the database copy.
+        size (int): The size of the database copy, in bytes.
+        uploaded (int): The number of compressed bytes uploaded, which is 0 if the database hadn't changed.
+    """
+
+    keys: list[str]
+    sha256: str
+    size: int
+    uploaded: int
+
+    @property
+    def unchanged(self) -> bool:
+        """Whether the latest backup was copied rather than uploaded."""
+        return not self.uploaded
+
+
+@dataclass
+class DatabaseBackup:
+    """Backs up a database to a bucket.
+
+    A backup that runs repeatedly, such as with the `--interval` option of the `backup_database` command, keeps a
+    connection to the database open, and doesn't copy the database at all when `PRAGMA data_version` shows that
+    nothing has been committed since the last backup.
+
+    Attributes:
+        client (BaseClient): The S3 client.
+        bucket (str): The bucket.
+        path (Path): The path to the database.
+        part_size (int): The size of each part of the upload.
+    """
+
+    client: BaseClient
+    bucket: str
+    path: Path
+    part_size: int = PART_SIZE
+    _connection: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+    _data_version: int | None = field(default=None, init=False, repr=False)
+
+    @property
+    def db_name(self) -> str:
+        """The name of the database, without the extension."""
+        return self.path.stem
+
+    @property
+    def manifest_key(self) -> str:
+        """The key of the manifest of the latest backup."""
+        return MANIFEST_KEY.format(db_name=self.db_name)
+
+    def read_manifest(self) -> dict[str, str | int] | None:
+        """Read the manifest of the latest backup.
+
+        Returns:
+            dict[str, str | int] | None: The manifest, or None if there hasn't been a backup.
+        """
+        return read_json(self.client, self.bucket, self.manifest_key)
+
+    def data_version(self) -> int:
+        """Return the data version of the database, which changes whenever another connection commits."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+        return self._connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def run(self, now: datetime | None = None, *, force: bool = False) -> BackupResult:
+        """Back up the database, unless it hasn't changed since the latest backup.
+
+        Args:
+            now (datetime | None): When the backup is taken. Defaults to now.
+            force (bool): Upload the backup even if the database hasn't changed.
+
+        Returns:
+            BackupResult: The result.
+        """
+        now = now or timezone.now()
+        keys = backup_keys(self.db_name, now)
+        manifest = self.read_manifest()
+        data_version = self.data_version()
+
+        if not force and manifest is not None and data_version == self._data_version:
+            # Nothing has been committed since this process took the latest backup
+            self._copy_latest(manifest, keys, now)
+            return BackupResult(keys, str(manifest["sha256"]), int(manifest["size"]), 0)
+
+        data = snapshot(self.path)
+        sha256 = hashlib.sha256(data).hexdigest()
+        self._data_version = data_version
+
+        if not force and manifest is not None and manifest["sha256"] == sha256:
+            self._copy_latest(manifest, keys, now)
+            return BackupResult(keys, sha256, len(data), 0)
+
+        with multipart_upload(self.client, self.bucket, keys[0], {"sha256": sha256}, self.part_size) as upload:
+            write_archive(data, self.path.name, upload)
+        for key in keys[1:]:
+            self._copy(keys[0], key)
+
+        self._write_manifest(keys[0], sha256, len(data), now)
+        return BackupResult(keys, sha256, len(data), upload.bytes_written)
+
+    def _copy_latest(self, manifest: dict[str, str | int], keys: list[str], now: datetime) -> None:
+        """Copy the latest backup to the keys of this backup, and record the hourly key as the latest."""
+        latest = str(manifest["key"])
+        for key in keys:
+            if key != latest:
+                self._copy(latest, key)
+
+        self._write_manifest(keys[0], str(manifest["sha256"]), int(manifest["size"]), now)
+
+    def _copy(self, source: str, key: str) -> None:
+        """Copy an object within the bucket."""
+        self.client.copy_object(Bucket=self.bucket, Key=key, CopySource={"Bucket": self.bucket, "Key": source})
+
+    def _write_manifest(self, key: str, sha256: str, size: int, now: datetime) -> None:
+        """Record the latest backup."""
+        manifest = {"key": key, "sha256": sha256, "size": size, "created": now.isoformat()}
+        write_json(self.client, self.bucket, self.manifest_key, manifest)
+
+    def close(self) -> None:
+        """Close the connection used to check the data version."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
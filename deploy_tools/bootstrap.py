@@ -0,0 +1,173 @@
+"""The steps run by the `bootstrap` management command before the server starts.
+
+Each step skips its work when there's nothing to do, so a restart with an unchanged image and database is quick. Each
+returns a short description of what it did.
+"""
+
+import hashlib
+import json
+import pkgutil
+from datetime import datetime
+from importlib import import_module
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.staticfiles.finders import get_finders
+from django.contrib.staticfiles.storage import ManifestFilesMixin, staticfiles_storage
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.recorder import MigrationRecorder
+from django.utils import timezone
+
+from config.cache_backend import TieredSQLiteCache
+from deploy_tools import restore
+from deploy_tools.backup import get_client
+
+# Written to STATIC_ROOT after collecting the static files
+STATIC_FINGERPRINT_NAME = "staticfiles.fingerprint.json"
+
+
+def restore_database() -> str:
+    """Restore the SQLite database from the latest backup, if the database file doesn't exist.
+
+    This has to run before anything opens a connection to the database, which would create an empty database. Set
+    `RESTORE_TO` to an ISO 8601 time to restore the database as it was at that time.
+
+    Returns:
+        str: What was done.
+    """
+    database = settings.DATABASES["default"]
+    if "sqlite" not in database["ENGINE"]:
+        return "skipped, not a SQLite database"
+
+    path = Path(database["NAME"])
+    if path.exists():
+        return f"skipped, {path.name} exists"
+
+    if not settings.AWS_ENDPOINT_URL or not settings.S3_BUCKET:
+        return "skipped, no backup bucket is configured"
+
+    to = datetime.fromisoformat(settings.RESTORE_TO) if settings.RESTORE_TO else None
+    if to is not None and timezone.is_naive(to):
+        to = timezone.make_aware(to)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    result = restore.restore_database(get_client(), settings.S3_BUCKET, path, to)
+    return result if path.exists() else f"{result}, starting with an empty database"
+
+
+def create_caches() -> str:
+    """Create the cache tables and databases.
+
+    Returns:
+        str: What was done.
+    """
+    call_command("createcachetable", verbosity=0)
+    for alias in settings.CACHES:
+        cache = caches[alias]
+        if isinstance(cache, TieredSQLiteCache):
+            cache.create_database()
+
+    return f"{len(settings.CACHES)} caches ready"
+
+
+def migration_files() -> set[tuple[str, str]]:
+    """Find the migrations on disk, without importing them.
+
+    Returns:
+        set[tuple[str, str]]: The app label and name of each migration.
+    """
+    migrations: set[tuple[str, str]] = set()
+    for app_config in apps.get_app_configs():
+        module_name, _ = MigrationLoader.migrations_module(app_config.label)
+        if module_name is None:
+            continue
+
+        try:
+            module = import_module(module_name)
+        except ModuleNotFoundError:
+            continue
+
+        if hasattr(module, "__path__"):
+            migrations.update(
+                (app_config.label, name)
+                for _, name, is_package in pkgutil.iter_modules(module.__path__)
+                if not is_package and name[0] not in "_~"
+            )
+
+    return migrations
+
+
+def migrate() -> str:
+    """Apply the migrations, unless every migration on disk has already been applied.
+
+    Comparing the migration files with the applied migrations takes a single query, where `migrate` imports every
+    migration and builds the whole project state before finding there's nothing to do.
+
+    Returns:
+        str: What was done.
+    """
+    on_disk = migration_files()
+    unapplied = on_disk - MigrationRecorder(connection).applied_migrations().keys()
+    if not unapplied:
+        return f"skipped, all {len(on_disk)} migrations applied"
+
+    call_command("migrate", interactive=False, verbosity=0)
+    return f"applied migrations, {len(unapplied)} were unapplied"
+
+
+def static_fingerprint() -> str:
+    """Return a fingerprint of the static files that `collectstatic` would collect, and how it would store them.
+
+    Returns:
+        str: The fingerprint.
+    """
+    ignore_patterns = apps.get_app_config("staticfiles").ignore_patterns
+    found = {}
+    for finder in get_finders():
+        for path, storage in finder.list(ignore_patterns):
+            prefix = getattr(storage, "prefix", None)
+            # As in collectstatic, the first file found with each name is the one that's collected
+            found.setdefault(f"{prefix}/{path}" if prefix else path, (path, storage))
+
+    digest = hashlib.sha256(json.dumps([settings.STORAGES["staticfiles"], settings.STATIC_URL]).encode())
+    for name, (path, storage) in sorted(found.items()):
+        digest.update(name.encode())
+        with storage.open(path) as file:
+            digest.update(hashlib.file_digest(file, "sha256").digest())
+
+    return digest.hexdigest()
+
+
+def manifest_hash() -> str:
+    """Return the hash of the static files manifest.
+
+    Returns:
+        str: The hash, or an empty string if there's no manifest.
+    """
+    if not isinstance(staticfiles_storage, ManifestFilesMixin):
+        return ""
+
+    _, manifest = staticfiles_storage.load_manifest()
+    return manifest
+
+
+def collect_static() -> str:
+    """Collect the static files, unless they and the manifest are unchanged since they were last collected.
+
+    Returns:
+        str: What was done.
+    """
+    fingerprint_path = Path(settings.STATIC_ROOT) / STATIC_FINGERPRINT_NAME
+    expected = {"source": static_fingerprint(), "manifest": manifest_hash()}
+
+    if fingerprint_path.exists() and json.loads(fingerprint_path.read_text()) == expected:
+        return f"skipped, unchanged since they were collected (manifest {expected['manifest'] or 'not used'})"
+
+    call_command("collectstatic", interactive=False, verbosity=0)
+    expected["manifest"] = manifest_hash()
+    fingerprint_path.write_text(json.dumps(expected))
+    return f"collected (manifest {expected['manifest'] or 'not used'})"
@@ -0,0 +1,75 @@
+"""System checks for the deploy_tools app."""
+
+import re
+from typing import TYPE_CHECKING, Any
+
+from django.contrib.staticfiles.storage import ManifestFilesMixin, staticfiles_storage
+from django.core.checks import Error, Tags, register
+
+from deploy_tools.template_files import iter_template_files
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from django.apps import AppConfig
+    from django.core.checks import CheckMessage
+
+# Only literal names can be checked, `{% static variable %}` is resolved at render time
+STATIC_TAG_RE = re.compile(r"""{%\s*static\s+(["'])(?P<name>[^"']+)\1""")
+
+
+def find_static_references() -> dict[str, set[str]]:
+    """Find the static files referenced by the templates.
+
+    Returns:
+        dict[str, set[str]]: The templates that reference each static file, keyed by the static file's name.
+    """
+    references: dict[str, set[str]] = {}
+
+    for template_name, path in iter_template_files():
+        try:
+            content = path.read_text(encoding="utf-8")
+        except UnicodeDecodeError:
+            continue
+
+        for match in STATIC_TAG_RE.finditer(content):
+            references.setdefault(match["name"], set()).add(template_name)
+
+    return references
+
+
+@register(Tags.staticfiles, deploy=True)
+def check_static_references(app_configs: Sequence[AppConfig] | None, **kwargs: Any) -> list[CheckMessage]:  # noqa: ANN401, ARG001
+    """Check every static file referenced by a template is in the static files manifest.
+
+    A missing file would otherwise only be found when the template is rendered, as the manifest storage raises an
+    exception for names that aren't in the manifest.
+
+    Args:
+        app_configs (Sequence[AppConfig] | None): The apps to check, unused as the templates are checked as a whole.
+        **kwargs: Unused.
+
+    Returns:
+        list[CheckMessage]: An error for each missing file.
+    """
+    if not isinstance(staticfiles_storage, ManifestFilesMixin):
+        return []
+
+    paths, _ = staticfiles_storage.load_manifest()
+    if not paths:
+        return [
+            Error(
+                "The static files manifest is missing or empty.",
+                hint="Run `manage.py collectstatic` before checking the static file references.",
+                id="deploy_tools.E001",
+            )
+        ]
+
+    return [
+        Error(
+            f"'{name}' is referenced by {', '.join(sorted(templates))} but isn't in the static files manifest.",
+            id="deploy_tools.E002",
+        )
+        for name, templates in sorted(find_static_references().items())
+        if staticfiles_storage.clean_name(name) not in paths
+    ]
@@ -0,0 +1,61 @@
+import io
+
+import pytest
+from botocore.exceptions import ClientError
+
+
+class LocalS3:
+    """A stand-in for an S3 client, keeping the objects in memory."""
+
+    def __init__(self):
+        self.objects = {}
+        self.metadata = {}
+        self.uploads = {}
+        self.calls = []
+
+    def create_multipart_upload(self, Bucket, Key, Metadata):
+        self.calls.append("create_multipart_upload")
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {"key": Key, "metadata": Metadata, "parts": {}}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.calls.append("upload_part")
+        self.uploads[UploadId]["parts"][PartNumber] = Body
+        return {"ETag": f'"{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.calls.append("complete_multipart_upload")
+        upload = self.uploads.pop(UploadId)
+        parts = [upload["parts"][part["PartNumber"]] for part in MultipartUpload["Parts"]]
+        self.objects[Key] = b"".join(parts)
+        self.metadata[Key] = upload["metadata"]
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.calls.append("abort_multipart_upload")
+        del self.uploads[UploadId]
+
+    def copy_object(self, Bucket, Key, CopySource):
+        self.calls.append("copy_object")
+        self.objects[Key] = self.objects[CopySource["Key"]]
+        self.metadata[Key] = self.metadata[CopySource["Key"]]
+
+    def put_object(self, Bucket, Key, Body, ContentType=None):
+        self.objects[Key] = Body
+        self.metadata[Key] = {}
+
+    def delete_objects(self, Bucket, Delete):
+        self.calls.append("delete_objects")
+        for item in Delete["Objects"]:
+            self.objects.pop(item["Key"], None)
+            self.metadata.pop(item["Key"], None)
+
+    def get_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+
+@pytest.fixture
+def s3():
+    return LocalS3()
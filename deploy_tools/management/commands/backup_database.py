@@ -0,0 +1,71 @@
+"""Management command to back up the database to S3."""
+
+import time
+from pathlib import Path
+from typing import Any, ClassVar
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS
+
+from deploy_tools.backup import DatabaseBackup, get_client
+
+
+class Command(BaseCommand):
+    """Back up the SQLite database to the S3 bucket, while the site keeps running.
+
+    The upload is skipped when the database hasn't changed since the latest backup, and the latest backup is copied to
+    this hour's keys instead.
+    """
+
+    help = "Backs up the SQLite database to S3, skipping the upload if the database hasn't changed"
+
+    # The backup container doesn't need the checks, which would import every app's checks on each run
+    requires_system_checks: ClassVar[list[str]] = []
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The alias of the SQLite database to back up. Defaults to the default database.",
+        )
+        parser.add_argument("--force", action="store_true", help="Upload the backup even if nothing has changed.")
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Keep running, backing up every this many seconds. Defaults to backing up once.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
+        """Handle the command execution."""
+        if not settings.S3_BUCKET:
+            msg = "S3_BUCKET isn't set"
+            raise CommandError(msg)
+
+        database = settings.DATABASES[options["database"]]
+        if "sqlite" not in database["ENGINE"]:
+            msg = f"{options['database']} isn't a SQLite database"
+            raise CommandError(msg)
+
+        backup = DatabaseBackup(get_client(), settings.S3_BUCKET, Path(database["NAME"]))
+        try:
+            while True:
+                start = time.perf_counter()
+                result = backup.run(force=options["force"])
+                elapsed = time.perf_counter() - start
+
+                if result.unchanged:
+                    self.stdout.write(f"Unchanged since the latest backup, copied to {', '.join(result.keys)}")
+                else:
+                    self.stdout.write(
+                        f"Uploaded {result.uploaded:,} bytes ({result.size:,} uncompressed) "
+                        f"to {', '.join(result.keys)} in {elapsed:.2f}s",
+                    )
+
+                if not options["interval"]:
+                    break
+                time.sleep(options["interval"])
+        finally:
+            backup.close()
@@ -0,0 +1,67 @@
+"""Management command to profile how long it takes to start Django."""
+
+from pathlib import Path
+from typing import Any, ClassVar
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from deploy_tools.profiling import profile_startup
+
+
+class Command(BaseCommand):
+    """Profile setting up Django and importing the URLconf in a new interpreter.
+
+    Reports the startup phases, such as loading the settings and importing and getting ready each app, the packages
+    that take the longest to import, and the slowest top-level imports. The full profile can be written as JSON to
+    track regressions.
+    """
+
+    help = "Profiles the import times and setup phases of starting Django"
+
+    # Django is profiled in a new interpreter, so there's nothing to check in this one
+    requires_system_checks: ClassVar[list[str]] = []
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=15,
+            help="Number of packages and imports to report.",
+        )
+        parser.add_argument(
+            "--json",
+            type=Path,
+            help="Write the full profile as JSON to this file.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
+        """Handle the command execution."""
+        profile = profile_startup()
+        limit = options["limit"]
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Phases (nested phases are included in their parents)"))
+        for name, seconds in sorted(profile.phases.items(), key=lambda item: item[1], reverse=True):
+            self.stdout.write(f"{seconds * 1000:9.1f} ms  {name}")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Packages"))
+        for package, microseconds in list(profile.packages().items())[:limit]:
+            self.stdout.write(f"{microseconds / 1000:9.1f} ms  {package}")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Top-level imports, including the modules they import"))
+        top_level = sorted(
+            (item for item in profile.imports if item.depth == 0),
+            key=lambda item: item.cumulative_us,
+            reverse=True,
+        )
+        for item in top_level[:limit]:
+            self.stdout.write(f"{item.cumulative_us / 1000:9.1f} ms  {item.module}")
+
+        total = sum(item.cumulative_us for item in profile.imports if item.depth == 0)
+        self.stdout.write(
+            self.style.SUCCESS(f"Imported {len(profile.imports)} modules in {total / 1000:.1f} ms"),
+        )
+
+        if options["json"]:
+            options["json"].write_text(profile.to_json())
+            self.stdout.write(f"Wrote the profile to {options['json']}")
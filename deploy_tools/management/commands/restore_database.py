@@ -0,0 +1,60 @@
+"""Management command to restore the database from S3."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, ClassVar
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+
+from deploy_tools.backup import get_client
+from deploy_tools.restore import restore_database
+
+
+class Command(BaseCommand):
+    """Restore the SQLite database from the newest backup in the S3 bucket, or as it was at a point in time.
+
+    The database must not exist, so a running site's database is never replaced.
+    """
+
+    help = "Restores the SQLite database from S3, optionally to a point in time"
+
+    # This runs before the database exists, and doesn't need the checks
+    requires_system_checks: ClassVar[list[str]] = []
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The alias of the SQLite database to restore. Defaults to the default database.",
+        )
+        parser.add_argument(
+            "--to",
+            type=datetime.fromisoformat,
+            help="Restore the database as it was at this ISO 8601 time. Defaults to the latest backup.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
+        """Handle the command execution."""
+        if not settings.S3_BUCKET:
+            msg = "S3_BUCKET isn't set"
+            raise CommandError(msg)
+
+        database = settings.DATABASES[options["database"]]
+        path = Path(database["NAME"])
+        if "sqlite" not in database["ENGINE"]:
+            msg = f"{options['database']} isn't a SQLite database"
+            raise CommandError(msg)
+        if path.exists():
+            msg = f"{path} already exists"
+            raise CommandError(msg)
+
+        to = options["to"]
+        if to is not None and timezone.is_naive(to):
+            to = timezone.make_aware(to)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.stdout.write(restore_database(get_client(), settings.S3_BUCKET, path, to))
@@ -0,0 +1,61 @@
+"""Management command to ship the database's write-ahead log to S3."""
+
+import time
+from pathlib import Path
+from typing import Any, ClassVar
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS
+
+from deploy_tools.backup import get_client
+from deploy_tools.wal import WalShipper
+
+
+class Command(BaseCommand):
+    """Ship the SQLite WAL to the S3 bucket as it's written, so the database can be restored to any point in time.
+
+    This runs until it's stopped, alongside the site, on the same database volume.
+    """
+
+    help = "Ships the SQLite write-ahead log to S3 until stopped"
+
+    # Like backup_database, this runs in its own container and doesn't need the checks
+    requires_system_checks: ClassVar[list[str]] = []
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The alias of the SQLite database to ship. Defaults to the default database.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="The number of seconds between checks for new transactions. Defaults to 1.",
+        )
+        parser.add_argument("--once", action="store_true", help="Ship what's in the WAL now, then stop.")
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
+        """Handle the command execution."""
+        if not settings.S3_BUCKET:
+            msg = "S3_BUCKET isn't set"
+            raise CommandError(msg)
+
+        database = settings.DATABASES[options["database"]]
+        if "sqlite" not in database["ENGINE"]:
+            msg = f"{options['database']} isn't a SQLite database"
+            raise CommandError(msg)
+
+        shipper = WalShipper(get_client(), settings.S3_BUCKET, Path(database["NAME"]))
+        try:
+            while True:
+                if shipped := shipper.ship():
+                    self.stdout.write(f"Shipped {shipped:,} bytes of WAL")
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+        finally:
+            shipper.close()
@@ -0,0 +1,69 @@
+"""Static files middleware."""
+
+from pathlib import Path
+from wsgiref.headers import Headers
+
+from whitenoise.middleware import WhiteNoiseMiddleware
+from whitenoise.responders import MissingFileError, StaticFile
+
+# Content codings and the suffixes of their variants, as built by `CompressedManifestStorage`
+ENCODINGS = {"zstd": ".zst", "gzip": ".gz"}
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoise middleware that also serves the Zstandard variants built by `CompressedManifestStorage`.
+
+    WhiteNoise serves hashed files with `Cache-Control: immutable`, and each request gets the smallest variant its
+    `Accept-Encoding` header allows.
+    """
+
+    @staticmethod
+    def is_compressed_variant(path: str, stat_cache: dict | None = None) -> bool:
+        """Return whether a file is a compressed variant of another file, so it isn't served under its own URL.
+
+        Args:
+            path (str): The path of the file.
+            stat_cache (dict | None): WhiteNoise's stat cache, if the files have been scanned.
+
+        Returns:
+            bool: Whether the file is a compressed variant.
+        """
+        for suffix in ENCODINGS.values():
+            if path.endswith(suffix):
+                uncompressed_path = path.removesuffix(suffix)
+                if stat_cache is None:
+                    return Path(uncompressed_path).is_file()
+                return uncompressed_path in stat_cache
+        return False
+
+    def get_static_file(self, path: str, url: str, stat_cache: dict | None = None) -> StaticFile:
+        """Return a static file along with its compressed variants.
+
+        Args:
+            path (str): The path of the file.
+            url (str): The URL of the file.
+            stat_cache (dict | None): WhiteNoise's stat cache, if the files have been scanned.
+
+        Returns:
+            StaticFile: The static file.
+
+        Raises:
+            MissingFileError: If the file doesn't exist.
+        """
+        if stat_cache is None and not Path(path).exists():
+            raise MissingFileError(path)
+
+        headers = Headers([])
+        self.add_mime_headers(headers, path, url)
+        self.add_cache_headers(headers, path, url)
+        if self.allow_all_origins:
+            headers["Access-Control-Allow-Origin"] = "*"
+        if self.add_headers_function is not None:
+            self.add_headers_function(headers, path, url)
+
+        return StaticFile(
+            path,
+            headers.items(),
+            stat_cache=stat_cache,
+            encodings={encoding: path + suffix for encoding, suffix in ENCODINGS.items()},
+        )
@@ -0,0 +1,142 @@
+"""Profiling how long it takes to start Django.
+
+The startup is profiled in a new interpreter, run with `-X importtime`, as everything has already been imported by
+the process running the management command.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from importlib import import_module
+
+from django.conf import settings
+
+from config.startup import PHASES, phase
+
+# Run by the new interpreter
+PROFILE_CODE = "from deploy_tools.profiling import run_startup; run_startup()"
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    """The time taken to import a module.
+
+    Attributes:
+        module (str): The module name
+        self_us (int): The time taken by the module itself, in microseconds
+        cumulative_us (int): The time taken by the module and the modules it imported, in microseconds
+        depth (int): How deeply nested the import was, where 0 is a module imported by the startup code itself
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class StartupProfile:
+    """The profile of starting Django.
+
+    Attributes:
+        phases (dict[str, float]): The time taken by each phase, in seconds. Phases can be nested in other phases.
+        imports (list[ImportTime]): The time taken to import each module, in the order they were imported
+    """
+
+    phases: dict[str, float]
+    imports: list[ImportTime]
+
+    def packages(self) -> dict[str, int]:
+        """Return the total import time of each top-level package, slowest first.
+
+        Returns:
+            dict[str, int]: The time taken by the modules in each package, in microseconds.
+        """
+        totals: dict[str, int] = {}
+        for item in self.imports:
+            package = item.module.split(".", 1)[0]
+            totals[package] = totals.get(package, 0) + item.self_us
+
+        return dict(sorted(totals.items(), key=lambda total: total[1], reverse=True))
+
+    def to_json(self) -> str:
+        """Return the profile as JSON, for tracking regressions.
+
+        Returns:
+            str: The JSON.
+        """
+        return json.dumps(
+            {
+                "python": sys.version.split()[0],
+                "phases": dict(sorted(self.phases.items(), key=lambda item: item[1], reverse=True)),
+                "packages": self.packages(),
+                "imports": [asdict(item) for item in sorted(self.imports, key=lambda i: i.cumulative_us, reverse=True)],
+            },
+            indent=2,
+        )
+
+
+def run_startup() -> None:
+    """Set up Django and import the URLconf, then print the phase timings as JSON.
+
+    This is run in the new interpreter.
+    """
+    import django  # noqa: PLC0415
+
+    with phase("django.setup"):
+        django.setup()
+
+    with phase(f"urlconf: {settings.ROOT_URLCONF}"):
+        import_module(settings.ROOT_URLCONF)
+
+    sys.stdout.write(f"{json.dumps(PHASES)}\n")
+
+
+def parse_import_times(output: str) -> list[ImportTime]:
+    """Parse the output of `python -X importtime`.
+
+    Args:
+        output (str): The output, which is written to stderr.
+
+    Returns:
+        list[ImportTime]: The time taken to import each module.
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|", 2)
+        if not self_us.strip().isdigit():
+            # The header line
+            continue
+
+        module = name.lstrip()
+        depth = (len(name) - len(module) - 1) // 2
+        imports.append(ImportTime(module.rstrip(), int(self_us), int(cumulative_us), depth))
+
+    return imports
+
+
+def profile_startup() -> StartupProfile:
+    """Profile starting Django in a new interpreter, with `STARTUP_PROFILE` set.
+
+    Returns:
+        StartupProfile: The profile.
+    """
+    env = {**os.environ, "STARTUP_PROFILE": "true"}
+    env.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", PROFILE_CODE],
+        capture_output=True,
+        check=True,
+        cwd=settings.BASE_DIR,
+        env=env,
+        text=True,
+    )
+
+    # Anything else printed during startup comes before the phases
+    phases = json.loads(result.stdout.strip().splitlines()[-1])
+    return StartupProfile(phases=phases, imports=parse_import_times(result.stderr))
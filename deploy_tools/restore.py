@@ -0,0 +1,182 @@
+"""Restoring the SQLite database from S3.
+
+The restore uses the newest of the WAL generations shipped by `ship_wal` and the latest hourly backup taken by
+`backup_database`, going by their manifests. A generation's snapshot is decompressed as it's downloaded, and then its
+segments are replayed over it, up to a point in time if one is given. Each WAL in the segments is written next to the
+restored database and checkpointed into it by SQLite, which checks every frame as it does.
+
+The database is restored to a file next to the database, which replaces the database once it's complete.
+"""
+
+import contextlib
+import shutil
+import sqlite3
+import tarfile
+import zlib
+from datetime import datetime
+from itertools import takewhile
+from typing import TYPE_CHECKING, Any
+
+from deploy_tools.backup import MANIFEST_KEY, read_json
+from deploy_tools.wal import generations_key
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from botocore.client import BaseClient
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def decompress_object(client: BaseClient, bucket: str, key: str, fileobj: Any) -> int:  # noqa: ANN401
+    """Download a gzipped object, decompressing it into a file as it's downloaded.
+
+    Args:
+        client (BaseClient): The S3 client.
+        bucket (str): The bucket.
+        key (str): The key of the object.
+        fileobj (Any): The file to write to.
+
+    Returns:
+        int: The number of decompressed bytes written.
+    """
+    body = client.get_object(Bucket=bucket, Key=key)["Body"]
+    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    written = 0
+    while chunk := body.read(CHUNK_SIZE):
+        written += fileobj.write(decompressor.decompress(chunk))
+    written += fileobj.write(decompressor.flush())
+    return written
+
+
+def extract_archive(client: BaseClient, bucket: str, key: str, fileobj: Any) -> None:  # noqa: ANN401
+    """Download an hourly backup, extracting the database from the archive into a file as it's downloaded.
+
+    Args:
+        client (BaseClient): The S3 client.
+        bucket (str): The bucket.
+        key (str): The key of the backup.
+        fileobj (Any): The file to write to.
+    """
+    body = client.get_object(Bucket=bucket, Key=key)["Body"]
+    with tarfile.open(fileobj=body, mode="r|gz") as archive:
+        for member in archive:
+            if member.isfile():
+                shutil.copyfileobj(archive.extractfile(member), fileobj, CHUNK_SIZE)
+                return
+
+
+def replay_segments(client: BaseClient, bucket: str, segments: list[dict[str, Any]], path: Path) -> None:
+    """Replay WAL segments over a database.
+
+    The segments of each WAL are written to the database's WAL file, and checkpointed into the database.
+
+    Args:
+        client (BaseClient): The S3 client.
+        bucket (str): The bucket.
+        segments (list[dict[str, Any]]): The segments, from the generation manifest.
+        path (Path): The path to the database.
+    """
+    wal_path = path.with_name(f"{path.name}-wal")
+    index = 0
+    while index < len(segments):
+        # A WAL's segments run up to the next segment that starts a new WAL
+        end = index + 1
+        while end < len(segments) and not segments[end]["new_wal"]:
+            end += 1
+
+        with wal_path.open("wb") as wal:
+            for segment in segments[index:end]:
+                decompress_object(client, bucket, segment["key"], wal)
+
+        connection = sqlite3.connect(path, isolation_level=None)
+        try:
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        finally:
+            connection.close()
+        index = end
+
+
+def latest_backup(
+    client: BaseClient,
+    bucket: str,
+    db_name: str,
+    to: datetime | None,
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """Find the latest generation and the latest hourly backup.
+
+    Args:
+        client (BaseClient): The S3 client.
+        bucket (str): The bucket.
+        db_name (str): The name of the database, without the extension.
+        to (datetime | None): The point in time to restore to, or None for the latest.
+
+    Returns:
+        tuple[dict[str, Any] | None, dict[str, Any] | None]: The manifest of the newest generation that started before
+            the point in time, and the manifest of the hourly backup, unless a point in time was given.
+    """
+    generation = None
+    for entry in reversed(read_json(client, bucket, generations_key(db_name)) or []):
+        manifest = read_json(client, bucket, entry["manifest"])
+        if manifest is not None and (to is None or datetime.fromisoformat(manifest["created"]) <= to):
+            generation = manifest
+            break
+
+    # The hourly backups are overwritten, so they're only used for the latest point in time
+    backup = read_json(client, bucket, MANIFEST_KEY.format(db_name=db_name)) if to is None else None
+    return generation, backup
+
+
+def last_change(generation: dict[str, Any]) -> datetime:
+    """Return the time of the last segment in a generation, or of its snapshot."""
+    segments = generation["segments"]
+    return datetime.fromisoformat(segments[-1]["created"] if segments else generation["created"])
+
+
+def restore_database(client: BaseClient, bucket: str, path: Path, to: datetime | None = None) -> str:
+    """Restore the database from the newest backup.
+
+    Args:
+        client (BaseClient): The S3 client.
+        bucket (str): The bucket.
+        path (Path): The path to restore the database to.
+        to (datetime | None): Restore the database as it was at this time, rather than the latest.
+
+    Returns:
+        str: What was restored.
+    """
+    generation, backup = latest_backup(client, bucket, path.stem, to)
+    if generation is None and backup is None:
+        return "no backup found"
+
+    restoring = path.with_name(f"{path.name}.restoring")
+    try:
+        if generation is not None and (
+            backup is None or last_change(generation) >= datetime.fromisoformat(backup["created"])
+        ):
+            with restoring.open("wb") as snapshot:
+                decompress_object(client, bucket, generation["snapshot"]["key"], snapshot)
+            segments = list(
+                takewhile(
+                    lambda segment: to is None or datetime.fromisoformat(segment["created"]) <= to,
+                    generation["segments"],
+                ),
+            )
+            replay_segments(client, bucket, segments, restoring)
+            message = f"restored WAL generation {generation['generation']} with {len(segments)} segments"
+        else:
+            with restoring.open("wb") as database:
+                extract_archive(client, bucket, backup["key"], database)
+            message = f"restored backup {backup['key']}"
+
+        restoring.replace(path)
+    finally:
+        for leftover in (
+            restoring,
+            restoring.with_name(f"{restoring.name}-wal"),
+            restoring.with_name(f"{restoring.name}-shm"),
+        ):
+            with contextlib.suppress(FileNotFoundError):
+                leftover.unlink()
+
+    return message
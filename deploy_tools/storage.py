@@ -0,0 +1,70 @@
+"""Static files storage.
+
+Collected files get content-hashed names, so they can be cached forever, and their compressed variants are built by
+`collectstatic` rather than on every request.
+"""
+
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+from whitenoise.compress import Compressor
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+# Zstandard is in the standard library from Python 3.14
+ZSTD_AVAILABLE = find_spec("compression") is not None
+
+if ZSTD_AVAILABLE:
+    from compression import zstd
+
+ZSTD_LEVEL = 19
+
+
+class StaticCompressor(Compressor):
+    """WhiteNoise's compressor, adding a Zstandard variant alongside the gzip one."""
+
+    def __init__(self, *args: Any, use_zstd: bool = True, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialise the compressor.
+
+        Args:
+            *args: Passed to WhiteNoise's compressor.
+            use_zstd (bool): Whether to build Zstandard variants, if the standard library supports it.
+            **kwargs: Passed to WhiteNoise's compressor.
+        """
+        super().__init__(*args, **kwargs)
+        self.use_zstd = use_zstd and ZSTD_AVAILABLE
+
+    def compress(self, path: str) -> list[str]:
+        """Write the compressed variants of a file.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            list[str]: The paths of the compressed variants.
+        """
+        filenames = super().compress(path)
+        if not self.use_zstd:
+            return filenames
+
+        data = Path(path).read_bytes()
+        compressed = zstd.compress(data, level=ZSTD_LEVEL)
+        if self.is_compressed_effectively("Zstandard", path, len(data), compressed):
+            filenames.append(self.write_data(path, compressed, ".zst", Path(path).stat()))
+
+        return filenames
+
+
+class CompressedManifestStorage(CompressedManifestStaticFilesStorage):
+    """Manifest storage that builds gzip and Zstandard variants of every hashed file."""
+
+    def create_compressor(self, **kwargs: Any) -> StaticCompressor:  # noqa: ANN401
+        """Return the compressor used by `collectstatic`.
+
+        Args:
+            **kwargs: Passed to the compressor.
+
+        Returns:
+            StaticCompressor: The compressor.
+        """
+        return StaticCompressor(**kwargs)
@@ -0,0 +1,28 @@
+"""Finding the project's template files."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.template import engines
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def iter_template_files() -> Iterator[tuple[str, Path]]:
+    """Find the files in every template directory of the Django template engine.
+
+    Templates that are overridden by a template of the same name in an earlier directory are skipped, as they're never
+    rendered.
+
+    Yields:
+        tuple[str, Path]: The name and path of each template.
+    """
+    seen: set[str] = set()
+
+    for directory in engines["django"].template_dirs:
+        for path in sorted(Path(directory).rglob("*")):
+            template_name = path.relative_to(directory).as_posix()
+            if path.is_file() and template_name not in seen:
+                seen.add(template_name)
+                yield template_name, path
@@ -0,0 +1,133 @@
+"""Tests for backing up the database."""
+
+import io
+import json
+import sqlite3
+import tarfile
+from datetime import UTC, datetime
+
+import pytest
+from django.core.management import call_command
+
+from deploy_tools import backup
+from deploy_tools.backup import DatabaseBackup, backup_keys, multipart_upload
+
+NOW = datetime(2026, 3, 1, 0, 30, tzinfo=UTC)
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / "db.sqlite3"
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("CREATE TABLE post (title TEXT)")
+    connection.execute("INSERT INTO post VALUES ('First')")
+    connection.commit()
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def database_backup(s3, tmp_path, database):
+    database_backup = DatabaseBackup(s3, "backups", tmp_path / "db.sqlite3")
+    yield database_backup
+    database_backup.close()
+
+
+def restore(data, tmp_path):
+    """Extract a backup as `tar --gzip -xf` would, and return the titles of the posts in it."""
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as archive:
+        archive.extractall(tmp_path / "restored", filter="data")
+    connection = sqlite3.connect(tmp_path / "restored" / "db.sqlite3")
+    titles = [title for (title,) in connection.execute("SELECT title FROM post")]
+    connection.close()
+    return titles
+
+
+def test_backup_keys_follow_the_retention_scheme():
+    """Test backups are hourly, with daily backups at midnight and monthly backups at midnight on the first."""
+    assert backup_keys("db", datetime(2026, 3, 4, 5, tzinfo=UTC)) == ["backup-db-05.tar.gz"]
+    assert backup_keys("db", datetime(2026, 3, 4, 0, tzinfo=UTC)) == ["backup-db-00.tar.gz", "backup-db-04-00.tar.gz"]
+    assert backup_keys("db", NOW) == ["backup-db-00.tar.gz", "backup-db-01-00.tar.gz", "backup-db-03-01-00.tar.gz"]
+
+
+def test_backup_is_uploaded_and_restorable(database_backup, s3, tmp_path):
+    """Test the first backup is uploaded to every key due, and restores the database."""
+    result = database_backup.run(NOW)
+
+    assert not result.unchanged
+    assert s3.calls.count("create_multipart_upload") == 1
+    assert s3.calls.count("copy_object") == 2
+    assert restore(s3.objects["backup-db-03-01-00.tar.gz"], tmp_path) == ["First"]
+    assert s3.metadata["backup-db-00.tar.gz"] == {"sha256": result.sha256}
+    assert json.loads(s3.objects["backup-db-manifest.json"])["key"] == "backup-db-00.tar.gz"
+
+
+def test_unchanged_database_is_copied(database_backup, s3, tmp_path):
+    """Test the latest backup is copied rather than uploaded when the database hasn't changed."""
+    database_backup.run(datetime(2026, 3, 4, 5, tzinfo=UTC))
+    database_backup.close()
+    s3.calls.clear()
+
+    # A new process, which has to compare the checksums
+    result = DatabaseBackup(s3, "backups", database_backup.path).run(datetime(2026, 3, 4, 6, tzinfo=UTC))
+
+    assert result.unchanged
+    assert s3.calls == ["copy_object"]
+    assert restore(s3.objects["backup-db-06.tar.gz"], tmp_path) == ["First"]
+    assert json.loads(s3.objects["backup-db-manifest.json"])["key"] == "backup-db-06.tar.gz"
+
+
+def test_data_version_skips_the_copy(database_backup, database, s3, monkeypatch):
+    """Test a repeated backup doesn't copy the database until another connection commits."""
+    snapshots = []
+    snapshot = backup.snapshot
+    monkeypatch.setattr(backup, "snapshot", lambda path: snapshots.append(path) or snapshot(path))
+
+    database_backup.run(NOW)
+    database_backup.run(NOW)
+    assert len(snapshots) == 1
+
+    database.execute("INSERT INTO post VALUES ('Second')")
+    database.commit()
+
+    assert not database_backup.run(NOW).unchanged
+    assert len(snapshots) == 2
+
+
+def test_force_uploads_unchanged_database(database_backup, s3):
+    """Test the upload can be forced."""
+    database_backup.run(NOW)
+
+    assert not database_backup.run(NOW, force=True).unchanged
+    assert s3.calls.count("create_multipart_upload") == 2
+
+
+def test_multipart_upload_parts(s3):
+    """Test the stream is uploaded in parts of the part size, and aborted on error."""
+    with multipart_upload(s3, "backups", "object", part_size=4) as upload:
+        upload.write(b"0123456789")
+
+    assert s3.objects["object"] == b"0123456789"
+    assert s3.calls.count("upload_part") == 3
+
+    with pytest.raises(RuntimeError), multipart_upload(s3, "backups", "failed", part_size=4) as upload:
+        upload.write(b"01234")
+        raise RuntimeError
+
+    assert "failed" not in s3.objects
+    assert not s3.uploads
+
+
+def test_backup_database_command(database_backup, s3, monkeypatch, settings):
+    """Test the command backs up a database, and then finds it unchanged."""
+    settings.S3_BUCKET = "backups"
+    monkeypatch.setitem(settings.DATABASES, "backup", {"ENGINE": "config.sqlite_backend", "NAME": database_backup.path})
+    monkeypatch.setattr("deploy_tools.management.commands.backup_database.get_client", lambda: s3)
+    stdout = io.StringIO()
+
+    call_command("backup_database", "--database", "backup", stdout=stdout)
+    call_command("backup_database", "--database", "backup", stdout=stdout)
+
+    assert "Uploaded" in stdout.getvalue()
+    assert "Unchanged" in stdout.getvalue()
@@ -0,0 +1,116 @@
+"""Tests for the bootstrap command."""
+
+from datetime import UTC, datetime
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.recorder import MigrationRecorder
+
+from deploy_tools import bootstrap
+
+
+@pytest.fixture
+def static_source(settings, tmp_path):
+    source = tmp_path / "static"
+    source.mkdir()
+    (source / "styles.css").write_text("body { color: black; }")
+
+    settings.STATICFILES_DIRS = [source]
+    settings.STATICFILES_FINDERS = ["django.contrib.staticfiles.finders.FileSystemFinder"]
+    settings.STATIC_ROOT = tmp_path / "staticfiles"
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {"BACKEND": "deploy_tools.storage.CompressedManifestStorage"},
+    }
+    return source
+
+
+@pytest.fixture
+def sqlite_database(monkeypatch, settings, tmp_path):
+    """An SQLite default database that doesn't exist yet, with a backup bucket configured."""
+    path = tmp_path / "db" / "db.sqlite3"
+    monkeypatch.setitem(settings.DATABASES["default"], "ENGINE", "django.db.backends.sqlite3")
+    monkeypatch.setitem(settings.DATABASES["default"], "NAME", path)
+    settings.AWS_ENDPOINT_URL = "https://s3.example.com"
+    settings.S3_BUCKET = "backups"
+    settings.RESTORE_TO = ""
+    monkeypatch.setattr(bootstrap, "get_client", lambda: "client")
+    return path
+
+
+def test_restore_database(monkeypatch, settings, sqlite_database):
+    """Test the database is restored from the bucket, as it was at RESTORE_TO if it's set."""
+    calls = []
+
+    def restore_database(client, bucket, path, to):
+        calls.append((client, bucket, path, to))
+        path.touch()
+        return "restored backup"
+
+    monkeypatch.setattr(bootstrap.restore, "restore_database", restore_database)
+    settings.RESTORE_TO = "2026-03-01T00:30:00+00:00"
+
+    assert bootstrap.restore_database() == "restored backup"
+    assert calls == [("client", "backups", sqlite_database, datetime(2026, 3, 1, 0, 30, tzinfo=UTC))]
+    assert bootstrap.restore_database() == "skipped, db.sqlite3 exists"
+
+
+def test_restore_database_without_a_backup(monkeypatch, settings, sqlite_database):
+    """Test the bootstrap carries on with an empty database when there's no backup, or no bucket."""
+    monkeypatch.setattr(bootstrap.restore, "restore_database", lambda *args: "no backup found")
+
+    assert bootstrap.restore_database() == "no backup found, starting with an empty database"
+
+    settings.S3_BUCKET = ""
+    assert bootstrap.restore_database() == "skipped, no backup bucket is configured"
+
+
+def test_migration_files():
+    """Test the migrations are found on disk."""
+    migrations = bootstrap.migration_files()
+
+    assert ("auth", "0001_initial") in migrations
+    assert ("djpress", "0001_initial") in migrations
+    assert not [name for _, name in migrations if name.startswith("_")]
+
+
+@pytest.mark.django_db
+def test_migrate_is_skipped_when_everything_is_applied(monkeypatch):
+    """Test migrate only runs when a migration on disk hasn't been applied."""
+    commands = []
+    monkeypatch.setattr(bootstrap, "call_command", lambda *args, **kwargs: commands.append(args))
+
+    assert bootstrap.migrate().startswith("skipped")
+    assert commands == []
+
+    MigrationRecorder(connection).record_unapplied("djpress", "0001_initial")
+
+    assert bootstrap.migrate() == "applied migrations, 1 were unapplied"
+    assert commands == [("migrate",)]
+
+
+def test_collect_static_is_skipped_when_unchanged(static_source, settings):
+    """Test the static files are only collected when the source files or the manifest change."""
+    assert bootstrap.collect_static().startswith("collected")
+    assert bootstrap.collect_static().startswith("skipped")
+
+    (static_source / "styles.css").write_text("body { color: white; }")
+    assert bootstrap.collect_static().startswith("collected")
+    assert bootstrap.collect_static().startswith("skipped")
+
+    (settings.STATIC_ROOT / "staticfiles.json").unlink()
+    assert bootstrap.collect_static().startswith("collected")
+
+
+@pytest.mark.django_db
+def test_bootstrap_command_reports_each_step(static_source):
+    """Test the command runs the selected steps in order and times them."""
+    stdout = StringIO()
+
+    call_command("bootstrap", "--step", "static", "--step", "cache", "--step", "migrate", stdout=stdout)
+
+    lines = stdout.getvalue().splitlines()
+    assert [line.split()[0] for line in lines[:-1]] == ["cache", "migrate", "static"]
+    assert lines[-1].startswith("Bootstrapped in")
@@ -0,0 +1,62 @@
+"""Tests for profiling startup."""
+
+import json
+from io import StringIO
+
+from django.core.management import call_command
+
+from config.startup import PHASES, phase
+from deploy_tools.profiling import ImportTime, StartupProfile, parse_import_times
+
+IMPORT_TIMES = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     environs.utils
+import time:       200 |        300 |   environs.core
+import time:        50 |        350 | environs
+some other output
+import time:       400 |        400 | django.urls
+"""
+
+
+def test_parse_import_times():
+    """Test the output of -X importtime is parsed, with the depth of each import."""
+    assert parse_import_times(IMPORT_TIMES) == [
+        ImportTime("environs.utils", 100, 100, 2),
+        ImportTime("environs.core", 200, 300, 1),
+        ImportTime("environs", 50, 350, 0),
+        ImportTime("django.urls", 400, 400, 0),
+    ]
+
+
+def test_packages_are_totalled():
+    """Test the import times are totalled by top-level package, slowest first."""
+    profile = StartupProfile(phases={}, imports=parse_import_times(IMPORT_TIMES))
+
+    assert profile.packages() == {"django": 400, "environs": 350}
+    assert json.loads(profile.to_json())["imports"][0]["module"] == "django.urls"
+
+
+def test_phase_times_are_added():
+    """Test repeated phases add up."""
+    PHASES.pop("test", None)
+
+    with phase("test"):
+        pass
+    first = PHASES["test"]
+    with phase("test"):
+        pass
+
+    assert PHASES.pop("test") > first
+
+
+def test_profile_startup_command(tmp_path):
+    """Test the command profiles a new interpreter and writes the JSON profile."""
+    stdout = StringIO()
+
+    call_command("profile_startup", "--limit", "3", "--json", tmp_path / "profile.json", stdout=stdout)
+
+    assert "django.setup" in stdout.getvalue()
+    profile = json.loads((tmp_path / "profile.json").read_text())
+    assert "urlconf: config.urls" in profile["phases"]
+    assert "apps: djpress (models)" in profile["phases"]
+    assert "django" in profile["packages"]
@@ -0,0 +1,115 @@
+"""Tests for the static files pipeline."""
+
+import gzip
+import json
+
+import pytest
+from django.core.checks import run_checks
+from django.core.management import call_command
+from django.test import RequestFactory
+
+from deploy_tools.checks import find_static_references
+from deploy_tools.middleware import StaticFilesMiddleware
+from deploy_tools.storage import ZSTD_AVAILABLE
+
+CSS = "body { background: url('../img/ferns.png'); }\n" * 50
+
+
+@pytest.fixture
+def static_root(settings, tmp_path):
+    source = tmp_path / "static"
+    (source / "css").mkdir(parents=True)
+    (source / "img").mkdir()
+    (source / "css" / "styles.css").write_text(CSS)
+    (source / "img" / "ferns.png").write_bytes(b"\x89PNG not really")
+
+    settings.STATICFILES_DIRS = [source]
+    settings.STATICFILES_FINDERS = ["django.contrib.staticfiles.finders.FileSystemFinder"]
+    settings.STATIC_ROOT = tmp_path / "staticfiles"
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {"BACKEND": "deploy_tools.storage.CompressedManifestStorage"},
+    }
+    settings.WHITENOISE_AUTOREFRESH = False
+    settings.WHITENOISE_USE_FINDERS = False
+
+    call_command("collectstatic", interactive=False, verbosity=0)
+    return settings.STATIC_ROOT
+
+
+@pytest.fixture
+def templates(settings, tmp_path):
+    directory = tmp_path / "templates"
+    directory.mkdir()
+    settings.TEMPLATES = [
+        {"BACKEND": "django.template.backends.django.DjangoTemplates", "DIRS": [directory], "APP_DIRS": False},
+    ]
+    return directory
+
+
+def hashed_name(static_root, name):
+    return json.loads((static_root / "staticfiles.json").read_text())["paths"][name]
+
+
+def test_collectstatic_builds_hashed_and_compressed_files(static_root):
+    """Test collectstatic writes hashed names, with compressed variants of the files worth compressing."""
+    name = hashed_name(static_root, "css/styles.css")
+    assert name != "css/styles.css"
+
+    content = (static_root / name).read_text()
+    assert hashed_name(static_root, "img/ferns.png") in content
+    assert gzip.decompress((static_root / f"{name}.gz").read_bytes()).decode() == content
+    assert (static_root / f"{name}.zst").exists() == ZSTD_AVAILABLE
+
+    assert not (static_root / f"{hashed_name(static_root, 'img/ferns.png')}.gz").exists()
+
+
+def test_middleware_serves_smallest_accepted_variant(settings, static_root):
+    """Test hashed files are immutable, and each client gets the smallest variant it accepts."""
+    name = hashed_name(static_root, "css/styles.css")
+    # Stand in for the Zstandard variant when the standard library can't build one
+    (static_root / f"{name}.zst").write_bytes(b"z")
+    middleware = StaticFilesMiddleware(get_response=None, settings=settings)
+
+    def get(accept_encoding):
+        request = RequestFactory().get(f"/static/{name}", headers={"Accept-Encoding": accept_encoding})
+        return middleware(request)
+
+    response = get("gzip, deflate, br, zstd")
+    assert response["Content-Encoding"] == "zstd"
+    assert response["Cache-Control"] == "max-age=315360000, public, immutable"
+    assert response["Vary"] == "Accept-Encoding"
+
+    assert get("gzip")["Content-Encoding"] == "gzip"
+    assert "Content-Encoding" not in get("identity")
+
+    # The variants aren't served under their own URLs
+    assert f"/static/{name}.zst" not in middleware.files
+    assert f"/static/{name}.gz" not in middleware.files
+
+
+def test_find_static_references(templates):
+    """Test literal references are found, and overridden templates and variables are skipped."""
+    (templates / "base.html").write_text("{% load static %}<link href=\"{% static 'css/styles.css' %}\">")
+    (templates / "page.html").write_text('{% static "img/ferns.png" as ferns %}{% static variable %}')
+
+    assert find_static_references() == {"css/styles.css": {"base.html"}, "img/ferns.png": {"page.html"}}
+
+
+def test_check_static_references(static_root, templates):
+    """Test the deploy check reports references to files that aren't in the manifest."""
+    (templates / "base.html").write_text('{% static "css/styles.css" %}{% static "css/missing.css" %}')
+
+    errors = run_checks(include_deployment_checks=True, tags=["staticfiles"])
+
+    assert [error.id for error in errors] == ["deploy_tools.E002"]
+    assert "'css/missing.css' is referenced by base.html" in errors[0].msg
+
+
+def test_check_static_references_without_manifest(settings, static_root):
+    """Test the deploy check reports a missing manifest."""
+    (static_root / "staticfiles.json").unlink()
+
+    errors = run_checks(include_deployment_checks=True, tags=["staticfiles"])
+
+    assert [error.id for error in errors] == ["deploy_tools.E001"]
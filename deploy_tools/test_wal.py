@@ -0,0 +1,209 @@
+"""Tests for shipping the WAL and restoring the database."""
+
+import io
+import json
+import sqlite3
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from deploy_tools.backup import DatabaseBackup
+from deploy_tools.restore import restore_database
+from deploy_tools.wal import WAL_HEADER, WalHeader, WalShipper, committed_frames
+
+START = datetime(2026, 3, 1, 0, 30, tzinfo=UTC)
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / "db.sqlite3"
+    connection = sqlite3.connect(path, isolation_level=None)
+    connection.execute("PRAGMA journal_mode = WAL")
+    # Only the shipper checkpoints, as it would in production where the site's checkpoints can't pass its read lock
+    connection.execute("PRAGMA wal_autocheckpoint = 0")
+    connection.execute("CREATE TABLE post (title TEXT)")
+    connection.execute("INSERT INTO post VALUES ('First')")
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def shipper(s3, tmp_path, database):
+    shipper = WalShipper(s3, "backups", tmp_path / "db.sqlite3")
+    yield shipper
+    shipper.close()
+
+
+@pytest.fixture
+def restored(tmp_path):
+    """The path to restore to, which has the database's name, as the backups are found by it."""
+    path = tmp_path / "restored" / "db.sqlite3"
+    path.parent.mkdir()
+    return path
+
+
+def insert(database, *titles):
+    for title in titles:
+        database.execute("INSERT INTO post VALUES (?)", (title,))
+
+
+def titles(path):
+    connection = sqlite3.connect(path)
+    result = [title for (title,) in connection.execute("SELECT title FROM post ORDER BY rowid")]
+    connection.close()
+    return result
+
+
+def manifest(s3, shipper):
+    generations = json.loads(s3.objects["wal-db/generations.json"])
+    return json.loads(s3.objects[generations[-1]["manifest"]])
+
+
+def test_committed_frames_stop_at_a_corrupt_frame(database, shipper):
+    """Test the WAL is read up to the last commit frame with a valid checksum."""
+    insert(database, "Second")
+    insert(database, "Third")
+    data = shipper.wal_path.read_bytes()
+    header = WalHeader.parse(data)
+
+    length, _, frames = committed_frames(data[WAL_HEADER.size :], header, header.checksum)
+    assert length == len(data) - WAL_HEADER.size
+    assert frames == length // header.frame_size
+
+    corrupt = bytearray(data)
+    corrupt[-1] ^= 0xFF
+    length, _, _ = committed_frames(bytes(corrupt[WAL_HEADER.size :]), header, header.checksum)
+    assert length < len(data) - WAL_HEADER.size
+    assert WalHeader.parse(b"\0" * WAL_HEADER.size) is None
+
+
+def test_ship_and_restore(database, shipper, s3, restored):
+    """Test the restored database has every transaction shipped."""
+    shipper.ship(START)
+    insert(database, "Second")
+    shipper.ship(START + timedelta(seconds=1))
+    insert(database, "Third")
+    assert shipper.ship(START + timedelta(seconds=2)) > 0
+    assert shipper.ship(START + timedelta(seconds=3)) == 0
+
+    message = restore_database(s3, "backups", restored)
+
+    assert message.startswith("restored WAL generation")
+    assert titles(restored) == ["First", "Second", "Third"]
+    assert not restored.with_name("db.sqlite3-wal").exists()
+
+
+def test_checkpoint_continues_the_generation(database, shipper, s3, restored):
+    """Test the WAL restarting after a checkpoint by the shipper continues the same generation."""
+    shipper.checkpoint_size = 1
+    shipper.ship(START)
+    insert(database, "Second")
+    shipper.ship(START + timedelta(seconds=1))
+    insert(database, "Third")
+    shipper.ship(START + timedelta(seconds=2))
+
+    segments = manifest(s3, shipper)["segments"]
+    assert len(json.loads(s3.objects["wal-db/generations.json"])) == 1
+    assert sum(segment["new_wal"] for segment in segments) >= 2
+
+    restore_database(s3, "backups", restored)
+    assert titles(restored) == ["First", "Second", "Third"]
+
+
+def test_unshipped_restart_starts_a_new_generation(database, shipper, s3, restored):
+    """Test the WAL restarting before every frame was shipped starts a new generation."""
+    shipper.ship(START)
+    insert(database, "Second")
+    shipper.ship(START + timedelta(seconds=1))
+    insert(database, "Third")
+
+    # Another connection checkpoints and restarts the WAL while the shipper doesn't hold its read lock
+    shipper._release_read_lock()
+    database.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    insert(database, "Fourth")
+    shipper.ship(START + timedelta(seconds=2))
+
+    assert len(json.loads(s3.objects["wal-db/generations.json"])) == 2
+
+    restore_database(s3, "backups", restored)
+    assert titles(restored) == ["First", "Second", "Third", "Fourth"]
+
+
+def test_read_lock_stops_the_wal_restarting(database, shipper):
+    """Test the WAL isn't restarted by other connections while the shipper holds its renewed read lock."""
+    shipper.ship(START)
+    insert(database, "Second")
+    shipper.ship(START + timedelta(seconds=1))
+    header = WalHeader.parse(shipper.wal_path.read_bytes())
+
+    insert(database, "Third")
+    shipper._hold_read_lock()
+    database.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    insert(database, "Fourth")
+
+    assert WalHeader.parse(shipper.wal_path.read_bytes()).salts == header.salts
+
+
+def test_expired_generations_are_deleted(database, shipper, s3):
+    """Test only the kept generations stay in the bucket."""
+    shipper.generations_kept = 1
+    shipper.ship(START)
+    insert(database, "Second")
+    shipper.ship(START + timedelta(seconds=1))
+    first = manifest(s3, shipper)
+
+    shipper.start_generation(START + timedelta(days=1))
+
+    assert first["snapshot"]["key"] not in s3.objects
+    assert not any(key in s3.objects for key in (segment["key"] for segment in first["segments"]))
+    assert len(json.loads(s3.objects["wal-db/generations.json"])) == 1
+
+
+def test_restore_to_a_point_in_time(database, shipper, s3, restored):
+    """Test the segments are only replayed up to the time given."""
+    shipper.ship(START)
+    insert(database, "Second")
+    shipper.ship(START + timedelta(minutes=1))
+    insert(database, "Third")
+    shipper.ship(START + timedelta(minutes=2))
+
+    restore_database(s3, "backups", restored, to=START + timedelta(minutes=1, seconds=30))
+    assert titles(restored) == ["First", "Second"]
+
+
+def test_newer_hourly_backup_is_restored(database, shipper, s3, restored):
+    """Test the hourly backup is restored when it's newer than the latest generation."""
+    shipper.ship(START)
+    shipper.close()
+    insert(database, "Second")
+    database_backup = DatabaseBackup(s3, "backups", shipper.path)
+    database_backup.run(START + timedelta(hours=1))
+    database_backup.close()
+
+    message = restore_database(s3, "backups", restored)
+
+    assert message == "restored backup backup-db-01.tar.gz"
+    assert titles(restored) == ["First", "Second"]
+
+
+def test_restore_without_backups(s3, restored):
+    """Test nothing is written when there's nothing to restore."""
+    assert restore_database(s3, "backups", restored) == "no backup found"
+    assert not restored.exists()
+
+
+def test_restore_database_command(database, shipper, s3, monkeypatch, settings, restored):
+    """Test the command restores a database, and refuses to replace one."""
+    shipper.ship(START)
+    settings.S3_BUCKET = "backups"
+    monkeypatch.setitem(settings.DATABASES, "restored", {"ENGINE": "config.sqlite_backend", "NAME": restored})
+    monkeypatch.setattr("deploy_tools.management.commands.restore_database.get_client", lambda: s3)
+    stdout = io.StringIO()
+
+    call_command("restore_database", "--database", "restored", stdout=stdout)
+    assert titles(restored) == ["First"]
+
+    with pytest.raises(CommandError, match="already exists"):
+        call_command("restore_database", "--database", "restored", stdout=stdout)
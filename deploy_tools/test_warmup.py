@@ -0,0 +1,102 @@
+"""Tests for warming up workers."""
+
+import asyncio
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from djpress.models import Post
+
+from deploy_tools import warmup
+from deploy_tools.asgi import LifespanApplication
+
+
+def run_lifespan(application, messages):
+    """Send lifespan messages to an application and return what it sends back."""
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(application({"type": "lifespan"}, receive, send))
+    return [message["type"] for message in sent]
+
+
+def test_lifespan_runs_startup_once():
+    """Test the startup function runs before startup completes, and the application isn't called."""
+    calls = []
+
+    async def application(scope, receive, send):
+        calls.append(scope)
+
+    lifespan = LifespanApplication(application, on_startup=lambda: calls.append("startup"))
+    sent = run_lifespan(lifespan, [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert calls == ["startup"]
+
+
+def test_lifespan_reports_failed_startup():
+    """Test an exception at startup is reported to the server."""
+
+    def fail():
+        raise RuntimeError
+
+    lifespan = LifespanApplication(None, on_startup=fail)
+
+    assert run_lifespan(lifespan, [{"type": "lifespan.startup"}]) == ["lifespan.startup.failed"]
+
+
+def test_http_is_passed_through():
+    """Test other connections are handled by the wrapped application."""
+    scopes = []
+
+    async def application(scope, receive, send):
+        scopes.append(scope["type"])
+
+    asyncio.run(LifespanApplication(application, on_startup=list)({"type": "http"}, None, None))
+
+    assert scopes == ["http"]
+
+
+def test_named_urls():
+    """Test the named URLs include those in namespaces."""
+    names = set(warmup.named_urls(warmup.get_resolver()))
+
+    assert {"djpress:index", "sitemap", "robots"} <= names
+
+
+@pytest.mark.django_db
+def test_warm_up_runs_every_step():
+    """Test every step runs, and the templates and recent posts are warmed."""
+    user = User.objects.create_user(username="testuser", password="testpass")
+    Post.objects.create(title="First Post", content="The **first** post.", author=user, status="published")
+    cache.clear()
+
+    timings = warmup.warm_up()
+
+    assert list(timings) == list(warmup.WARMUP_STEPS)
+    assert warmup.compile_templates() > 0
+    assert warmup.render_recent_posts() == 1
+
+
+@pytest.mark.django_db
+def test_failed_steps_are_skipped(monkeypatch):
+    """Test a failing step doesn't stop the other steps."""
+
+    def fail():
+        raise RuntimeError
+
+    monkeypatch.setitem(warmup.WARMUP_STEPS, "views", fail)
+
+    assert "views" not in warmup.warm_up()
+
+
+def test_warm_up_can_be_disabled(settings):
+    """Test warming up does nothing when it's disabled."""
+    settings.WARMUP_ENABLED = False
+
+    assert warmup.warm_up() == {}
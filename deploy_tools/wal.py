@@ -0,0 +1,392 @@
+"""Shipping the SQLite write-ahead log to S3 as it's written, for restoring the database to any point in time.
+
+A generation is a snapshot of the database, followed by segments of the WAL file in the order they were written. Each
+segment holds the frames of whole transactions, so replaying the segments over the snapshot recreates the database as
+it was after any segment.
+
+The shipper keeps a read transaction open between polls, which stops other connections from restarting the WAL, and
+checkpoints the WAL itself once it has shipped every frame. The read transaction is renewed on a second connection
+before it's ended on the first, so there's no moment the WAL can restart with frames the shipper hasn't read. When the
+WAL restarts without every frame having been shipped anyway, the segments can't be replayed past the restart, and the
+shipper starts a new generation.
+
+The generations are listed, oldest first, in the generation index, and each generation has a manifest listing its
+snapshot and segments. The manifests, rather than the object names, are what restores use to find the latest backup.
+"""
+
+import gzip
+import logging
+import sqlite3
+import struct
+import time
+from dataclasses import dataclass, field
+from itertools import batched
+from typing import TYPE_CHECKING, Any
+
+from django.utils import timezone
+
+from deploy_tools.backup import COMPRESS_LEVEL, multipart_upload, read_json, snapshot, write_json
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from pathlib import Path
+
+    from botocore.client import BaseClient
+
+logger = logging.getLogger(__name__)
+
+# The magic number at the start of the WAL, which also gives the byte order of the checksums
+WAL_MAGIC = {0x377F0682: False, 0x377F0683: True}
+WAL_HEADER = struct.Struct(">8I")
+FRAME_HEADER = struct.Struct(">6I")
+
+# The WAL is checkpointed once it's this big, which is below SQLite's automatic checkpoint of 1000 pages
+CHECKPOINT_SIZE = 2 * 1024 * 1024
+
+# A new generation is started every day, so a restore never replays more than a day of segments
+GENERATION_INTERVAL = 24 * 60 * 60
+GENERATIONS_KEPT = 7
+
+GENERATIONS_KEY = "wal-{db_name}/generations.json"
+GENERATION_PREFIX = "wal-{db_name}/{generation}/"
+
+# S3 deletes at most 1000 objects per request
+DELETE_BATCH_SIZE = 1000
+
+
+def wal_checksum(data: bytes | memoryview, checksum: tuple[int, int], *, big_endian: bool) -> tuple[int, int]:
+    """Continue SQLite's WAL checksum over some data.
+
+    Args:
+        data (bytes | memoryview): The data, a multiple of 8 bytes long.
+        checksum (tuple[int, int]): The checksum so far.
+        big_endian (bool): Whether the data is read as big-endian 32-bit integers.
+
+    Returns:
+        tuple[int, int]: The checksum.
+    """
+    words = struct.unpack(f"{'>' if big_endian else '<'}{len(data) // 4}I", data)
+    s0, s1 = checksum
+    for i in range(0, len(words), 2):
+        s0 = (s0 + words[i] + s1) & 0xFFFFFFFF
+        s1 = (s1 + words[i + 1] + s0) & 0xFFFFFFFF
+
+    return s0, s1
+
+
+@dataclass(frozen=True)
+class WalHeader:
+    """The header of a WAL file.
+
+    Attributes:
+        raw (bytes): The header.
+        page_size (int): The database page size.
+        salts (tuple[int, int]): The salts, which change every time the WAL restarts.
+        checksum (tuple[int, int]): The checksum of the header, which the first frame's checksum continues.
+        big_endian (bool): Whether the checksums read the data as big-endian integers.
+    """
+
+    raw: bytes
+    page_size: int
+    salts: tuple[int, int]
+    checksum: tuple[int, int]
+    big_endian: bool
+
+    @classmethod
+    def parse(cls, data: bytes) -> WalHeader | None:
+        """Parse the header at the start of a WAL file.
+
+        Args:
+            data (bytes): The start of the WAL file.
+
+        Returns:
+            WalHeader | None: The header, or None if the file is empty or doesn't start with a valid header.
+        """
+        if len(data) < WAL_HEADER.size:
+            return None
+
+        magic, _, page_size, _, salt1, salt2, checksum1, checksum2 = WAL_HEADER.unpack_from(data)
+        if magic not in WAL_MAGIC:
+            return None
+        big_endian = WAL_MAGIC[magic]
+        if wal_checksum(data[:24], (0, 0), big_endian=big_endian) != (checksum1, checksum2):
+            return None
+
+        return cls(bytes(data[: WAL_HEADER.size]), page_size, (salt1, salt2), (checksum1, checksum2), big_endian)
+
+    @property
+    def frame_size(self) -> int:
+        """The size of each frame, including its header."""
+        return FRAME_HEADER.size + self.page_size
+
+
+def committed_frames(data: bytes, header: WalHeader, checksum: tuple[int, int]) -> tuple[int, tuple[int, int], int]:
+    """Find the frames of committed transactions at the start of some WAL data.
+
+    Frames are read until one doesn't belong to this WAL, or fails its checksum, which is how SQLite itself finds the
+    end of the WAL. Frames after the last commit frame belong to a transaction that's still being written.
+
+    Args:
+        data (bytes): The WAL data, starting at a frame.
+        header (WalHeader): The WAL header.
+        checksum (tuple[int, int]): The checksum of the frame before the data, or of the header.
+
+    Returns:
+        tuple[int, tuple[int, int], int]: The length of the committed frames, the checksum of the last of them, and
+            the number of them.
+    """
+    view = memoryview(data)
+    offset = frames = 0
+    committed: tuple[int, tuple[int, int], int] = (0, checksum, 0)
+    while offset + header.frame_size <= len(view):
+        _, commit, salt1, salt2, checksum1, checksum2 = FRAME_HEADER.unpack_from(view, offset)
+        if (salt1, salt2) != header.salts:
+            break
+        checksum = wal_checksum(view[offset : offset + 8], checksum, big_endian=header.big_endian)
+        checksum = wal_checksum(
+            view[offset + FRAME_HEADER.size : offset + header.frame_size],
+            checksum,
+            big_endian=header.big_endian,
+        )
+        if checksum != (checksum1, checksum2):
+            break
+
+        offset += header.frame_size
+        frames += 1
+        if commit:
+            committed = (offset, checksum, frames)
+
+    return committed
+
+
+def generations_key(db_name: str) -> str:
+    """Return the key of the generation index for a database."""
+    return GENERATIONS_KEY.format(db_name=db_name)
+
+
+@dataclass
+class WalShipper:
+    """Ships the WAL of a database to a bucket.
+
+    Attributes:
+        client (BaseClient): The S3 client.
+        bucket (str): The bucket.
+        path (Path): The path to the database.
+        checkpoint_size (int): The size of WAL that's checkpointed once it has been shipped.
+        generation_interval (float): The number of seconds after which a new generation is started.
+        generations_kept (int): The number of generations kept in the bucket.
+        manifest (dict[str, Any] | None): The manifest of the current generation.
+    """
+
+    client: BaseClient
+    bucket: str
+    path: Path
+    checkpoint_size: int = CHECKPOINT_SIZE
+    generation_interval: float = GENERATION_INTERVAL
+    generations_kept: int = GENERATIONS_KEPT
+    manifest: dict[str, Any] | None = None
+    # The read transaction is held on one of the connections, and handed over to the other to renew it
+    _connections: list[sqlite3.Connection] = field(default_factory=list, init=False, repr=False)
+    _header: WalHeader | None = field(default=None, init=False, repr=False)
+    _position: int = field(default=0, init=False, repr=False)
+    _checksum: tuple[int, int] = field(default=(0, 0), init=False, repr=False)
+    # Whether a new WAL continues the generation, which is only known when every frame of the old WAL was shipped
+    _restarted: bool = field(default=False, init=False, repr=False)
+    _started: float = field(default=0.0, init=False, repr=False)
+
+    @property
+    def db_name(self) -> str:
+        """The name of the database, without the extension."""
+        return self.path.stem
+
+    @property
+    def wal_path(self) -> Path:
+        """The path to the WAL file."""
+        return self.path.with_name(f"{self.path.name}-wal")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection that runs the checkpoints, connecting the shipper's connections if needed."""
+        while len(self._connections) < 2:  # noqa: PLR2004
+            self._connections.append(sqlite3.connect(self.path, isolation_level=None, timeout=5))
+        return self._connections[0]
+
+    def _hold_read_lock(self) -> None:
+        """Start a new read transaction, which stops other connections from restarting the WAL.
+
+        The new transaction starts before the old one ends, so the WAL can't restart until the frames committed before
+        the new one started have been checkpointed, and `ship` reads those frames after renewing the transaction.
+        """
+        self._connect()
+        holding = [connection for connection in self._connections if connection.in_transaction]
+        connection = next(connection for connection in self._connections if not connection.in_transaction)
+        connection.execute("BEGIN")
+        connection.execute("SELECT COUNT(*) FROM sqlite_schema").fetchone()
+        for old in holding:
+            old.execute("COMMIT")
+
+    def _release_read_lock(self) -> None:
+        """End the read transaction."""
+        for connection in self._connections:
+            if connection.in_transaction:
+                connection.execute("COMMIT")
+
+    def start_generation(self, now: datetime) -> None:
+        """Snapshot the database and start shipping the WAL from the start of the current WAL.
+
+        The snapshot can include transactions in the WAL, which are replayed again over it. Replaying frames is
+        idempotent, as each frame is a whole page.
+
+        Args:
+            now (datetime): When the generation starts.
+        """
+        connection = self._connect()
+        self._release_read_lock()
+        # Start with an empty WAL where possible, so the first segment is small
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        self._hold_read_lock()
+
+        generation = f"{now:%Y%m%dT%H%M%S%fZ}"
+        prefix = GENERATION_PREFIX.format(db_name=self.db_name, generation=generation)
+        data = snapshot(self.path)
+        with (
+            multipart_upload(self.client, self.bucket, f"{prefix}snapshot.sqlite3.gz") as upload,
+            gzip.GzipFile(fileobj=upload, mode="wb", compresslevel=COMPRESS_LEVEL, mtime=0) as compressed,
+        ):
+            compressed.write(data)
+
+        self.manifest = {
+            "generation": generation,
+            "created": now.isoformat(),
+            "snapshot": {"key": upload.key, "size": len(data)},
+            "segments": [],
+        }
+        self._header = None
+        self._restarted = True
+        self._started = time.monotonic()
+        self._write_manifest()
+        self._add_generation()
+        logger.info("Started WAL generation %s", generation)
+
+    def _write_manifest(self) -> None:
+        """Write the manifest of the current generation."""
+        prefix = GENERATION_PREFIX.format(db_name=self.db_name, generation=self.manifest["generation"])
+        write_json(self.client, self.bucket, f"{prefix}manifest.json", self.manifest)
+
+    def _add_generation(self) -> None:
+        """Add the current generation to the index, and delete the generations that are no longer kept."""
+        key = generations_key(self.db_name)
+        generations = read_json(self.client, self.bucket, key) or []
+        prefix = GENERATION_PREFIX.format(db_name=self.db_name, generation=self.manifest["generation"])
+        generations.append({"generation": self.manifest["generation"], "manifest": f"{prefix}manifest.json"})
+
+        expired = generations[: -self.generations_kept]
+        write_json(self.client, self.bucket, key, generations[-self.generations_kept :])
+        for generation in expired:
+            manifest = read_json(self.client, self.bucket, generation["manifest"])
+            keys = [generation["manifest"]]
+            if manifest is not None:
+                keys += [manifest["snapshot"]["key"], *(segment["key"] for segment in manifest["segments"])]
+            for batch in batched(keys, DELETE_BATCH_SIZE, strict=False):
+                self.client.delete_objects(Bucket=self.bucket, Delete={"Objects": [{"Key": k} for k in batch]})
+
+    def ship(self, now: datetime | None = None) -> int:
+        """Ship the transactions committed since the last segment, starting a new generation if needed.
+
+        Args:
+            now (datetime | None): The time of the segment. Defaults to now.
+
+        Returns:
+            int: The number of bytes of WAL shipped.
+        """
+        now = now or timezone.now()
+        if self.manifest is None or time.monotonic() - self._started >= self.generation_interval:
+            self.start_generation(now)
+
+        # A new read transaction lets checkpoints by other connections copy the frames committed since the last one
+        self._hold_read_lock()
+        shipped = self._ship_segment(now)
+        if shipped is None:
+            logger.warning("The WAL restarted before every frame was shipped, starting a new generation")
+            self.start_generation(now)
+            return 0
+
+        if self._position >= self.checkpoint_size:
+            shipped += self.checkpoint(now)
+
+        return shipped
+
+    def _ship_segment(self, now: datetime) -> int | None:
+        """Upload the frames committed since the last segment.
+
+        Returns:
+            int | None: The number of bytes shipped, or None if the WAL restarted before every frame was shipped.
+        """
+        try:
+            with self.wal_path.open("rb") as wal:
+                header = WalHeader.parse(wal.read(WAL_HEADER.size))
+                if header is None:
+                    return 0
+
+                segment = b""
+                new_wal = False
+                if self._header is None or header.salts != self._header.salts:
+                    if not self._restarted:
+                        return None
+                    # A new WAL, which the segment starts with the header of
+                    segment = header.raw
+                    new_wal = True
+                    self._header = header
+                    self._position = WAL_HEADER.size
+                    self._checksum = header.checksum
+                    self._restarted = False
+
+                wal.seek(self._position)
+                data = wal.read()
+        except FileNotFoundError:
+            return 0
+
+        length, checksum, frames = committed_frames(data, self._header, self._checksum)
+        segment += data[:length]
+        if not segment:
+            return 0
+
+        index = len(self.manifest["segments"])
+        prefix = GENERATION_PREFIX.format(db_name=self.db_name, generation=self.manifest["generation"])
+        key = f"{prefix}{index:08d}.wal.gz"
+        self.client.put_object(Bucket=self.bucket, Key=key, Body=gzip.compress(segment, COMPRESS_LEVEL, mtime=0))
+        self.manifest["segments"].append(
+            {"key": key, "created": now.isoformat(), "new_wal": new_wal, "frames": frames},
+        )
+        self._write_manifest()
+
+        self._position += length
+        self._checksum = checksum
+        return len(segment)
+
+    def checkpoint(self, now: datetime) -> int:
+        """Checkpoint the WAL, so the next transaction restarts it, once every frame has been shipped.
+
+        Args:
+            now (datetime): The time of any segment shipped.
+
+        Returns:
+            int: The number of bytes of WAL shipped, for transactions committed while checkpointing.
+        """
+        connection = self._connect()
+        self._release_read_lock()
+        busy, frames, _ = connection.execute("PRAGMA wal_checkpoint(RESTART)").fetchone()
+
+        # Ship anything committed before the checkpoint, unless the WAL has already restarted
+        shipped = self._ship_segment(now) or 0
+        if not busy and self._position == WAL_HEADER.size + frames * self._header.frame_size:
+            self._restarted = True
+
+        self._hold_read_lock()
+        return shipped
+
+    def close(self) -> None:
+        """End the read transaction and close the connections."""
+        self._release_read_lock()
+        for connection in self._connections:
+            connection.close()
+        self._connections.clear()
@@ -0,0 +1,169 @@
+"""Warming up a worker before it accepts requests.
+
+Workers are replaced every `--max-requests` requests. Without warming up, the first requests to each new worker pay for
+importing the views, building the URL resolvers, compiling the templates, connecting to the database and rendering the
+recent posts.
+"""
+
+import logging
+import time
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+from django.template import TemplateSyntaxError
+from django.template.loader import get_template
+from django.urls import NoReverseMatch, URLResolver, get_resolver, reverse
+from djpress.models import Post
+
+from deploy_tools.template_files import iter_template_files
+from spf_generator.catalogue import prime_catalogue
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Django's own templates, such as the admin's, are left to be compiled when they're first used
+DJANGO_DIR = Path(django.__file__).resolve().parent
+
+
+def import_views() -> int:
+    """Import the views module of every app.
+
+    Returns:
+        int: The number of modules imported.
+    """
+    count = 0
+    for app_config in apps.get_app_configs():
+        module_name = f"{app_config.name}.views"
+        if find_spec(module_name) is not None:
+            import_module(module_name)
+            count += 1
+
+    return count
+
+
+def named_urls(resolver: URLResolver, namespace: str = "") -> Iterator[str]:
+    """Find the names of the URL patterns in a resolver, and in every resolver it includes.
+
+    Args:
+        resolver (URLResolver): The resolver.
+        namespace (str): The namespace of the resolver, including the trailing colon.
+
+    Yields:
+        str: The name of each URL pattern, with its namespace.
+    """
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLResolver):
+            yield from named_urls(pattern, f"{namespace}{pattern.namespace}:" if pattern.namespace else namespace)
+        elif pattern.name:
+            yield f"{namespace}{pattern.name}"
+
+
+def resolve_urls() -> int:
+    """Build the URL resolvers and reverse every named URL that doesn't need arguments.
+
+    Returns:
+        int: The number of named URLs.
+    """
+    names = set(named_urls(get_resolver()))
+    for name in names:
+        try:
+            reverse(name)
+        except NoReverseMatch:
+            continue
+
+    return len(names)
+
+
+def compile_templates() -> int:
+    """Compile the project's templates, and those of the apps it uses, into the cached template loader.
+
+    Returns:
+        int: The number of templates compiled.
+    """
+    count = 0
+    for template_name, path in iter_template_files():
+        if path.resolve().is_relative_to(DJANGO_DIR):
+            continue
+
+        try:
+            get_template(template_name)
+        except TemplateSyntaxError:
+            # Not a template on its own, such as a partial that relies on the template including it
+            logger.debug("Skipped compiling %s", template_name)
+            continue
+
+        count += 1
+
+    return count
+
+
+def connect_database() -> str:
+    """Connect to the database, running the connection's setup commands, and read the schema.
+
+    Returns:
+        str: The database vendor.
+    """
+    connection.ensure_connection()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM django_migrations")
+
+    return connection.vendor
+
+
+def render_recent_posts() -> int:
+    """Render the recent posts, as shown on the index page, through the content renderer and its cache.
+
+    Returns:
+        int: The number of posts rendered.
+    """
+    posts = list(Post.post_objects.get_recent_published_posts())
+    for post in posts:
+        _ = post.rendered_content, post.truncated_rendered_content
+
+    return len(posts)
+
+
+# In the order they're run
+WARMUP_STEPS: dict[str, Callable[[], object]] = {
+    "views": import_views,
+    "urls": resolve_urls,
+    "templates": compile_templates,
+    "database": connect_database,
+    "posts": render_recent_posts,
+    "spf providers": prime_catalogue,
+}
+
+
+def warm_up() -> dict[str, float]:
+    """Run every warm-up step, unless warming up is disabled.
+
+    A step that fails is logged and skipped, as the worker can still serve requests without it.
+
+    Returns:
+        dict[str, float]: The time taken by each step that succeeded, in seconds.
+    """
+    if not settings.WARMUP_ENABLED:
+        return {}
+
+    timings: dict[str, float] = {}
+    for name, step in WARMUP_STEPS.items():
+        start = time.perf_counter()
+        try:
+            result = step()
+        except Exception:
+            logger.exception("Warm-up step %s failed", name)
+            continue
+
+        timings[name] = time.perf_counter() - start
+        logger.info("Warm-up step %s: %s in %.3fs", name, result, timings[name])
+
+    logger.info("Warmed up in %.3fs", sum(timings.values()))
+    return timings
@@ -8,21 +8,10 @@ echo "Logging in to Infisical"
 INFISICAL_TOKEN=$(infisical login --method=universal-auth --client-id="${INFISICAL_MACHINE_CLIENT_ID}" --client-secret="${INFISICAL_MACHINE_CLIENT_SECRET}" --plain --silent)
 export INFISICAL_TOKEN
 
-# Check and restore database
-echo "Checking and restoring database"
-infisical run --token "${INFISICAL_TOKEN}" --projectId "${PROJECT_ID}" --env "${INFISICAL_SECRET_ENV}" -- scripts/db-restore.sh
-
-# Create cache table
-echo "Creating cache table"
-infisical run --token "${INFISICAL_TOKEN}" --projectId "${PROJECT_ID}" --env "${INFISICAL_SECRET_ENV}" -- python manage.py createcachetable
-
-# Apply database migrations
-echo "Applying database migrations"
-infisical run --token "${INFISICAL_TOKEN}" --projectId "${PROJECT_ID}" --env "${INFISICAL_SECRET_ENV}" -- python manage.py migrate --noinput
-
-# Collect static files
-echo "Collecting static files"
-infisical run --token "${INFISICAL_TOKEN}" --projectId "${PROJECT_ID}" --env "${INFISICAL_SECRET_ENV}" -- python manage.py collectstatic --noinput
+# Restore the database, create the cache, apply migrations and collect static files in one process. Each step is
+# skipped if there's nothing to do.
+echo "Bootstrapping"
+infisical run --token "${INFISICAL_TOKEN}" --projectId "${PROJECT_ID}" --env "${INFISICAL_SECRET_ENV}" -- python manage.py bootstrap
 
 # Start the Django server with Gunicorn
 echo "Starting server"
@@ -2,7 +2,7 @@
 
 import logging
 
-from django.db import connections
+from django.db import DEFAULT_DB_ALIAS, connections, router
 from django.db.utils import OperationalError
 
 logger = logging.getLogger(__name__)
@@ -15,7 +15,9 @@ def check_database() -> tuple[str, str | None]:
     message.
     """
     try:
-        connections["default"].cursor()  # You could use a specific database alias if needed
+        # The writer, and the read-only connection if this request's reads use it
+        for alias in {DEFAULT_DB_ALIAS, router.db_for_read(None)}:
+            connections[alias].cursor()
     except OperationalError as e:
         logger.debug(f"Health check found an error with the database: {e!s}")
         return "unhealthy", "Error connecting to the database."
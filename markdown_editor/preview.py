@@ -0,0 +1,399 @@
+"""Incremental Markdown preview rendering.
+
+The document is split into top-level blocks and each block is rendered on its own, with the rendered HTML cached by a
+hash of the block's markdown. When a document is edited, only the blocks that changed miss the cache, so the cost of a
+preview depends on the size of the edit rather than the size of the document.
+
+Heading ids are only unique within a block, so they are renumbered across the document after the blocks are rendered,
+to match the ids of the full render.
+
+Reference-style links and footnotes can refer to definitions in other blocks, so the blocks of definitions are joined
+and added to the end of each block that could refer to them before it's hashed and rendered. Each block then has its own
+footnotes, numbered from one, so they're numbered again in document order and gathered into a single footnotes section
+at the end, as in the full render.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, replace
+from itertools import zip_longest
+
+from config.caching import LRUCache
+from config.markdown_renderer import Heading, render_markdown, render_markdown_document, unique_slug
+
+# Number of rendered blocks kept in memory.
+PREVIEW_CACHE_SIZE = 4096
+
+FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+LIST_ITEM_RE = re.compile(r"^ {0,3}([-*+]|\d{1,9}[.)])(\s|$)")
+# A footnote definition goes on for as long as its lines are indented further than it
+FOOTNOTE_DEFINITION_RE = re.compile(r"^( {0,4})\[\^[^\]\s]+\]:")
+DEFINITION_RE = re.compile(r"^ {0,3}\[[^\]]+\]:", re.MULTILINE)
+HEADING_ID_RE = re.compile(r'(<h[1-6] id=")([^"]*)"')
+
+# The HTML of the footnotes plugin
+FOOTNOTES_START = '<section class="footnotes">\n<ol>\n'
+FOOTNOTES_END = "</ol>\n</section>\n"
+FOOTNOTE_REF_RE = re.compile(r'<sup class="footnote-ref" id="fnref-(\d+)"><a href="#fn-\1">\1</a></sup>')
+FOOTNOTE_ITEM_RE = re.compile(r'<li id="fn-(\d+)">')
+FOOTNOTE_BACKREF_RE = re.compile(r'<a href="#fnref-\d+" class="footnote">')
+
+preview_cache = LRUCache(PREVIEW_CACHE_SIZE)
+
+
+@dataclass(frozen=True)
+class PreviewBlock:
+    """A rendered top-level block.
+
+    Attributes:
+        hash (str): The SHA-256 hash of the block's markdown, and of its heading ids if they were renumbered
+        html (str): The rendered HTML
+        headings (tuple[Heading, ...]): The block's headings, with their ids as if the block was the whole document
+        footnotes (tuple[tuple[str, str], ...]): The key and the HTML of the list item of each footnote the block
+            refers to, numbered as if the block was the whole document. They aren't part of the block's HTML, and a
+            footnote that's only referred to from the text of another footnote has no list item.
+    """
+
+    hash: str
+    html: str
+    headings: tuple[Heading, ...] = ()
+    footnotes: tuple[tuple[str, str], ...] = ()
+
+
+def indentation(line: str) -> int:
+    """Return the number of columns a line is indented by, with tabs stopping at multiples of four."""
+    expanded = line.expandtabs(4)
+    return len(expanded) - len(expanded.lstrip(" "))
+
+
+def item_content_column(line: str) -> int | None:
+    """Return the column a list item's content starts at: the width of its marker and the spaces after it.
+
+    The content of a footnote definition, which can have several paragraphs like a list item, starts one column after
+    the definition's own indentation.
+
+    Args:
+        line (str): The line.
+
+    Returns:
+        int | None: The column, or None if the line doesn't start a list item.
+    """
+    line = line.expandtabs(4)
+    if match := FOOTNOTE_DEFINITION_RE.match(line):
+        return len(match.group(1)) + 1
+    match = LIST_ITEM_RE.match(line)
+    if match is None:
+        return None
+
+    rest = line[match.end(1) :]
+    spaces = len(rest) - len(rest.lstrip(" "))
+    # An empty item, or one that starts with indented code, has its content one space after the marker
+    if not rest.strip() or spaces > 4:  # noqa: PLR2004
+        return match.end(1) + 1
+    return match.end(1) + spaces
+
+
+def item_content(line: str, item_column: int | None) -> str:
+    """Return a line relative to the open list item's content, if it's indented that far."""
+    if item_column is not None and indentation(line) >= item_column:
+        return line.expandtabs(4)[item_column:]
+    return line
+
+
+def closes_fence(line: str, fence: str) -> bool:
+    """Return whether a line closes a fenced code block: a fence of the same character that's at least as long."""
+    match = FENCE_RE.match(line)
+    return match is not None and match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence)
+
+
+def continues_after_blank(line: str, item_column: int | None) -> bool:
+    """Return whether a line after a blank line belongs to the same block as the lines before the blank line.
+
+    Args:
+        line (str): The line after the blank line.
+        item_column (int | None): The content column of the open list item, if there is one.
+
+    Returns:
+        bool: Whether the line is indented, or is the next item or part of the open item of a list.
+    """
+    if line.startswith(("    ", "\t")):
+        return True
+    return item_column is not None and (indentation(line) >= item_column or LIST_ITEM_RE.match(line) is not None)
+
+
+def split_blocks(markdown_text: str) -> list[str]:
+    """Split a document into top-level blocks.
+
+    Blocks are separated by blank lines, except for blank lines inside fenced code blocks, blank lines followed by an
+    indented line, and blank lines inside a list: before its next item, or before a line indented to the content of the
+    open item, such as a second paragraph or a code block.
+
+    Args:
+        markdown_text (str): The markdown text.
+
+    Returns:
+        list[str]: The blocks, in document order.
+    """
+    blocks: list[str] = []
+    current: list[str] = []
+    fence: str | None = None
+    # The content column of the outermost open list item, which fences inside the item are relative to
+    item_column: int | None = None
+    # The blank lines since the last line, which are kept if the block goes on after them
+    blank_lines = 0
+
+    for line in markdown_text.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+        if fence is not None:
+            current.append(line)
+            if closes_fence(item_content(line, item_column), fence):
+                fence = None
+            continue
+
+        if not line.strip():
+            # Blank lines before the first block are ignored
+            blank_lines += bool(current)
+            continue
+
+        if blank_lines:
+            if continues_after_blank(line, item_column):
+                current.extend([""] * blank_lines)
+            else:
+                blocks.append("\n".join(current))
+                current = []
+                item_column = None
+            blank_lines = 0
+
+        current.append(line)
+        if item_column is None or indentation(line) < item_column:
+            item_column = item_content_column(line) or item_column
+        match = FENCE_RE.match(item_content(line, item_column))
+        if match:
+            fence = match.group(1)
+
+    if current:
+        blocks.append("\n".join(current))
+
+    return blocks
+
+
+def split_footnotes(html: str, keys: tuple[str, ...]) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """Split the footnotes section off the end of a block's HTML.
+
+    Args:
+        html (str): The block's HTML.
+        keys (tuple[str, ...]): The keys of the footnotes the block refers to, in the order they're numbered.
+
+    Returns:
+        tuple[str, tuple[tuple[str, str], ...]]: The HTML without the section, and the key and list item of each
+            footnote. A footnote that's only referred to from the text of another footnote has no list item.
+    """
+    if not keys or not html.endswith(FOOTNOTES_END):
+        return html, ()
+
+    html, _, section = html.rpartition(FOOTNOTES_START)
+    starts = [match.start() for match in FOOTNOTE_ITEM_RE.finditer(section)]
+    ends = [*starts[1:], len(section) - len(FOOTNOTES_END)]
+    items = [section[start:end] for start, end in zip(starts, ends, strict=True)]
+    return html, tuple(zip_longest(keys, items, fillvalue=""))
+
+
+def has_open_fence(block: str) -> bool:
+    """Return whether a block ends inside a fenced code block."""
+    fence: str | None = None
+    for line in block.split("\n"):
+        if fence is None:
+            if match := FENCE_RE.match(line.lstrip()):
+                fence = match.group(1)
+        elif closes_fence(line.lstrip(), fence):
+            fence = None
+    return fence is not None
+
+
+def render_block(block: str, definitions: str = "") -> PreviewBlock:
+    """Render a single block, using the preview cache.
+
+    Args:
+        block (str): The block's markdown.
+        definitions (str): The document's link and footnote definitions, which are added to a block that could refer to
+            them.
+
+    Returns:
+        PreviewBlock: The rendered block.
+    """
+    if definitions and "[" in block:
+        # A fenced code block that isn't closed goes on to the end of the document, so the definitions come before it
+        block = f"{definitions}\n\n{block}" if has_open_fence(block) else f"{block}\n\n{definitions}"
+    block_hash = hashlib.sha256(block.encode()).hexdigest()
+    rendered = preview_cache.get(block_hash)
+    if rendered is None:
+        rendered = render_markdown_document(block)
+        preview_cache.set(block_hash, rendered)
+
+    html, footnotes = split_footnotes(rendered.html, rendered.metadata.footnotes)
+    return PreviewBlock(hash=block_hash, html=html, headings=rendered.metadata.headings, footnotes=footnotes)
+
+
+def is_definitions(block: str) -> bool:
+    """Return whether a block only has link or footnote definitions, which don't render anything on their own."""
+    return DEFINITION_RE.match(block) is not None and not render_block(block).html
+
+
+def renumber_ids(html: str, old: list[str], new: list[str]) -> str:
+    """Replace the ids of the rendered headings in a block's HTML.
+
+    The headings are matched in order, so a heading written as raw HTML, which isn't one of the rendered headings,
+    keeps its id.
+
+    Args:
+        html (str): The block's HTML.
+        old (list[str]): The ids of the rendered headings, in order.
+        new (list[str]): The ids to give them.
+
+    Returns:
+        str: The HTML with the new ids.
+    """
+    position = 0
+
+    def replace(match: re.Match[str]) -> str:
+        nonlocal position
+        if position < len(old) and match.group(2) == old[position]:
+            position += 1
+            return f'{match.group(1)}{new[position - 1]}"'
+        return match.group(0)
+
+    return HEADING_ID_RE.sub(replace, html)
+
+
+def number_headings(blocks: list[PreviewBlock]) -> list[PreviewBlock]:
+    """Give the headings the ids they have in the full render.
+
+    Each block is rendered on its own, so a heading that repeats one in an earlier block has the same id. The ids are
+    worked out again in document order, and a block whose ids change gets a new hash, so the client doesn't keep the
+    HTML with the old ids.
+
+    Args:
+        blocks (list[PreviewBlock]): The rendered blocks, in document order.
+
+    Returns:
+        list[PreviewBlock]: The blocks, with unique heading ids.
+    """
+    used: set[str] = set()
+    numbered: list[PreviewBlock] = []
+    for block in blocks:
+        slugs = [unique_slug(heading.title, used) for heading in block.headings]
+        if slugs == [heading.slug for heading in block.headings]:
+            numbered.append(block)
+            continue
+
+        html = renumber_ids(block.html, [heading.slug for heading in block.headings], slugs)
+        block_hash = hashlib.sha256(f"{block.hash}:{','.join(slugs)}".encode()).hexdigest()
+        numbered.append(replace(block, hash=block_hash, html=html))
+
+    return numbered
+
+
+def footnote_numbers(blocks: list[PreviewBlock]) -> dict[str, int]:
+    """Return the number of each footnote in the full render.
+
+    The footnotes are numbered in the order the document refers to them. The text of the footnotes is rendered after
+    the document, so a footnote that's only referred to from the text of another footnote is numbered after them.
+
+    Args:
+        blocks (list[PreviewBlock]): The rendered blocks, in document order.
+
+    Returns:
+        dict[str, int]: The number of each footnote, by its key.
+    """
+    numbers: dict[str, int] = {}
+    sources: dict[str, tuple[str, list[str]]] = {}
+    for block in blocks:
+        keys = [key for key, _ in block.footnotes]
+        for key, item in block.footnotes:
+            if item:
+                numbers.setdefault(key, len(numbers) + 1)
+                sources.setdefault(key, (item, keys))
+
+    for key in list(numbers):
+        item, keys = sources[key]
+        for match in FOOTNOTE_REF_RE.finditer(item):
+            numbers.setdefault(keys[int(match.group(1)) - 1], len(numbers) + 1)
+
+    return numbers
+
+
+def number_footnotes(blocks: list[PreviewBlock]) -> list[PreviewBlock]:
+    """Number the footnotes as in the full render and add the footnotes section.
+
+    Each block's footnotes are numbered from one. They're numbered again across the document, and a block whose
+    numbers change gets a new hash, so the client doesn't keep the HTML with the old numbers.
+
+    Args:
+        blocks (list[PreviewBlock]): The rendered blocks, in document order.
+
+    Returns:
+        list[PreviewBlock]: The blocks, followed by the footnotes section if any footnotes are referred to.
+    """
+    numbers = footnote_numbers(blocks)
+    items: dict[str, str] = {}
+    numbered: list[PreviewBlock] = []
+    for block in blocks:
+        renumbered = {str(index): numbers[key] for index, (key, _) in enumerate(block.footnotes, start=1)}
+        for key, item in block.footnotes:
+            if item and key not in items:
+                # The footnote's text can refer to footnotes too
+                number = numbers[key]
+                html = FOOTNOTE_ITEM_RE.sub(f'<li id="fn-{number}">', renumber_refs(item, renumbered), count=1)
+                items[key] = FOOTNOTE_BACKREF_RE.sub(f'<a href="#fnref-{number}" class="footnote">', html)
+
+        if all(str(number) == index for index, number in renumbered.items()):
+            numbered.append(block)
+            continue
+
+        html = renumber_refs(block.html, renumbered)
+        block_hash = hashlib.sha256(f"{block.hash}:{','.join(map(str, renumbered.values()))}".encode()).hexdigest()
+        numbered.append(replace(block, hash=block_hash, html=html))
+
+    if items:
+        section = FOOTNOTES_START + "".join(items[key] for key in numbers if key in items) + FOOTNOTES_END
+        numbered.append(PreviewBlock(hash=hashlib.sha256(section.encode()).hexdigest(), html=section))
+
+    return numbered
+
+
+def renumber_refs(html: str, renumbered: dict[str, int]) -> str:
+    """Replace the numbers of the references to footnotes in some HTML, as the footnotes plugin renders them."""
+
+    def replace(match: re.Match[str]) -> str:
+        number = renumbered.get(match.group(1), int(match.group(1)))
+        return f'<sup class="footnote-ref" id="fnref-{number}"><a href="#fn-{number}">{number}</a></sup>'
+
+    return FOOTNOTE_REF_RE.sub(replace, html)
+
+
+def render_preview(markdown_text: str) -> list[PreviewBlock]:
+    """Render a document for the preview, block by block.
+
+    The blocks of link and footnote definitions don't render anything. They're joined and added to each block that
+    could refer to them, so a keystroke still only renders the block it changes, unless it changes a definition. A
+    document with a definition in the same block as other content is rendered as a whole, and isn't cached.
+
+    Args:
+        markdown_text (str): The markdown text.
+
+    Returns:
+        list[PreviewBlock]: The rendered blocks, in document order.
+    """
+    blocks = split_blocks(markdown_text)
+    if not DEFINITION_RE.search(markdown_text):
+        return number_headings([render_block(block) for block in blocks])
+
+    definitions = [block for block in blocks if is_definitions(block)]
+    skipped = set(definitions)
+    others = [block for block in blocks if block not in skipped]
+    if any(DEFINITION_RE.search(block) for block in others):
+        # A definition that shares a block with other content could be in use anywhere in the document
+        html = render_markdown(markdown_text)
+        return [PreviewBlock(hash=hashlib.sha256(markdown_text.encode()).hexdigest(), html=html)]
+
+    joined = "\n\n".join(definitions)
+    return number_footnotes(number_headings([render_block(block, joined) for block in others]))
@@ -0,0 +1,131 @@
+"""Tests for the markdown_editor views."""
+
+import json
+
+import pytest
+from django.urls import reverse
+
+from benchmarks.markdown_pipeline import load_corpus
+from config.markdown_renderer import render_markdown
+from markdown_editor.preview import preview_cache, render_preview, split_blocks
+
+
+def test_split_blocks():
+    """Test that blocks are split on blank lines."""
+    assert split_blocks("# Title\n\nFirst paragraph.\n\n\nSecond\nparagraph.\n") == [
+        "# Title",
+        "First paragraph.",
+        "Second\nparagraph.",
+    ]
+
+
+def test_split_blocks_keeps_fenced_code_together():
+    """Test that blank lines inside fenced code don't split the block."""
+    text = "Intro.\n\n```python\ndef a():\n\n    return 1\n```\n\nOutro."
+    assert split_blocks(text) == ["Intro.", "```python\ndef a():\n\n    return 1\n```", "Outro."]
+
+
+def test_split_blocks_keeps_lists_together():
+    """Test that loose lists and indented continuations stay in one block."""
+    text = "- one\n\n- two\n\n    more about two\n\nAfter."
+    assert split_blocks(text) == ["- one\n\n- two\n\n    more about two", "After."]
+
+
+@pytest.mark.parametrize("name", sorted(load_corpus()))
+def test_render_preview_matches_full_render(name):
+    """Test that the block-by-block preview matches rendering the whole document."""
+    text = load_corpus()[name]
+    assert "".join(block.html for block in render_preview(text)) == render_markdown(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "- item\n\n  continued para\n- two",
+        "1. step\n\n   ```py\n   a = 1\n\n   b = 2\n   ```\n2. next",
+        "- item\n\n      ```\n      nested fence\n\n      ```\n\n  still the item\n\nAfter.",
+        "10. wide marker\n\n    continued\n\nAfter the list.",
+        "Intro.\n\n- one\n\n  - nested\n\n    nested para\n\n  back in one\n\nOutro.",
+    ],
+)
+def test_render_preview_matches_full_render_of_list_continuations(text):
+    """Test that content indented to a list item's content column stays in the item, as in the full render."""
+    assert "".join(block.html for block in render_preview(text)) == render_markdown(text)
+
+
+def test_render_preview_only_renders_changed_blocks():
+    """Test that unchanged blocks are served from the cache."""
+    preview_cache.clear()
+    blocks = [f"Paragraph {i}." for i in range(20)]
+    render_preview("\n\n".join(blocks))
+
+    blocks[5] = "Paragraph 5 has changed."
+    render_preview("\n\n".join(blocks))
+
+    stats = preview_cache.stats()
+    assert stats.misses == 21
+    assert stats.hits == 19
+
+
+def test_render_preview_numbers_repeated_headings_across_blocks():
+    """Test a heading that repeats one in an earlier block gets the same id as in the full render."""
+    text = "## Intro\n\nFirst.\n\n## Intro\n\nSecond.\n\n## Intro"
+    blocks = render_preview(text)
+    html = "".join(block.html for block in blocks)
+    assert html == render_markdown(text)
+    assert [html.count(f'id="{slug}"') for slug in ("intro", "intro-1", "intro-2")] == [1, 1, 1]
+    assert len({block.hash for block in blocks}) == len(blocks)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "A [link][1] and [another].\n\n## Intro\n\nSee [another].\n\n[1]: https://example.com\n\n[another]: /x",
+        "First[^a] and[^b].\n\nSecond[^b] and[^c].\n\n[^a]: Note a.\n\n[^b]: Note *b*.\n\n[^c]: Note c.",
+        "Text[^a].\n\n[^a]: Note a.\n\n  Its second paragraph[^b].\n\n[^b]: Note b.",
+        "[1]: /x\n\nIntro [link][1].\n\n```\nNot closed [link][1]",
+    ],
+)
+def test_render_preview_matches_full_render_with_definitions(text):
+    """Test that references in a block to definitions in other blocks render as in the full render."""
+    assert "".join(block.html for block in render_preview(text)) == render_markdown(text)
+
+
+def test_render_preview_with_definitions_only_renders_changed_blocks():
+    """Test that a document with definitions still only renders the blocks that changed."""
+    preview_cache.clear()
+    blocks = [f"Paragraph {i} has a [link] and a note[^{i}]." for i in range(10)]
+    definitions = ["[link]: https://example.com", *(f"[^{i}]: Note {i}." for i in range(10))]
+    render_preview("\n\n".join(blocks + definitions))
+    misses = preview_cache.stats().misses
+
+    blocks[5] = "Paragraph 5 has changed[^5]."
+    text = "\n\n".join(blocks + definitions)
+    assert "".join(block.html for block in render_preview(text)) == render_markdown(text)
+    assert preview_cache.stats().misses == misses + 1
+
+
+def test_preview_htmx(client):
+    """Test the preview returns HTML for form posts."""
+    url = reverse("markdown_editor:markdown_preview")
+    response = client.post(url, {"markdown": "# Hello\n\nWorld"})
+    assert response.status_code == 200
+    assert response.content == b'<h1 id="hello">Hello</h1>\n<p>World</p>\n'
+
+
+def test_preview_json_skips_known_blocks(client):
+    """Test the JSON preview leaves out the HTML for blocks the client already has."""
+    url = reverse("markdown_editor:markdown_preview")
+    response = client.post(url, {"markdown": "# Hello\n\nWorld"}, content_type="application/json")
+    blocks = response.json()["blocks"]
+    assert [block["html"] for block in blocks] == ['<h1 id="hello">Hello</h1>\n', "<p>World</p>\n"]
+
+    data = {"markdown": "# Hello\n\nWorld!", "known": [blocks[0]["hash"]]}
+    response = client.post(url, json.dumps(data), content_type="application/json")
+    assert [block["html"] for block in response.json()["blocks"]] == [None, "<p>World!</p>\n"]
+
+
+def test_preview_rejects_get(client):
+    """Test that the preview only accepts POST requests."""
+    response = client.get(reverse("markdown_editor:markdown_preview"))
+    assert response.status_code == 405
@@ -2,10 +2,11 @@
 
 from django.urls import path
 
-from markdown_editor.views import markdown_editor
+from markdown_editor.views import markdown_editor, markdown_preview
 
 app_name = "markdown_editor"
 
 urlpatterns = [
     path("", markdown_editor, name="markdown_editor"),
+    path("preview/", markdown_preview, name="markdown_preview"),
 ]
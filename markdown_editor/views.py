@@ -1,11 +1,16 @@
 """Views for the markdown_editor app."""
 
+import json
 from typing import TYPE_CHECKING
 
+from django.http import HttpResponse, HttpResponseBadRequest, JsonResponse
 from django.shortcuts import render
+from django.views.decorators.http import require_POST
+
+from markdown_editor.preview import render_preview
 
 if TYPE_CHECKING:
-    from django.http import HttpRequest, HttpResponse
+    from django.http import HttpRequest
 
 
 # A simple view to display the converter HTML template.
@@ -15,3 +20,37 @@ def markdown_editor(request: HttpRequest) -> HttpResponse:
         request,
         "markdown_editor/markdown_editor.html",
     )
+
+
+@require_POST
+def markdown_preview(request: HttpRequest) -> HttpResponse:
+    """Render a Markdown preview with the same renderer that is used for posts.
+
+    HTMX form posts send the document in the `markdown` field and get the rendered HTML back.
+
+    JSON requests send `{"markdown": "...", "known": ["<hash>", ...]}`, where `known` lists the hashes of blocks the
+    client has already rendered. The response lists every block in the document, in order, as `{"hash": "...",
+    "html": "..."}`. The HTML is left out (null) for blocks the client already knows, so the client only needs to patch
+    the blocks that changed.
+
+    Args:
+        request: The HTTP request object
+
+    Returns:
+        HttpResponse containing either the rendered HTML or the JSON list of blocks
+    """
+    if request.content_type == "application/json":
+        try:
+            data = json.loads(request.body)
+            markdown_text = str(data.get("markdown", ""))
+            known = set(data.get("known", []))
+        except (ValueError, AttributeError, TypeError):
+            return HttpResponseBadRequest("Invalid JSON")
+
+        blocks = render_preview(markdown_text)
+        return JsonResponse(
+            {"blocks": [{"hash": block.hash, "html": None if block.hash in known else block.html} for block in blocks]},
+        )
+
+    blocks = render_preview(request.POST.get("markdown", ""))
+    return HttpResponse("".join(block.html for block in blocks))
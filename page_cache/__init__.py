@@ -0,0 +1 @@
+"""Page cache app."""
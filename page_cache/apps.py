@@ -0,0 +1,13 @@
+"""App configuration for the page_cache app."""
+
+from django.apps import AppConfig
+
+
+class PageCacheConfig(AppConfig):
+    """App configuration for the page_cache app."""
+
+    name = "page_cache"
+
+    def ready(self) -> None:
+        """Connect the signal handlers that invalidate cached pages."""
+        import page_cache.signals  # noqa: F401, PLC0415
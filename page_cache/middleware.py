@@ -0,0 +1,208 @@
+"""Middleware that caches the djpress pages for anonymous visitors and answers conditional GET requests."""
+
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.urls import Resolver404, resolve
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+from page_cache.tags import get_cache, get_tag_versions, tags_for_path
+from page_cache.validators import get_etag, get_last_modified, get_seconds_until_next_post
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.http import HttpRequest
+
+PAGE_KEY = "page_cache:page:{digest}"
+
+# Query string parameters that are part of the cache key. Requests with any other parameters aren't cached.
+CACHED_QUERY_PARAMETERS = frozenset({"page"})
+
+# URL names, other than the djpress URLs, whose content is derived from the blog content.
+CONDITIONAL_URL_NAMES = frozenset({"sitemap", "sitemap-section", "robots"})
+
+
+def is_anonymous_read(request: HttpRequest) -> bool:
+    """Return True if the request is a GET or HEAD request from a visitor without a session.
+
+    Args:
+        request (HttpRequest): The request.
+
+    Returns:
+        bool: Whether the response can be shared with other visitors.
+    """
+    return request.method in {"GET", "HEAD"} and settings.SESSION_COOKIE_NAME not in request.COOKIES
+
+
+class ConditionalGetMiddleware:
+    """Answer conditional GET requests for the blog pages without rendering them.
+
+    Unlike Django's ConditionalGetMiddleware, which works out the ETag from the rendered response, the validators are
+    derived from when the blog content last changed, so a request with a matching If-None-Match or If-Modified-Since
+    header gets a 304 response without running the view. This covers the djpress pages, the sitemap and robots.txt, and
+    must come before the page cache middleware.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Initialize the middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Return a 304 response if the page hasn't changed, or add the validators to the response."""
+        if not self.is_conditional(request):
+            return self.get_response(request)
+
+        last_modified = get_last_modified()
+        etag = get_etag(request, last_modified)
+        timestamp = int(last_modified.timestamp())
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is not None:
+            return response
+
+        response = self.get_response(request)
+        if response.status_code == 200 and not response.streaming:  # noqa: PLR2004
+            response.headers.setdefault("ETag", etag)
+            response.headers.setdefault("Last-Modified", http_date(timestamp))
+            # Logged in users see different pages
+            patch_vary_headers(response, ["Cookie"])
+
+        return response
+
+    @staticmethod
+    def is_conditional(request: HttpRequest) -> bool:
+        """Return True if the request is for a page whose validators are derived from the blog content.
+
+        Args:
+            request (HttpRequest): The request.
+
+        Returns:
+            bool: Whether to handle the request.
+        """
+        if not settings.CONDITIONAL_GET_ENABLED or not is_anonymous_read(request):
+            return False
+
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return False
+
+        return match.namespace == "djpress" or match.url_name in CONDITIONAL_URL_NAMES
+
+
+class PageCacheMiddleware:
+    """Serve fully rendered djpress pages to anonymous visitors from the cache.
+
+    Only GET and HEAD requests from visitors without a session cookie are cached, so this must come before the session
+    middleware: a cached page is served without touching the session, CSRF or authentication middleware, the database
+    or the templates. Pages are stored with the versions of their dependency tags and are ignored once any of the tags
+    has been invalidated by the signal handlers in `page_cache.signals`.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Initialize the middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Serve the page from the cache, or render it and cache it."""
+        tags = self.get_tags(request)
+        if tags is None:
+            return self.get_response(request)
+
+        key = PAGE_KEY.format(digest=hashlib.sha256(request.build_absolute_uri().encode()).hexdigest())
+        cache = get_cache()
+
+        entry = cache.get(key)
+        if entry is not None and get_tag_versions(entry["tags"]) == entry["tags"]:
+            return self.build_response(entry)
+
+        # Get the tag versions before rendering, so that a page rendered while one of its tags is invalidated is stored
+        # with the old version and ignored.
+        versions = get_tag_versions(tags, create=True)
+        response = self.get_response(request)
+        if request.method == "GET" and self.is_cacheable(response):
+            entry = {
+                "status": response.status_code,
+                "headers": dict(response.headers),
+                "content": response.content,
+                "tags": versions,
+            }
+            cache.set(key, entry, self.get_timeout())
+            response.headers["X-Page-Cache"] = "MISS"
+
+        return response
+
+    @staticmethod
+    def get_tags(request: HttpRequest) -> set[str] | None:
+        """Return the dependency tags for the request, or None if it can't be served from the cache.
+
+        Args:
+            request (HttpRequest): The request.
+
+        Returns:
+            set[str] | None: The tags.
+        """
+        if (
+            not settings.PAGE_CACHE_ENABLED
+            or not is_anonymous_read(request)
+            or not CACHED_QUERY_PARAMETERS.issuperset(request.GET)
+        ):
+            return None
+
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return None
+
+        if match.namespace != "djpress":
+            return None
+
+        return tags_for_path(match.kwargs.get("path", ""))
+
+    @staticmethod
+    def is_cacheable(response: HttpResponse) -> bool:
+        """Return True if the response can be served to other visitors.
+
+        Args:
+            response (HttpResponse): The response.
+
+        Returns:
+            bool: Whether the response can be cached.
+        """
+        cache_control = response.get("Cache-Control", "")
+        return (
+            response.status_code == 200  # noqa: PLR2004
+            and not response.streaming
+            and not response.cookies
+            and "private" not in cache_control
+            and "no-store" not in cache_control
+        )
+
+    @staticmethod
+    def get_timeout() -> int:
+        """Return how long to cache a page for: the page cache timeout, or until the next scheduled post is due.
+
+        Returns:
+            int: The timeout in seconds.
+        """
+        return get_seconds_until_next_post(settings.PAGE_CACHE_TIMEOUT)
+
+    @staticmethod
+    def build_response(entry: dict[str, Any]) -> HttpResponse:
+        """Build a response from a cache entry.
+
+        Args:
+            entry (dict[str, Any]): The cache entry.
+
+        Returns:
+            HttpResponse: The response.
+        """
+        response = HttpResponse(entry["content"], status=entry["status"])
+        for header, value in entry["headers"].items():
+            response.headers[header] = value
+        response.headers["X-Page-Cache"] = "HIT"
+        return response
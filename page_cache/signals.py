@@ -0,0 +1,93 @@
+"""Signal handlers that invalidate cached pages when the content they depend on changes."""
+
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from djpress.models import Category, Post, Tag
+
+from page_cache.tags import invalidate_tags, tags_for_post, tags_for_term
+from page_cache.validators import mark_content_changed
+
+
+def invalidate_on_commit(tags: set[str]) -> None:
+    """Invalidate the tags once the current transaction commits, so that pages aren't re-cached with the old content.
+
+    The conditional GET validators are also worked out again.
+
+    Args:
+        tags (set[str]): The tags.
+    """
+
+    def invalidate() -> None:
+        invalidate_tags(tags)
+        mark_content_changed()
+
+    if tags:
+        transaction.on_commit(invalidate)
+
+
+@receiver(pre_save, sender=Post)
+@receiver(pre_delete, sender=Post)
+def remember_post_tags(instance: Post, **_: Any) -> None:  # noqa: ANN401
+    """Remember the tags for a post as it was before it changed, such as its old date archives and categories."""
+    if instance.pk is None:
+        instance._page_cache_tags = set()  # noqa: SLF001
+        return
+
+    old = Post.admin_objects.select_related("author").filter(pk=instance.pk).first()
+    instance._page_cache_tags = tags_for_post(old) if old else set()  # noqa: SLF001
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post(instance: Post, **_: Any) -> None:  # noqa: ANN401
+    """Invalidate the pages that showed the post before it changed, and the pages that show it now."""
+    old_tags = getattr(instance, "_page_cache_tags", set())
+    invalidate_on_commit(old_tags | tags_for_post(instance))
+
+
+@receiver(pre_save, sender=Category)
+@receiver(pre_save, sender=Tag)
+@receiver(pre_delete, sender=Category)
+@receiver(pre_delete, sender=Tag)
+def remember_term_tags(sender: type[Category | Tag], instance: Category | Tag, **_: Any) -> None:  # noqa: ANN401
+    """Remember the tags for a category or tag as it was before it changed, such as its old slug."""
+    old = sender.objects.filter(pk=instance.pk).first() if instance.pk else None
+    instance._page_cache_tags = tags_for_term(old) if old else set()  # noqa: SLF001
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Tag)
+def invalidate_term(instance: Category | Tag, **_: Any) -> None:  # noqa: ANN401
+    """Invalidate the pages that show a category or tag."""
+    old_tags = getattr(instance, "_page_cache_tags", set())
+    invalidate_on_commit(old_tags | {f"{instance._meta.model_name}:{instance.slug}"})  # noqa: SLF001
+
+
+@receiver(m2m_changed, sender=Post.categories.through)
+@receiver(m2m_changed, sender=Post.tags.through)
+def invalidate_post_terms(
+    instance: Post | Category | Tag,
+    action: str,
+    model: type[Post | Category | Tag],
+    pk_set: set[int] | None,
+    **_: Any,  # noqa: ANN401
+) -> None:
+    """Invalidate the pages for a post and the categories or tags added to it or removed from it.
+
+    The relationship can be changed from either side, so the instance is either a post or a category or tag. Clearing
+    the relationship is handled before it happens, while we can still see what's being removed.
+    """
+    if action not in {"post_add", "post_remove", "pre_clear"}:
+        return
+
+    changed = model._base_manager.filter(pk__in=pk_set) if pk_set else []  # noqa: SLF001
+    tags = set()
+    for obj in (instance, *changed):
+        tags |= tags_for_post(obj) if isinstance(obj, Post) else tags_for_term(obj)
+
+    invalidate_on_commit(tags)
@@ -0,0 +1,176 @@
+"""Dependency tags for cached pages.
+
+Every cached page is stored with a set of tags that describe the content it was built from, and the current version of
+each tag. Invalidating a tag gives it a new version, so every page stored with an older version is treated as missing
+the next time it is requested.
+
+The tags are:
+    site: Every page, because the sidebar lists the site's pages
+    index: The index pages
+    feed: The RSS feed
+    post:<slug>: A single post or page
+    archives:<year>, archives:<year>-<month>, archives:<year>-<month>-<day>: The date archives
+    category:<slug>, tag:<slug>, author:<username>: The category, tag and author pages
+"""
+
+import re
+import secrets
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import caches
+from djpress.conf import settings as djpress_settings
+from djpress.url_utils import get_path_regex
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from django.core.cache.backends.base import BaseCache
+    from djpress.models import Category, Post, Tag
+
+SITE_TAG = "site"
+INDEX_TAG = "index"
+FEED_TAG = "feed"
+
+TAG_VERSION_KEY = "page_cache:tag:{tag}"
+
+
+def get_cache() -> BaseCache:
+    """Return the Django cache used for cached pages and tag versions."""
+    return caches[settings.PAGE_CACHE_ALIAS]
+
+
+def tags_for_path(path: str) -> set[str] | None:
+    """Return the tags for a djpress path.
+
+    The djpress dispatcher tries each kind of URL in turn, so the path gets the tags for every kind of URL it matches.
+
+    Args:
+        path (str): The path, relative to the djpress URLs, e.g. "2024/06/my-post".
+
+    Returns:
+        set[str] | None: The tags, or None if the page shouldn't be cached.
+    """
+    if not path:
+        return {SITE_TAG, INDEX_TAG}
+
+    if djpress_settings.RSS_ENABLED and path.rstrip("/") == djpress_settings.RSS_PATH:
+        return {FEED_TAG}
+
+    # Search results depend on the query string
+    if djpress_settings.SEARCH_ENABLED and path.rstrip("/") == djpress_settings.SEARCH_PREFIX:
+        return None
+
+    tags = {SITE_TAG}
+
+    if post_match := re.fullmatch(get_path_regex("post"), path):
+        tags.add(f"post:{post_match['slug']}")
+
+    if archives_match := re.fullmatch(get_path_regex("archives"), path):
+        tags.add(archives_tag(**archives_match.groupdict()))
+
+    for kind, enabled, prefix, group in (
+        ("category", djpress_settings.CATEGORY_ENABLED, djpress_settings.CATEGORY_PREFIX, "slug"),
+        ("tag", djpress_settings.TAG_ENABLED, djpress_settings.TAG_PREFIX, "slug"),
+        ("author", djpress_settings.AUTHOR_ENABLED, djpress_settings.AUTHOR_PREFIX, "author"),
+    ):
+        if enabled and prefix and (match := re.fullmatch(get_path_regex(kind), path)):
+            tags.add(f"{kind}:{match[group]}")
+
+    if page_match := re.fullmatch(get_path_regex("page"), path):
+        tags.add(f"post:{page_match['path'].rstrip('/').rsplit('/', 1)[-1]}")
+
+    return tags
+
+
+def archives_tag(year: str, month: str | None = None, day: str | None = None) -> str:
+    """Return the tag for a date archive.
+
+    Args:
+        year (str): The year.
+        month (str | None): The month, if it's a monthly or daily archive.
+        day (str | None): The day, if it's a daily archive.
+
+    Returns:
+        str: The tag.
+    """
+    return "archives:" + "-".join(part for part in (year, month, day) if part)
+
+
+def tags_for_post(post: Post) -> set[str]:
+    """Return the tags for the pages that show a post or page.
+
+    Args:
+        post (Post): The post or page.
+
+    Returns:
+        set[str]: The tags.
+    """
+    tags = {f"post:{post.slug}"}
+
+    if post.post_type == "page":
+        # Pages are listed in the sidebar of every page
+        tags.add(SITE_TAG)
+        return tags
+
+    tags.update((INDEX_TAG, FEED_TAG, f"author:{post.author.get_username()}"))
+    if post._date:  # noqa: SLF001
+        year, month, day = post._date.strftime("%Y %m %d").split()  # noqa: SLF001
+        tags.update((archives_tag(year), archives_tag(year, month), archives_tag(year, month, day)))
+
+    if post.pk:
+        tags.update(f"category:{slug}" for slug in post.categories.values_list("slug", flat=True))
+        tags.update(f"tag:{slug}" for slug in post.tags.values_list("slug", flat=True))
+
+    return tags
+
+
+def tags_for_term(term: Category | Tag) -> set[str]:
+    """Return the tags for the pages that show a category or tag.
+
+    A category or tag is shown on its own page, and on every page that shows one of its posts.
+
+    Args:
+        term (Category | Tag): The category or tag.
+
+    Returns:
+        set[str]: The tags.
+    """
+    tags = {f"{term._meta.model_name}:{term.slug}"}  # noqa: SLF001
+    if term.pk:
+        for post in term._posts.select_related("author"):  # noqa: SLF001
+            tags |= tags_for_post(post)
+
+    return tags
+
+
+def get_tag_versions(tags: Iterable[str], *, create: bool = False) -> dict[str, str]:
+    """Get the current version of each tag.
+
+    Args:
+        tags (Iterable[str]): The tags.
+        create (bool): Whether to give a version to tags that don't have one yet.
+
+    Returns:
+        dict[str, str]: The version of each tag that has one.
+    """
+    cache = get_cache()
+    keys = {TAG_VERSION_KEY.format(tag=tag): tag for tag in tags}
+    versions = {keys[key]: version for key, version in cache.get_many(keys).items()}
+
+    if create:
+        for key, tag in keys.items():
+            if tag not in versions:
+                cache.add(key, secrets.token_hex(8), timeout=None)
+                versions[tag] = cache.get(key)
+
+    return versions
+
+
+def invalidate_tags(tags: Iterable[str]) -> None:
+    """Invalidate every cached page that was stored with any of the tags.
+
+    Args:
+        tags (Iterable[str]): The tags.
+    """
+    get_cache().set_many({TAG_VERSION_KEY.format(tag=tag): secrets.token_hex(8) for tag in tags}, timeout=None)
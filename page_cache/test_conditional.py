@@ -0,0 +1,108 @@
+"""Tests for the conditional GET middleware."""
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils import timezone
+from djpress.models import Category, Post
+
+from page_cache.validators import get_last_modified, get_templates_last_modified
+
+
+@pytest.fixture(autouse=True)
+def conditional_get(settings):
+    settings.CONDITIONAL_GET_ENABLED = True
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def post():
+    user = User.objects.create_user(username="testuser", password="testpass")
+    post = Post.objects.create(
+        title="First Post",
+        slug="first-post",
+        content="The first post.",
+        author=user,
+        status="published",
+    )
+    post.categories.set([Category.objects.create(title="Django", slug="django")])
+    return post
+
+
+@pytest.mark.django_db
+def test_not_modified_without_rendering(client, post, django_assert_num_queries):
+    """Test a request with a matching ETag gets a 304 without any queries."""
+    response = client.get(post.url)
+    assert response.status_code == 200
+    etag = response["ETag"]
+    last_modified = response["Last-Modified"]
+
+    with django_assert_num_queries(0):
+        response = client.get(post.url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = client.get(post.url, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_etag_depends_on_the_url(client, post):
+    """Test each page has its own ETag."""
+    etag = client.get(post.url)["ETag"]
+
+    assert client.get("/")["ETag"] != etag
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 200
+
+
+@pytest.mark.django_db
+def test_saving_a_post_changes_the_validators(client, post, django_capture_on_commit_callbacks):
+    """Test saving a post changes the validators for every page."""
+    etag = client.get("/")["ETag"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        post.title = "Renamed Post"
+        post.save()
+
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 200
+
+
+@pytest.mark.django_db
+def test_changing_a_category_changes_the_validators(client, post, django_capture_on_commit_callbacks):
+    """Test changing a category, which has no timestamp of its own, changes the validators."""
+    etag = client.get("/category/django/")["ETag"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Category.objects.filter(slug="django").get().delete()
+
+    assert client.get("/category/django/", headers={"If-None-Match": etag}).status_code != 304
+
+
+@pytest.mark.django_db
+def test_sitemap_and_robots(client, post):
+    """Test the sitemap and robots.txt have validators, and the sitemap's Last-Modified is the one that's checked."""
+    for url in ("/sitemap.xml", "/sitemap-posts.xml", "/robots.txt"):
+        response = client.get(url)
+        assert response.status_code == 200
+        assert client.get(url, headers={"If-None-Match": response["ETag"]}).status_code == 304
+        assert client.get(url, headers={"If-Modified-Since": response["Last-Modified"]}).status_code == 304
+
+
+@pytest.mark.django_db
+def test_requests_that_are_not_conditional(client, post, settings):
+    """Test visitors with a session and other apps don't get validators."""
+    client.cookies[settings.SESSION_COOKIE_NAME] = "abc"
+    assert "ETag" not in client.get(post.url)
+    del client.cookies[settings.SESSION_COOKIE_NAME]
+
+    assert "ETag" not in client.get("/healthcheck/")
+
+
+@pytest.mark.django_db
+def test_last_modified_includes_published_posts_and_templates(post):
+    """Test the last modified time covers posts and templates."""
+    assert get_last_modified() >= max(post.updated_at, get_templates_last_modified())
+    assert get_last_modified() <= timezone.now()
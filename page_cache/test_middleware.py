@@ -0,0 +1,171 @@
+"""Tests for the page_cache app."""
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils import timezone
+from djpress.models import Category, Post
+
+from page_cache.middleware import PageCacheMiddleware
+from page_cache.tags import tags_for_path, tags_for_post
+
+
+@pytest.fixture(autouse=True)
+def page_cache(settings):
+    settings.PAGE_CACHE_ENABLED = True
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create_user(username="testuser", password="testpass")
+
+
+@pytest.fixture
+def category(user):
+    return Category.objects.create(title="Django", slug="django")
+
+
+@pytest.fixture
+def post(user, category):
+    post = Post.objects.create(
+        title="First Post",
+        slug="first-post",
+        content="The first post.",
+        author=user,
+        status="published",
+        published_at=timezone.make_aware(timezone.datetime(2024, 6, 1, 12)),
+    )
+    post.categories.set([category])
+    return post
+
+
+@pytest.fixture
+def other_post(user):
+    return Post.objects.create(
+        title="Other Post",
+        slug="other-post",
+        content="Another post.",
+        author=user,
+        status="published",
+        published_at=timezone.make_aware(timezone.datetime(2023, 1, 1, 12)),
+    )
+
+
+def test_tags_for_path():
+    """Test the tags for each kind of djpress URL."""
+    assert tags_for_path("") == {"site", "index"}
+    assert tags_for_path("rss/") == {"feed"}
+    assert tags_for_path("2024/06/first-post/") == {"site", "post:first-post"}
+    assert tags_for_path("2024/06/") == {"site", "archives:2024-06", "post:06"}
+    assert tags_for_path("category/django/") == {"site", "category:django", "post:django"}
+    assert tags_for_path("author/testuser/") == {"site", "author:testuser", "post:testuser"}
+    assert tags_for_path("about/team/") == {"site", "post:team"}
+
+
+@pytest.mark.django_db
+def test_tags_for_post(post):
+    """Test a post's tags cover every page that lists it."""
+    assert tags_for_post(post) == {
+        "post:first-post",
+        "index",
+        "feed",
+        "author:testuser",
+        "archives:2024",
+        "archives:2024-06",
+        "archives:2024-06-01",
+        "category:django",
+    }
+
+
+@pytest.mark.django_db
+def test_anonymous_pages_are_cached(client, post, django_assert_num_queries):
+    """Test the second request for a page is served from the cache without any queries."""
+    response = client.get(post.url)
+    assert response.status_code == 200
+    assert response["X-Page-Cache"] == "MISS"
+
+    with django_assert_num_queries(0):
+        cached = client.get(post.url)
+
+    assert cached["X-Page-Cache"] == "HIT"
+    assert cached.content == response.content
+    assert cached["Content-Type"] == response["Content-Type"]
+
+
+@pytest.mark.django_db
+def test_requests_that_are_not_cached(client, post):
+    """Test visitors with a session, unknown query strings, errors and other apps aren't cached."""
+    client.cookies["sessionid"] = "abc"
+    assert "X-Page-Cache" not in client.get(post.url)
+    del client.cookies["sessionid"]
+
+    assert "X-Page-Cache" not in client.get(f"{post.url}?utm_source=feed")
+    assert client.get("/?page=1")["X-Page-Cache"] == "MISS"
+    assert "X-Page-Cache" not in client.get("/2024/06/missing-post/")
+    assert "X-Page-Cache" not in client.get("/robots.txt")
+    assert "X-Page-Cache" not in client.post(post.url)
+
+
+@pytest.mark.django_db
+def test_saving_a_post_invalidates_its_pages(client, post, other_post, django_capture_on_commit_callbacks):
+    """Test saving a post invalidates its own page and the pages that list it, and nothing else."""
+    urls = [post.url, "/", "/category/django/", "/2024/", other_post.url]
+    for url in urls:
+        client.get(url)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        post.title = "Renamed Post"
+        post.save()
+
+    assert [client.get(url)["X-Page-Cache"] for url in urls] == ["MISS", "MISS", "MISS", "MISS", "HIT"]
+    assert b"Renamed Post" in client.get("/").content
+
+
+@pytest.mark.django_db
+def test_changing_categories_invalidates_category_pages(client, post, user, django_capture_on_commit_callbacks):
+    """Test adding or removing a category invalidates the category pages."""
+    news = Category.objects.create(title="News", slug="news")
+    for url in ("/category/django/", "/category/news/"):
+        client.get(url)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        post.categories.set([news])
+
+    response = client.get("/category/news/")
+    assert response["X-Page-Cache"] == "MISS"
+    assert b"First Post" in response.content
+    assert client.get("/category/django/")["X-Page-Cache"] == "MISS"
+
+
+@pytest.mark.django_db
+def test_renaming_a_category_invalidates_its_posts(client, post, category, django_capture_on_commit_callbacks):
+    """Test renaming a category invalidates the pages for the posts in it."""
+    client.get(post.url)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        category.title = "Python"
+        category.save()
+
+    assert client.get(post.url)["X-Page-Cache"] == "MISS"
+
+
+@pytest.mark.django_db
+def test_timeout_stops_at_next_scheduled_post(settings, user):
+    """Test pages are only cached until the next scheduled post is published."""
+    settings.PAGE_CACHE_TIMEOUT = 3600
+    assert PageCacheMiddleware.get_timeout() == 3600
+
+    Post.objects.create(
+        title="Scheduled",
+        content="Coming soon.",
+        author=user,
+        status="published",
+        published_at=timezone.now() + timedelta(minutes=10),
+    )
+
+    assert 590 <= PageCacheMiddleware.get_timeout() <= 600
@@ -0,0 +1,119 @@
+"""Validators for conditional GET requests, derived from when the site's content last changed."""
+
+import functools
+import hashlib
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.db.models import Max, Min, Q
+from django.template import engines
+from django.utils import timezone
+from djpress.models import Post
+
+from page_cache.tags import get_cache
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+# When the validators were last calculated, and when the content was last changed according to the signal handlers.
+LAST_MODIFIED_KEY = "page_cache:last_modified"
+CONTENT_CHANGED_KEY = "page_cache:content_changed"
+
+
+@functools.cache
+def get_templates_last_modified() -> datetime:
+    """Return when the newest template was last modified.
+
+    Templates only change when the site is deployed, so this is only worked out once per process.
+
+    Returns:
+        datetime: The modification time of the newest template.
+    """
+    newest = 0.0
+    for directory in engines["django"].template_dirs:
+        for path in Path(directory).rglob("*"):
+            if path.is_file():
+                newest = max(newest, path.stat().st_mtime)
+
+    return datetime.fromtimestamp(newest, tz=UTC)
+
+
+def get_next_scheduled_post() -> datetime | None:
+    """Return when the next scheduled post is due to be published.
+
+    A scheduled post is published when its publication date passes, without being saved, so anything worked out from
+    the published posts is only valid until then.
+
+    Returns:
+        datetime | None: The publication date of the next scheduled post, or None if there isn't one.
+    """
+    return Post.admin_objects.filter(status="published", published_at__gt=timezone.now()).aggregate(
+        next_post=Min("published_at"),
+    )["next_post"]
+
+
+def get_seconds_until_next_post(timeout: int) -> int:
+    """Return the timeout, shortened to expire when the next scheduled post is due.
+
+    Args:
+        timeout (int): The timeout in seconds.
+
+    Returns:
+        int: The timeout in seconds.
+    """
+    next_post = get_next_scheduled_post()
+    if next_post is None:
+        return timeout
+
+    return min(timeout, max(1, int((next_post - timezone.now()).total_seconds())))
+
+
+def mark_content_changed() -> None:
+    """Record that the content has changed, so the validators are worked out again."""
+    cache = get_cache()
+    cache.set(CONTENT_CHANGED_KEY, timezone.now(), timeout=None)
+    cache.delete(LAST_MODIFIED_KEY)
+
+
+def get_last_modified() -> datetime:
+    """Return when anything shown on the blog pages last changed.
+
+    This is the latest of: the last time a post was updated, the last time a post was published, the last change
+    recorded by the signal handlers (which also covers categories, tags and deleted posts), and the newest template.
+    The result is cached until the content changes or the next scheduled post is due.
+
+    Returns:
+        datetime: The last modification time.
+    """
+    cache = get_cache()
+    last_modified = cache.get(LAST_MODIFIED_KEY)
+    if last_modified is not None:
+        return last_modified
+
+    now = timezone.now()
+    latest = Post.admin_objects.aggregate(
+        updated=Max("updated_at"),
+        published=Max("published_at", filter=Q(status="published", published_at__lte=now)),
+    )
+    candidates = [*latest.values(), cache.get(CONTENT_CHANGED_KEY), get_templates_last_modified()]
+    last_modified = max(candidate for candidate in candidates if candidate is not None)
+
+    cache.set(LAST_MODIFIED_KEY, last_modified, get_seconds_until_next_post(60 * 60 * 24))
+    return last_modified
+
+
+def get_etag(request: HttpRequest, last_modified: datetime) -> str:
+    """Return the ETag for a page.
+
+    The ETag is weak, because some pages, such as the sitemaps, are served compressed or uncompressed.
+
+    Args:
+        request (HttpRequest): The request for the page.
+        last_modified (datetime): When the content last changed.
+
+    Returns:
+        str: The quoted ETag.
+    """
+    digest = hashlib.sha256(f"{request.get_full_path()}|{last_modified.isoformat()}".encode()).hexdigest()
+    return f'W/"{digest[:32]}"'
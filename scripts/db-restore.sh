@@ -8,34 +8,24 @@ set -euf -o pipefail
 DB_NAME="${DB_NAME:-db}"
 BACKUP_PATH="/app/db"  # This must match the path in the Dockerfile and backup.sh
 DB_PATH="${BACKUP_PATH}/${DB_NAME}.sqlite3"
-TEMP_RESTORE_FILE="${BACKUP_PATH}/latest-backup.tar.gz"
 
-# Function to download the latest SQLite database backup from S3
-download_latest_backup() {
-    echo "Downloading latest SQLite database backup from S3..."
-    # This will give us the file name of the most recent backup.
-    # s5cmd ls doesn't have a direct sort option, so we'll pipe to sort
-    LATEST_BACKUP=$(s5cmd --endpoint-url "${AWS_ENDPOINT_URL}" ls "s3://${S3_BUCKET}/" | sort | tail -n 1 | awk '{print $NF}')
-
-    if [ -z "${LATEST_BACKUP}" ]; then
-        # There's no backup so nothing to do.
-        echo "No backup found in S3 bucket."
+# Restore the newest backup: the WAL generation shipped by `ship_wal`, replayed to its last segment, or the latest
+# hourly backup if that's newer. The manifests say which is newest. Set RESTORE_TO to an ISO 8601 time to restore the
+# database as it was at that time instead.
+restore_backup() {
+    echo "Restoring SQLite database from S3..."
+    if [ -n "${RESTORE_TO:-}" ]; then
+        python /app/manage.py restore_database --to "${RESTORE_TO}"
     else
-        # Found a backup, download and extract it
-        echo "Latest backup found: ${LATEST_BACKUP}"
-        s5cmd --endpoint-url "${AWS_ENDPOINT_URL}" cp s3://${S3_BUCKET}/${LATEST_BACKUP} "${TEMP_RESTORE_FILE}"
-        tar --gzip -xf "${TEMP_RESTORE_FILE}" -O > "${DB_PATH}"
-        # Clean up the temporary file we downloaded
-        rm "${TEMP_RESTORE_FILE}"
-        echo "SQLite database backup downloaded and extracted."
+        python /app/manage.py restore_database
     fi
 }
 
-# Check if the database file exists - if it doesn't, download the latest backup
+# Check if the database file exists - if it doesn't, restore the latest backup
 echo "Checking if SQLite database file exists"
 if [ ! -f "${DB_PATH}" ]; then
     if [ -n "${AWS_ENDPOINT_URL:-}" ]; then
-        download_latest_backup
+        restore_backup
     else
         echo "AWS_ENDPOINT_URL is not set; skipping backup download"
     fi
@@ -0,0 +1,12 @@
+#!/bin/bash
+
+# Exit immediately if any command fails
+set -euf -o pipefail
+
+# Infisical integration
+INFISICAL_TOKEN=$(infisical login --method=universal-auth --client-id="${INFISICAL_MACHINE_CLIENT_ID}" --client-secret="${INFISICAL_MACHINE_CLIENT_SECRET}" --plain --silent)
+export INFISICAL_TOKEN
+
+# Ship the database's WAL to S3 until stopped. This has to run on the same volume as the site's database.
+echo "Shipping the database WAL"
+exec infisical run --token "${INFISICAL_TOKEN}" --projectId "${PROJECT_ID}" --env "${INFISICAL_SECRET_ENV}" -- python manage.py ship_wal
@@ -7,3 +7,7 @@ class SpfGeneratorConfig(AppConfig):
     """App configuration for the SPF Generator app."""
 
     name = "spf_generator"
+
+    def ready(self) -> None:
+        """Connect the signal handlers that keep the provider catalogue up to date."""
+        import spf_generator.signals  # noqa: F401, PLC0415
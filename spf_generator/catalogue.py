@@ -0,0 +1,152 @@
+"""The catalogue of email providers that can be selected for an SPF record.
+
+The catalogue is an immutable snapshot of the active providers, built with a single query and kept in each process. The
+form's fields, the page's provider lookup, the template filters and the records of the providers selected on the page
+or through the batch API are all resolved from it, so neither queries the providers once the catalogue is built.
+
+A version stamp in the cache says which snapshot is current. The stamp is replaced whenever a provider is saved or
+deleted, or the providers are populated, and each process builds a new snapshot the next time it sees a new stamp. The
+other processes see the new stamp once it expires from their cache's memory tier.
+"""
+
+import secrets
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from django.core.cache import caches
+from django.db import transaction
+
+from spf_generator.models import EmailProvider, ProviderCategory
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from spf_generator.engine import ProviderRecord
+
+# The order the categories are shown in, which the form's fields follow
+CATEGORY_ORDER = {category: index for index, category in enumerate(ProviderCategory.values)}
+
+CATALOGUE_CACHE_ALIAS = "default"
+CATALOGUE_VERSION_KEY = "spf_generator:catalogue:version"
+
+
+@dataclass(frozen=True)
+class Catalogue:
+    """A snapshot of the active providers.
+
+    Attributes:
+        version (str): The version stamp the snapshot was built for.
+        providers (Mapping[int, EmailProvider]): The providers by ID, grouped in the order of the categories and sorted
+            by priority within each category.
+        by_category (Mapping[str, tuple[EmailProvider, ...]]): The providers in each category, sorted by priority.
+        records (Mapping[int, ProviderRecord]): The providers' records for the SPF engine by ID, ranked in the order
+            of the catalogue.
+    """
+
+    version: str
+    providers: Mapping[int, EmailProvider]
+    by_category: Mapping[str, tuple[EmailProvider, ...]]
+    records: Mapping[int, ProviderRecord]
+
+    @classmethod
+    def build(cls, version: str) -> Catalogue:
+        """Build a snapshot of the active providers with a single query.
+
+        Args:
+            version (str): The version stamp the snapshot is for.
+
+        Returns:
+            Catalogue: The snapshot.
+        """
+        providers = sorted(
+            (provider for provider in EmailProvider.objects.filter(active=True) if provider.category in CATEGORY_ORDER),
+            key=lambda provider: (CATEGORY_ORDER[provider.category], provider.priority, provider.name),
+        )
+        by_category = {
+            category: tuple(provider for provider in providers if provider.category == category)
+            for category in CATEGORY_ORDER
+        }
+        return cls(
+            version=version,
+            providers=MappingProxyType({provider.pk: provider for provider in providers}),
+            by_category=MappingProxyType(by_category),
+            records=MappingProxyType(
+                {provider.pk: provider.as_record(rank) for rank, provider in enumerate(providers)}
+            ),
+        )
+
+    def select(self, ids: Iterable[int]) -> list[EmailProvider]:
+        """Return the providers with the IDs, skipping any that aren't in the catalogue.
+
+        Args:
+            ids (Iterable[int]): The IDs.
+
+        Returns:
+            list[EmailProvider]: The providers.
+        """
+        return [self.providers[pk] for pk in ids if pk in self.providers]
+
+    def select_records(self, ids: Iterable[int]) -> list[ProviderRecord]:
+        """Return the records of the providers with the IDs, skipping any that aren't in the catalogue.
+
+        Args:
+            ids (Iterable[int]): The IDs.
+
+        Returns:
+            list[ProviderRecord]: The providers' records.
+        """
+        return [self.records[pk] for pk in ids if pk in self.records]
+
+
+_catalogue: Catalogue | None = None
+_lock = threading.Lock()
+
+
+def catalogue_version() -> str:
+    """Return the current version stamp, creating one if there isn't one yet."""
+    cache = caches[CATALOGUE_CACHE_ALIAS]
+    version = cache.get(CATALOGUE_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOGUE_VERSION_KEY, secrets.token_hex(8), timeout=None)
+        version = cache.get(CATALOGUE_VERSION_KEY)
+
+    return version
+
+
+def get_catalogue() -> Catalogue:
+    """Return the process's snapshot of the providers, building a new one if the version stamp has changed.
+
+    Returns:
+        Catalogue: The snapshot.
+    """
+    global _catalogue  # noqa: PLW0603
+
+    version = catalogue_version()
+    catalogue = _catalogue
+    if catalogue is not None and catalogue.version == version:
+        return catalogue
+
+    with _lock:
+        if _catalogue is None or _catalogue.version != version:
+            _catalogue = Catalogue.build(version)
+        return _catalogue
+
+
+def invalidate_catalogue() -> None:
+    """Replace the version stamp once the current transaction commits, so every process builds a new snapshot."""
+
+    def invalidate() -> None:
+        caches[CATALOGUE_CACHE_ALIAS].set(CATALOGUE_VERSION_KEY, secrets.token_hex(8), timeout=None)
+
+    transaction.on_commit(invalidate)
+
+
+def prime_catalogue() -> int:
+    """Build the process's snapshot ahead of the first request.
+
+    Returns:
+        int: The number of providers in the catalogue.
+    """
+    return len(get_catalogue().providers)
@@ -0,0 +1,12 @@
+import pytest
+from django.core.cache import caches
+
+from spf_generator import catalogue
+from spf_generator.catalogue import CATALOGUE_CACHE_ALIAS, CATALOGUE_VERSION_KEY
+
+
+@pytest.fixture(autouse=True)
+def fresh_catalogue(monkeypatch):
+    """Start each test without a catalogue, as a test's rolled back transaction never replaces the version stamp."""
+    monkeypatch.setattr(catalogue, "_catalogue", None)
+    caches[CATALOGUE_CACHE_ALIAS].delete(CATALOGUE_VERSION_KEY)
@@ -0,0 +1,161 @@
+"""Composing SPF records from providers.
+
+The engine doesn't touch the database or the request. It works on compact records of the providers, which the
+catalogue builds once for each of its snapshots, so the generator page, the batch API and the model's validation all
+compose and check records the same way:
+
+- The custom IP address comes first, then the providers, sorted by priority.
+- The providers' DNS lookups can't add up to more than 10.
+- The record, ending with the `all` mechanism, can't be longer than 255 characters.
+
+The record's length is worked out before it's joined, so a selection that's too long is rejected without building it.
+"""
+
+import ipaddress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+# The limits of RFC 7208, section 4.6.4, and of a single TXT record string
+MAX_DNS_LOOKUPS = 10
+MAX_RECORD_LENGTH = 255
+
+SPF_VERSION = "v=spf1"
+DEFAULT_ALL_MECHANISM = "-all"
+
+NO_SELECTION_ERROR = "Please select at least one email provider or enter a custom IP address"
+LOOKUPS_ERROR = "Total DNS lookups ({lookups}) exceeds maximum of {maximum}"
+LENGTH_ERROR = "Combined SPF record exceeds {maximum} characters"
+INVALID_IP_ERROR = "Please enter a valid IP address"
+
+
+@dataclass(frozen=True, slots=True)
+class ProviderRecord:
+    """What the engine needs to know about a provider.
+
+    Attributes:
+        mechanism (str): The provider's SPF mechanism, e.g. `include:_spf.google.com`.
+        lookup_count (int): The number of DNS lookups the mechanism needs.
+        priority (int): The order the mechanism appears in the record.
+        rank (int): The provider's position in the catalogue, which orders providers with the same priority.
+    """
+
+    mechanism: str
+    lookup_count: int
+    priority: int
+    rank: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class SpfResult:
+    """The result of composing a record.
+
+    Attributes:
+        record (str | None): The SPF record, or None if the selection isn't valid.
+        error (str | None): Why the selection isn't valid, or None if it is.
+        lookups (int): The number of DNS lookups the providers need.
+    """
+
+    record: str | None
+    error: str | None = None
+    lookups: int = 0
+
+    @property
+    def valid(self) -> bool:
+        """Whether a record was composed."""
+        return self.error is None
+
+
+def ip_mechanism(value: str) -> str:
+    """Return the `ip4` or `ip6` mechanism for an IP address.
+
+    Args:
+        value (str): The IP address.
+
+    Returns:
+        str: The mechanism.
+
+    Raises:
+        ValueError: If the value isn't an IP address.
+    """
+    try:
+        address = ipaddress.ip_address(value)
+    except ValueError as exc:
+        raise ValueError(INVALID_IP_ERROR) from exc
+
+    return f"ip{address.version}:{value}"
+
+
+def order(providers: Iterable[ProviderRecord]) -> list[ProviderRecord]:
+    """Return the providers in the order their mechanisms appear in a record.
+
+    Args:
+        providers (Iterable[ProviderRecord]): The providers.
+
+    Returns:
+        list[ProviderRecord]: The providers, sorted by priority and then by their rank in the catalogue.
+    """
+    return sorted(providers, key=lambda provider: (provider.priority, provider.rank))
+
+
+def check(
+    providers: Sequence[ProviderRecord],
+    custom: str = "",
+    all_mechanism: str = DEFAULT_ALL_MECHANISM,
+) -> SpfResult:
+    """Check the providers can be combined, without composing the record.
+
+    Args:
+        providers (Sequence[ProviderRecord]): The providers.
+        custom (str): The custom IP address's mechanism, if there is one.
+        all_mechanism (str): The `all` mechanism that ends the record.
+
+    Returns:
+        SpfResult: The result, without the record.
+    """
+    lookups = 0
+    # The version, and a space before each mechanism and the `all` mechanism
+    length = len(SPF_VERSION) + len(all_mechanism) + 1
+    if custom:
+        length += len(custom) + 1
+    for provider in providers:
+        lookups += provider.lookup_count
+        length += len(provider.mechanism) + 1
+
+    if lookups > MAX_DNS_LOOKUPS:
+        return SpfResult(None, LOOKUPS_ERROR.format(lookups=lookups, maximum=MAX_DNS_LOOKUPS), lookups)
+    if length > MAX_RECORD_LENGTH:
+        return SpfResult(None, LENGTH_ERROR.format(maximum=MAX_RECORD_LENGTH), lookups)
+
+    return SpfResult(None, None, lookups)
+
+
+def compose(
+    providers: Sequence[ProviderRecord],
+    custom: str = "",
+    all_mechanism: str = DEFAULT_ALL_MECHANISM,
+) -> SpfResult:
+    """Compose an SPF record from the providers.
+
+    Args:
+        providers (Sequence[ProviderRecord]): The selected providers, in any order.
+        custom (str): The custom IP address's mechanism, if there is one.
+        all_mechanism (str): The `all` mechanism that ends the record.
+
+    Returns:
+        SpfResult: The record, or why the selection isn't valid.
+    """
+    if not providers and not custom:
+        return SpfResult(None, NO_SELECTION_ERROR)
+
+    result = check(providers, custom, all_mechanism)
+    if not result.valid:
+        return result
+
+    mechanisms = [provider.mechanism for provider in order(providers)]
+    if custom:
+        mechanisms.insert(0, custom)
+
+    return SpfResult(f"{SPF_VERSION} {' '.join(mechanisms)} {all_mechanism}", None, result.lookups)
@@ -0,0 +1,458 @@
+"""Flattening SPF records.
+
+An SPF record can't need more than 10 DNS lookups, and each provider's `include` can take several, so a few providers
+are enough to go over the limit. Flattening resolves the providers' mechanisms to the networks they allow instead:
+`include` and `redirect=` are followed through the providers' own SPF records, and `a` and `mx` are resolved to their
+addresses. The networks are collapsed, so adjacent and overlapping networks become one, and the record is written as
+`ip4` and `ip6` mechanisms, which don't need any lookups.
+
+A mechanism can't be flattened if its record has mechanisms that depend on the sender, like `exists` and `ptr`, or
+macros, or mechanisms that don't pass, which only matter to the mechanisms after them, or an `all` that passes, which
+allows every sender. Those mechanisms are kept as they are, with the lookups they need.
+
+A flattened record that's longer than 255 characters is split into several strings of one TXT record, which receivers
+join back together, or into `include`s of records on sub-domains of the domain. The record is only right until the
+providers change their networks, so it expires with the shortest TTL of the answers it was flattened from.
+"""
+
+import ipaddress
+import re
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from spf_generator.engine import (
+    DEFAULT_ALL_MECHANISM,
+    LOOKUPS_ERROR,
+    MAX_DNS_LOOKUPS,
+    MAX_RECORD_LENGTH,
+    NO_SELECTION_ERROR,
+    SPF_VERSION,
+    order,
+)
+from spf_generator.resolvers import DnsError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from spf_generator.engine import ProviderRecord
+    from spf_generator.resolvers import Resolver
+
+type Network = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+# The most DNS queries flattening one record can make, which stops records that are too deep from taking too long
+MAX_QUERIES = 100
+# The most MX hosts an `mx` mechanism can have, from RFC 7208, section 4.6.4
+MAX_MX_HOSTS = 10
+# The mechanisms that need a DNS lookup when the record is evaluated
+LOOKUP_MECHANISMS = frozenset({"include", "a", "mx", "ptr", "exists"})
+SUBDOMAIN_NAME = "_spf{number}.{domain}"
+
+QUALIFIERS = "+-~?"
+MODIFIER = re.compile(r"^([a-z][a-z0-9_.-]*)=(.*)$", re.IGNORECASE)
+# The `a` and `mx` mechanisms can have IPv4 and IPv6 prefix lengths, e.g. `a:example.com/24//64`
+ADDRESS_MECHANISM = re.compile(r"^(a|mx)(?::([^/]+))?(?:/(\d+))?(?://(\d+))?$", re.IGNORECASE)
+
+
+class FlattenError(Exception):
+    """A record couldn't be flattened."""
+
+
+class Split(StrEnum):
+    """How a flattened record that's too long is split.
+
+    STRINGS: Into several strings of the domain's TXT record
+    SUBDOMAINS: Into records on sub-domains of the domain, which the domain's record includes
+    """
+
+    STRINGS = "strings"
+    SUBDOMAINS = "subdomains"
+
+
+@dataclass(frozen=True)
+class Term:
+    """A mechanism or modifier of an SPF record.
+
+    Attributes:
+        name (str): The mechanism's or modifier's name, in lower case.
+        value (str): The domain or network after the colon, or the modifier's value.
+        qualifier (str): The mechanism's qualifier.
+        modifier (bool): Whether the term is a modifier.
+        cidr4 (int): The IPv4 prefix length of an `a` or `mx` mechanism.
+        cidr6 (int): The IPv6 prefix length of an `a` or `mx` mechanism.
+    """
+
+    name: str
+    value: str = ""
+    qualifier: str = "+"
+    modifier: bool = False
+    cidr4: int = 32
+    cidr6: int = 128
+
+    @classmethod
+    def parse(cls, text: str) -> Term:
+        """Parse a term.
+
+        Args:
+            text (str): The term, e.g. `include:_spf.google.com`, `~all` or `redirect=example.com`.
+
+        Returns:
+            Term: The term.
+        """
+        if match := MODIFIER.match(text):
+            return cls(match[1].lower(), match[2], modifier=True)
+
+        qualifier = "+"
+        if text[:1] in QUALIFIERS:
+            qualifier, text = text[0], text[1:]
+
+        if match := ADDRESS_MECHANISM.match(text):
+            name, value, cidr4, cidr6 = match.groups()
+            return cls(name.lower(), value or "", qualifier, cidr4=int(cidr4 or 32), cidr6=int(cidr6 or 128))
+
+        name, _, value = text.partition(":")
+        return cls(name.lower(), value, qualifier)
+
+
+@dataclass(frozen=True)
+class Expansion:
+    """What a mechanism or record was flattened to.
+
+    Attributes:
+        networks (list[Network]): The networks it allows.
+        lookups (int): The number of DNS lookups it needs when it isn't flattened.
+        flattenable (bool): Whether the networks are all it allows.
+    """
+
+    networks: list[Network]
+    lookups: int
+    flattenable: bool
+
+
+@dataclass(frozen=True)
+class TxtRecord:
+    """A TXT record of a flattened SPF record.
+
+    Attributes:
+        name (str): The record's name.
+        strings (tuple[str, ...]): The record's strings, none of them longer than 255 characters.
+    """
+
+    name: str
+    strings: tuple[str, ...]
+
+    @property
+    def value(self) -> str:
+        """The record, with its strings joined, as receivers read it."""
+        return "".join(self.strings)
+
+
+@dataclass(frozen=True)
+class FlattenedRecord:
+    """A flattened SPF record.
+
+    Attributes:
+        records (tuple[TxtRecord, ...]): The TXT records to publish, starting with the domain's own.
+        lookups (int): The number of DNS lookups the domain's record needs.
+        ttl (int | None): The number of seconds the record is right for, or None if it doesn't depend on DNS.
+        networks (int): The number of networks in the record.
+    """
+
+    records: tuple[TxtRecord, ...]
+    lookups: int
+    ttl: int | None
+    networks: int
+
+    @property
+    def record(self) -> str:
+        """The domain's own record."""
+        return self.records[0].value
+
+
+class Flattener:
+    """Resolves mechanisms to the networks they allow, counting the DNS queries made and the shortest TTL."""
+
+    def __init__(self, resolver: Resolver) -> None:
+        """Set the resolver.
+
+        Args:
+            resolver (Resolver): The resolver.
+        """
+        self.resolver = resolver
+        self.queries = 0
+        self.ttl: int | None = None
+
+    def query(self, name: str, rdtype: str) -> tuple[str, ...]:
+        """Return the records of a type for a name.
+
+        Raises:
+            FlattenError: If the name couldn't be resolved, or too many queries have been made.
+        """
+        self.queries += 1
+        if self.queries > MAX_QUERIES:
+            msg = f"Flattening needs more than {MAX_QUERIES} DNS queries"
+            raise FlattenError(msg)
+
+        try:
+            answer = self.resolver.resolve(name, rdtype)
+        except DnsError as exc:
+            raise FlattenError(str(exc)) from exc
+
+        self.ttl = answer.ttl if self.ttl is None else min(self.ttl, answer.ttl)
+        return answer.records
+
+    def spf_terms(self, domain: str) -> list[str]:
+        """Return the terms of a domain's SPF record.
+
+        Raises:
+            FlattenError: If the domain doesn't have exactly one SPF record.
+        """
+        records = [
+            record
+            for record in self.query(domain, "TXT")
+            if record.lower() == SPF_VERSION or record.lower().startswith(f"{SPF_VERSION} ")
+        ]
+        if len(records) != 1:
+            msg = f"{domain} has {len(records) or 'no'} SPF records"
+            raise FlattenError(msg)
+
+        return records[0].split()[1:]
+
+    def addresses(self, host: str, cidr4: int, cidr6: int) -> list[Network]:
+        """Return the networks of a host's addresses, with the prefix lengths."""
+        networks: list[Network] = [ipaddress.ip_network(f"{a}/{cidr4}", strict=False) for a in self.query(host, "A")]
+        networks.extend(ipaddress.ip_network(f"{a}/{cidr6}", strict=False) for a in self.query(host, "AAAA"))
+        return networks
+
+    def include(self, target: str, chain: tuple[str, ...]) -> Expansion:
+        """Flatten the SPF record of an included or redirected domain.
+
+        Raises:
+            FlattenError: If the domain includes itself.
+        """
+        if target in chain:
+            msg = f"{target} includes itself"
+            raise FlattenError(msg)
+
+        return self.expand(self.spf_terms(target), target, (*chain, target))
+
+    def mechanism(self, term: Term, domain: str | None, chain: tuple[str, ...]) -> Expansion:
+        """Flatten a mechanism.
+
+        Args:
+            term (Term): The mechanism.
+            domain (str | None): The domain of the record the mechanism is in, which `a` and `mx` default to.
+            chain (tuple[str, ...]): The domains already being included, to stop loops.
+
+        Returns:
+            Expansion: The networks and lookups of the mechanism.
+
+        Raises:
+            FlattenError: If the mechanism can't be resolved.
+        """
+        lookups = 1 if term.name in LOOKUP_MECHANISMS else 0
+        target = term.value or domain
+        if target is None or "%" in target:
+            # The mechanism depends on the sender or on the domain the record is published on
+            return Expansion([], lookups, flattenable=False)
+
+        match term.name:
+            case "ip4" | "ip6":
+                try:
+                    return Expansion([ipaddress.ip_network(term.value, strict=False)], 0, flattenable=True)
+                except ValueError as exc:
+                    msg = f"{term.name}:{term.value} isn't a valid network"
+                    raise FlattenError(msg) from exc
+            case "include":
+                expansion = self.include(target, chain)
+                return Expansion(expansion.networks, lookups + expansion.lookups, expansion.flattenable)
+            case "a":
+                return Expansion(self.addresses(target, term.cidr4, term.cidr6), lookups, flattenable=True)
+            case "mx":
+                hosts = self.query(target, "MX")
+                if len(hosts) > MAX_MX_HOSTS:
+                    msg = f"{target} has more than {MAX_MX_HOSTS} MX hosts"
+                    raise FlattenError(msg)
+                networks = [network for host in hosts for network in self.addresses(host, term.cidr4, term.cidr6)]
+                return Expansion(networks, lookups, flattenable=True)
+
+        return Expansion([], lookups, flattenable=False)
+
+    def expand(self, terms: Iterable[str], domain: str | None, chain: tuple[str, ...] = ()) -> Expansion:
+        """Flatten the terms of a record.
+
+        Every mechanism is followed, even after one that can't be flattened, so the lookups are counted.
+
+        Args:
+            terms (Iterable[str]): The terms.
+            domain (str | None): The domain the record is for, which `a` and `mx` default to.
+            chain (tuple[str, ...]): The domains already being included, to stop loops.
+
+        Returns:
+            Expansion: The networks and lookups of the terms.
+
+        Raises:
+            FlattenError: If the terms can't be resolved.
+        """
+        mechanisms = []
+        redirect = None
+        passes_all = False
+        for text in terms:
+            term = Term.parse(text)
+            if term.modifier:
+                # `exp=` only changes the explanation of a failure
+                redirect = term.value if term.name == "redirect" else redirect
+            elif term.name == "all":
+                # Nothing after `all` is evaluated, and a record with `all` ignores its redirect. An `all` that passes
+                # allows every sender, which no list of networks can, but `-all`, `~all` and `?all` don't pass
+                redirect = None
+                passes_all = term.qualifier == "+"
+                break
+            else:
+                mechanisms.append(term)
+
+        # A redirect is followed like an include that's last, and needs a lookup like one
+        if redirect is not None:
+            mechanisms.append(Term("include", redirect))
+
+        networks: list[Network] = []
+        lookups = 0
+        flattenable = not passes_all
+        for term in mechanisms:
+            expansion = self.mechanism(term, domain, chain)
+            networks.extend(expansion.networks)
+            lookups += expansion.lookups
+            flattenable = flattenable and expansion.flattenable and term.qualifier == "+"
+
+        return Expansion(networks, lookups, flattenable)
+
+
+def format_network(network: Network) -> str:
+    """Return the `ip4` or `ip6` mechanism of a network, without the prefix length for a single address."""
+    if network.prefixlen == network.max_prefixlen:
+        return f"ip{network.version}:{network.network_address}"
+    return f"ip{network.version}:{network}"
+
+
+def collapse(networks: Iterable[Network]) -> list[Network]:
+    """Return the networks with adjacent and overlapping networks combined, IPv4 first."""
+    ipv4 = [network for network in networks if network.version == 4]  # noqa: PLR2004
+    ipv6 = [network for network in networks if network.version == 6]  # noqa: PLR2004
+    return [*ipaddress.collapse_addresses(ipv4), *ipaddress.collapse_addresses(ipv6)]
+
+
+def pack(terms: Iterable[str], prefix: str, limit: int = MAX_RECORD_LENGTH) -> list[str]:
+    """Pack terms into as few strings as they fit in, each starting with the prefix.
+
+    Args:
+        terms (Iterable[str]): The terms.
+        prefix (str): What each string starts with.
+        limit (int): The longest a string can be.
+
+    Returns:
+        list[str]: The strings.
+    """
+    strings = []
+    current = prefix
+    for term in terms:
+        if current != prefix and len(current) + len(term) + 1 > limit:
+            strings.append(current)
+            current = prefix
+        current += f" {term}"
+    strings.append(current)
+    return strings
+
+
+def split_strings(record: str, limit: int = MAX_RECORD_LENGTH) -> tuple[str, ...]:
+    """Split a record into strings of one TXT record, before the spaces between its terms.
+
+    The strings are joined without spaces when the record is read, so each string after the first starts with the
+    space that separated it from the one before.
+
+    Args:
+        record (str): The record.
+        limit (int): The longest a string can be.
+
+    Returns:
+        tuple[str, ...]: The strings.
+    """
+    first, *terms = record.split(" ")
+    strings = [first]
+    for term in terms:
+        if len(strings[-1]) + len(term) + 1 > limit:
+            strings.append(f" {term}")
+        else:
+            strings[-1] += f" {term}"
+    return tuple(strings)
+
+
+def flatten(  # noqa: PLR0913
+    providers: Sequence[ProviderRecord],
+    resolver: Resolver,
+    *,
+    custom: str = "",
+    all_mechanism: str = DEFAULT_ALL_MECHANISM,
+    domain: str | None = None,
+    split: Split = Split.STRINGS,
+) -> FlattenedRecord:
+    """Flatten the providers' mechanisms into a record of their networks.
+
+    Args:
+        providers (Sequence[ProviderRecord]): The selected providers, in any order.
+        resolver (Resolver): The resolver to look up the providers' records with.
+        custom (str): The custom IP address's mechanism, if there is one.
+        all_mechanism (str): The `all` mechanism that ends the record.
+        domain (str | None): The domain the record is for, which is needed to split it across sub-domains.
+        split (Split): How to split the record if it's longer than 255 characters.
+
+    Returns:
+        FlattenedRecord: The flattened record.
+
+    Raises:
+        FlattenError: If there's nothing to flatten, a mechanism can't be resolved, or the record needs too many
+            lookups.
+    """
+    mechanisms = [provider.mechanism for provider in order(providers)]
+    if custom:
+        mechanisms.insert(0, custom)
+    if not mechanisms:
+        raise FlattenError(NO_SELECTION_ERROR)
+    if split == Split.SUBDOMAINS and not domain:
+        msg = "A domain is needed to split the record across sub-domains"
+        raise FlattenError(msg)
+
+    flattener = Flattener(resolver)
+    networks: list[Network] = []
+    kept = []
+    lookups = 0
+    for mechanism in mechanisms:
+        expansion = flattener.expand([mechanism], domain)
+        if expansion.flattenable:
+            networks.extend(expansion.networks)
+        else:
+            kept.append(mechanism)
+            lookups += expansion.lookups
+
+    networks = collapse(networks)
+    network_terms = [format_network(network) for network in networks]
+    name = domain or "@"
+    record = " ".join([SPF_VERSION, *network_terms, *kept, all_mechanism])
+
+    if len(record) <= MAX_RECORD_LENGTH:
+        records = (TxtRecord(name, (record,)),)
+    elif split == Split.STRINGS:
+        records = (TxtRecord(name, split_strings(record)),)
+    else:
+        subrecords = [
+            TxtRecord(SUBDOMAIN_NAME.format(number=number, domain=domain), (subrecord,))
+            for number, subrecord in enumerate(pack(network_terms, SPF_VERSION), start=1)
+        ]
+        includes = [f"include:{subrecord.name}" for subrecord in subrecords]
+        record = " ".join([SPF_VERSION, *includes, *kept, all_mechanism])
+        records = (TxtRecord(name, split_strings(record)), *subrecords)
+        lookups += len(subrecords)
+
+    if lookups > MAX_DNS_LOOKUPS:
+        raise FlattenError(LOOKUPS_ERROR.format(lookups=lookups, maximum=MAX_DNS_LOOKUPS))
+
+    return FlattenedRecord(records, lookups, flattener.ttl, len(networks))
@@ -1,12 +1,18 @@
 """Forms for the spf_generator app."""
 
 import ipaddress
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from django import forms
 from django.core.exceptions import ValidationError
 
-from spf_generator.models import EmailProvider, ProviderCategory, SpfAllMechanism
+from spf_generator.catalogue import Catalogue, get_catalogue
+from spf_generator.engine import INVALID_IP_ERROR, ip_mechanism
+from spf_generator.models import SpfAllMechanism
+
+if TYPE_CHECKING:
+    from spf_generator.engine import ProviderRecord
+    from spf_generator.models import EmailProvider
 
 
 def validate_ip_address(value: str) -> None:
@@ -24,8 +30,7 @@ def validate_ip_address(value: str) -> None:
     try:
         ipaddress.ip_address(value)
     except ValueError as exc:
-        msg = "Please enter a valid IP address"
-        raise ValidationError(msg) from exc
+        raise ValidationError(INVALID_IP_ERROR) from exc
 
 
 class ProviderSelectForm(forms.Form):
@@ -69,24 +74,66 @@ class ProviderSelectForm(forms.Form):
         ),
     )
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
-        """Initializes the form with provider fields."""
+    flatten = forms.BooleanField(
+        required=False,
+        help_text=(
+            "Replace the providers' includes with their IP addresses, so the record doesn't need more than 10 DNS "
+            "lookups. A flattened record has to be regenerated when a provider changes its addresses."
+        ),
+    )
+
+    def __init__(
+        self,
+        *args: Any,  # noqa: ANN401
+        catalogue: Catalogue | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Initializes the form with provider fields.
+
+        Args:
+            *args: The form's arguments
+            catalogue: The provider catalogue. Defaults to the current catalogue.
+            **kwargs: The form's keyword arguments
+        """
         super().__init__(*args, **kwargs)
 
-        # Group providers by category
-        for category in ProviderCategory.choices:
-            providers = EmailProvider.objects.filter(
-                category=category[0],
-                active=True,
+        # The providers are grouped by category
+        self.catalogue = get_catalogue() if catalogue is None else catalogue
+        for provider in self.catalogue.providers.values():
+            field_name = f"provider_{provider.pk}"
+            self.fields[field_name] = forms.BooleanField(
+                required=False,
+                label=provider.name,
+                help_text=provider.mechanism_value,
             )
 
-            for provider in providers:
-                field_name = f"provider_{provider.pk}"
-                self.fields[field_name] = forms.BooleanField(
-                    required=False,
-                    label=provider.name,
-                    help_text=provider.mechanism_value,
-                )
+    def selected_ids(self) -> list[int]:
+        """Returns the IDs of the providers that were checked, in the order of the catalogue.
+
+        Returns:
+            list[int]: The IDs of the selected providers
+        """
+        return [
+            int(field_name.removeprefix("provider_"))
+            for field_name, value in self.cleaned_data.items()
+            if value and field_name.startswith("provider_")
+        ]
+
+    def selected_providers(self) -> list[EmailProvider]:
+        """Returns the providers that were checked, without querying the database.
+
+        Returns:
+            list[EmailProvider]: The selected providers
+        """
+        return self.catalogue.select(self.selected_ids())
+
+    def selected_records(self) -> list[ProviderRecord]:
+        """Returns the SPF engine's records of the providers that were checked, without querying the database.
+
+        Returns:
+            list[ProviderRecord]: The selected providers' records
+        """
+        return self.catalogue.select_records(self.selected_ids())
 
     def clean_custom_ip(self) -> str:
         """Clean and validate the custom IP address.
@@ -98,12 +145,7 @@ class ProviderSelectForm(forms.Form):
         if ip:
             try:
                 # Determine if IPv4 or IPv6 and format accordingly
-                ip_obj = ipaddress.ip_address(ip)
+                return ip_mechanism(ip)
             except ValueError as exc:
-                msg = "Please enter a valid IP address"
-                raise ValidationError(msg) from exc
-            else:
-                if isinstance(ip_obj, ipaddress.IPv6Address):
-                    return f"ip6:{ip}"
-                return f"ip4:{ip}"
+                raise ValidationError(str(exc)) from exc
         return ""
@@ -4,6 +4,7 @@ from typing import Any
 
 from django.core.management.base import BaseCommand
 
+from spf_generator.catalogue import invalidate_catalogue
 from spf_generator.models import EmailProvider, ProviderCategory, SpfMechanism
 
 
@@ -251,3 +252,6 @@ class Command(BaseCommand):
             self.stdout.write(
                 self.style.SUCCESS(f"Created provider: {provider_data['name']}"),
             )
+
+        # Every process builds its provider catalogue again, even if no provider was created
+        invalidate_catalogue()
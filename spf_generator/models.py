@@ -4,6 +4,8 @@ from typing import ClassVar
 
 from django.db import models
 
+from spf_generator.engine import ProviderRecord, check
+
 
 class SpfAllMechanism(models.TextChoices):
     """SPF 'all' mechanism options.
@@ -137,6 +139,17 @@ class EmailProvider(models.Model):
         """
         return f"{self.mechanism_type}:{self.mechanism_value}"
 
+    def as_record(self, rank: int = 0) -> ProviderRecord:
+        """Returns the compact record of this provider that the SPF engine works on.
+
+        Args:
+            rank: The provider's position in the catalogue
+
+        Returns:
+            ProviderRecord: The provider's record
+        """
+        return ProviderRecord(self.get_mechanism(), self.lookup_count, self.priority, rank)
+
     @staticmethod
     def validate_combination(providers: list[EmailProvider]) -> tuple[bool, str | None]:
         """Validates whether a combination of providers can be used together.
@@ -149,17 +162,5 @@ class EmailProvider(models.Model):
                 - Boolean indicating if combination is valid
                 - Error message if invalid, None if valid
         """
-        # Check total lookup count
-        total_lookups = sum(p.lookup_count for p in providers)
-        max_lookups = 10
-        if total_lookups > max_lookups:
-            return False, f"Total DNS lookups ({total_lookups}) exceeds maximum of 10"
-
-        # Calculate total mechanism length (including basic SPF framework)
-        mechanisms = " ".join(p.get_mechanism() for p in providers)
-        spf_record = f"v=spf1 {mechanisms} -all"
-        max_spf_length = 255
-        if len(spf_record) > max_spf_length:
-            return False, "Combined SPF record exceeds 255 characters"
-
-        return True, None
+        result = check([provider.as_record() for provider in providers])
+        return result.valid, result.error
@@ -0,0 +1,241 @@
+"""DNS resolvers for flattening SPF records.
+
+Flattening only needs to look up the A, AAAA, MX and TXT records of a name, so a resolver is anything with a `resolve`
+method that returns the records of one type and how long they can be cached for. There are three:
+
+- `StaticResolver` answers from records it's given, for tests and for checking a record before its DNS is published.
+- `DohResolver` asks a DNS-over-HTTPS server with its JSON API, using the HTTP client the project already has.
+- `CachingResolver` wraps another resolver and keeps its answers in the Django cache for their TTL, so the same
+  providers' records aren't looked up again for every record that's flattened. Failures are kept for a minute, so a
+  name that can't be resolved isn't asked for again either.
+
+`get_resolver()` returns the configured resolver, from the `SPF_RESOLVER` setting, wrapped in a `CachingResolver`.
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol
+
+import httpx
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+DOH_URL = "https://cloudflare-dns.com/dns-query"
+DOH_TIMEOUT = 5.0
+# The DNS record type numbers used in the JSON answers
+RECORD_TYPES = {"A": 1, "AAAA": 28, "MX": 15, "TXT": 16}
+# The TTL of a name that doesn't exist, or has no records of the type, when the answer doesn't say
+NEGATIVE_TTL = 300
+
+DNS_CACHE_ALIAS = "default"
+DNS_CACHE_KEY = "spf_generator:dns:{rdtype}:{name}"
+DNS_FAILURE_KEY = "spf_generator:dns-failure:{rdtype}:{name}"
+# Answers are kept for their TTL, but no longer than this
+MAX_CACHE_TTL = 24 * 60 * 60
+# Failures don't have a TTL, and a name might be resolved the next time, so they're only kept for a short time
+FAILURE_CACHE_TTL = 60
+
+TXT_STRING = re.compile(r'"((?:[^"\\]|\\.)*)"')
+
+
+class DnsError(Exception):
+    """A name couldn't be resolved."""
+
+
+@dataclass(frozen=True)
+class Answer:
+    """The records of one type for a name.
+
+    Attributes:
+        records (tuple[str, ...]): The records, which are empty if the name doesn't exist or has none of the type. TXT
+            records have their strings joined, and MX records are the exchange's name.
+        ttl (int): The number of seconds the answer can be cached for.
+    """
+
+    records: tuple[str, ...]
+    ttl: int
+
+
+class Resolver(Protocol):
+    """Something that can look up DNS records."""
+
+    def resolve(self, name: str, rdtype: str) -> Answer:
+        """Return the records of a type for a name.
+
+        Args:
+            name (str): The name.
+            rdtype (str): The record type: `A`, `AAAA`, `MX` or `TXT`.
+
+        Returns:
+            Answer: The records.
+
+        Raises:
+            DnsError: If the name couldn't be resolved.
+        """
+        ...
+
+
+def normalise_name(name: str) -> str:
+    """Return a name in lower case, without the trailing dot."""
+    return name.lower().rstrip(".")
+
+
+class StaticResolver:
+    """A resolver that answers from records it's given.
+
+    Every query is counted, so tests can see what was looked up.
+    """
+
+    def __init__(self, records: Mapping[tuple[str, str], Iterable[str]] | None = None, ttl: int = NEGATIVE_TTL) -> None:
+        """Set the records.
+
+        Args:
+            records (Mapping[tuple[str, str], Iterable[str]] | None): The records of each name and type, e.g.
+                `{("example.com", "TXT"): ["v=spf1 ip4:192.0.2.0/24 -all"]}`. Defaults to no records.
+            ttl (int): The TTL of every answer.
+        """
+        self.records = {
+            (normalise_name(name), rdtype): tuple(values) for (name, rdtype), values in (records or {}).items()
+        }
+        self.ttl = ttl
+        self.queries: list[tuple[str, str]] = []
+
+    def resolve(self, name: str, rdtype: str) -> Answer:
+        """Return the records of a type for a name, which are empty if there aren't any."""
+        key = (normalise_name(name), rdtype)
+        self.queries.append(key)
+        return Answer(self.records.get(key, ()), self.ttl)
+
+
+class DohResolver:
+    """A resolver that uses the JSON API of a DNS-over-HTTPS server."""
+
+    def __init__(self, url: str = DOH_URL, timeout: float = DOH_TIMEOUT) -> None:
+        """Set the server.
+
+        Args:
+            url (str): The URL of the server's JSON API.
+            timeout (float): The number of seconds to wait for an answer.
+        """
+        self.url = url
+        self.timeout = timeout
+
+    def resolve(self, name: str, rdtype: str) -> Answer:
+        """Return the records of a type for a name.
+
+        Raises:
+            DnsError: If the server couldn't be reached, or couldn't resolve the name.
+        """
+        try:
+            response = httpx.get(
+                self.url,
+                params={"name": name, "type": rdtype},
+                headers={"Accept": "application/dns-json"},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            msg = f"Couldn't look up the {rdtype} records of {name}: {exc}"
+            raise DnsError(msg) from exc
+
+        try:
+            data = response.json()
+        except ValueError as exc:
+            msg = f"Couldn't look up the {rdtype} records of {name}: the answer isn't JSON"
+            raise DnsError(msg) from exc
+
+        # NOERROR and NXDOMAIN are answers; anything else, like SERVFAIL, isn't
+        if data.get("Status") not in {0, 3}:
+            msg = f"Couldn't look up the {rdtype} records of {name}: DNS status {data.get('Status')}"
+            raise DnsError(msg)
+
+        answers = [answer for answer in data.get("Answer", []) if answer.get("type") == RECORD_TYPES[rdtype]]
+        if not answers:
+            # The negative TTL is the SOA's, when the server includes it
+            ttls = [record["TTL"] for record in data.get("Authority", []) if "TTL" in record]
+            return Answer((), min(ttls, default=NEGATIVE_TTL))
+
+        return Answer(
+            tuple(self.parse(answer["data"], rdtype) for answer in answers),
+            min(answer.get("TTL", NEGATIVE_TTL) for answer in answers),
+        )
+
+    @staticmethod
+    def parse(data: str, rdtype: str) -> str:
+        """Return the value of a record from its presentation format.
+
+        Args:
+            data (str): The record's data, e.g. `"v=spf1 " "-all"` for a TXT record or `10 mx.example.com.` for an MX.
+            rdtype (str): The record type.
+
+        Returns:
+            str: The value.
+        """
+        if rdtype == "TXT":
+            strings = TXT_STRING.findall(data)
+            if not strings:
+                return data
+            return "".join(re.sub(r"\\(.)", r"\1", string) for string in strings)
+        if rdtype == "MX":
+            return normalise_name(data.rsplit(maxsplit=1)[-1])
+        return data
+
+
+class CachingResolver:
+    """A resolver that keeps another resolver's answers in the Django cache for their TTL."""
+
+    def __init__(self, resolver: Resolver, alias: str = DNS_CACHE_ALIAS) -> None:
+        """Wrap a resolver.
+
+        Args:
+            resolver (Resolver): The resolver.
+            alias (str): The cache to keep the answers in.
+        """
+        self.resolver = resolver
+        self.cache = caches[alias]
+
+    def resolve(self, name: str, rdtype: str) -> Answer:
+        """Return the records of a type for a name, from the cache if they haven't expired.
+
+        A cached answer's TTL is what's left of it, so a record flattened from cached answers expires with them.
+
+        Raises:
+            DnsError: If the name couldn't be resolved, now or in the last `FAILURE_CACHE_TTL` seconds.
+        """
+        key = DNS_CACHE_KEY.format(rdtype=rdtype, name=normalise_name(name))
+        cached = self.cache.get(key)
+        if cached is not None:
+            records, expires = cached
+            if (ttl := int(expires - time.time())) > 0:
+                return Answer(records, ttl)
+
+        failure_key = DNS_FAILURE_KEY.format(rdtype=rdtype, name=normalise_name(name))
+        if (failure := self.cache.get(failure_key)) is not None:
+            raise DnsError(failure)
+
+        try:
+            answer = self.resolver.resolve(name, rdtype)
+        except DnsError as exc:
+            self.cache.set(failure_key, str(exc), timeout=FAILURE_CACHE_TTL)
+            raise
+
+        # An answer with a TTL of 0 mustn't be cached
+        if answer.ttl > 0:
+            ttl = min(answer.ttl, MAX_CACHE_TTL)
+            self.cache.set(key, (answer.records, time.time() + ttl), timeout=ttl)
+
+        return answer
+
+
+def get_resolver() -> Resolver:
+    """Return the resolver in the `SPF_RESOLVER` setting, with its answers cached.
+
+    Returns:
+        Resolver: The resolver.
+    """
+    return CachingResolver(import_string(settings.SPF_RESOLVER)())
@@ -0,0 +1,16 @@
+"""Signal handlers that keep the provider catalogue up to date."""
+
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from spf_generator.catalogue import invalidate_catalogue
+from spf_generator.models import EmailProvider
+
+
+@receiver(post_save, sender=EmailProvider)
+@receiver(post_delete, sender=EmailProvider)
+def invalidate_providers(**_: Any) -> None:  # noqa: ANN401
+    """Build the catalogue again when a provider is saved or deleted, including from the admin."""
+    invalidate_catalogue()
@@ -8,6 +8,8 @@ from django import template
 from django.template.defaultfilters import stringfilter
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from spf_generator.models import EmailProvider
 
 register = template.Library()
@@ -29,11 +31,11 @@ def startswith(text: str, starts: str) -> bool:
 
 
 @register.filter
-def get_provider(providers_dict: dict, field_name: str) -> EmailProvider:
+def get_provider(providers_dict: Mapping[int, EmailProvider], field_name: str) -> EmailProvider:
     """Template filter to get provider object from field name.
 
     Args:
-        providers_dict: Dictionary of providers
+        providers_dict: The providers by ID, such as the provider catalogue's
         field_name: Form field name (e.g., 'provider_1')
 
     Returns:
@@ -0,0 +1,116 @@
+"""Tests for the provider catalogue."""
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from spf_generator.catalogue import catalogue_version, get_catalogue
+from spf_generator.models import EmailProvider, ProviderCategory, SpfMechanism
+
+
+@pytest.fixture
+def email_providers():
+    return [
+        EmailProvider.objects.create(
+            name=name,
+            category=category,
+            mechanism_type=SpfMechanism.INCLUDE,
+            mechanism_value=f"{name.lower()}.example.com",
+            priority=priority,
+        )
+        for name, category, priority in (
+            ("SendGrid", ProviderCategory.TRANSACTIONAL, 20),
+            ("Zoho", ProviderCategory.EMAIL_HOSTING, 10),
+            ("Fastmail", ProviderCategory.EMAIL_HOSTING, 5),
+        )
+    ]
+
+
+@pytest.mark.django_db
+def test_catalogue_is_grouped_and_sorted(email_providers):
+    """Test the providers are grouped by category and sorted by priority, and can't be changed."""
+    catalogue = get_catalogue()
+
+    assert [provider.name for provider in catalogue.providers.values()] == ["Fastmail", "Zoho", "SendGrid"]
+    assert [provider.name for provider in catalogue.by_category[ProviderCategory.EMAIL_HOSTING]] == ["Fastmail", "Zoho"]
+    assert catalogue.select([email_providers[0].pk, 0]) == [email_providers[0]]
+    with pytest.raises(TypeError):
+        catalogue.providers[0] = email_providers[0]
+
+
+@pytest.mark.django_db
+def test_catalogue_is_built_once(email_providers, django_assert_num_queries):
+    """Test the catalogue is only built again once the version stamp changes."""
+    catalogue = get_catalogue()
+
+    with django_assert_num_queries(0):
+        assert get_catalogue() is catalogue
+
+
+@pytest.mark.django_db
+def test_saving_a_provider_rebuilds_the_catalogue(email_providers, django_capture_on_commit_callbacks):
+    """Test saving or deleting a provider replaces the version stamp once the transaction commits."""
+    version = get_catalogue().version
+
+    with django_capture_on_commit_callbacks(execute=True):
+        email_providers[0].active = False
+        email_providers[0].save()
+
+    assert get_catalogue().version != version
+    assert email_providers[0].pk not in get_catalogue().providers
+
+    version = get_catalogue().version
+    with django_capture_on_commit_callbacks(execute=True):
+        email_providers[1].delete()
+
+    assert get_catalogue().version != version
+    assert [provider.name for provider in get_catalogue().providers.values()] == ["Fastmail"]
+
+
+@pytest.mark.django_db
+def test_populating_the_providers_rebuilds_the_catalogue(django_capture_on_commit_callbacks):
+    """Test populating the providers replaces the version stamp, even if every provider already existed."""
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("populate_spf_data", stdout=None)
+    version = catalogue_version()
+    assert get_catalogue().providers
+
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("populate_spf_data", stdout=None)
+
+    assert catalogue_version() != version
+
+
+@pytest.mark.django_db
+def test_generator_page_doesnt_query_the_providers(client, email_providers):
+    """Test the generator page doesn't query the providers once the catalogue is built."""
+    url = reverse("spf_generator:spf_generator")
+    client.get(url)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+        client.post(url, {"all_mechanism": "-all", f"provider_{email_providers[0].pk}": True})
+
+    assert b"Fastmail" in response.content
+    assert not [query for query in queries if EmailProvider._meta.db_table in query["sql"]]
+
+
+@pytest.mark.django_db
+def test_form_fields_are_rendered_once_for_each_version(email_providers, django_capture_on_commit_callbacks):
+    """Test the form's fields are rendered once for each version of the catalogue, with a CSRF token for each visitor."""
+    url = reverse("spf_generator:spf_generator")
+    first = Client().get(url)
+    second = Client().get(url)
+
+    assert "spf_generator/partials/form_fields.html" in [template.name for template in first.templates]
+    assert "spf_generator/partials/form_fields.html" not in [template.name for template in second.templates]
+    assert first.context["form_fields"] == second.context["form_fields"]
+    assert first.context["csrf_token"] != second.context["csrf_token"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        email_providers[0].name = "Twilio SendGrid"
+        email_providers[0].save()
+
+    assert b"Twilio SendGrid" in Client().get(url).content
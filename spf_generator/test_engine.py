@@ -0,0 +1,46 @@
+"""Tests for the SPF engine."""
+
+import pytest
+from spf_generator.engine import ProviderRecord, check, compose, ip_mechanism
+
+GOOGLE = ProviderRecord("include:_spf.google.com", lookup_count=2, priority=10, rank=0)
+OUTLOOK = ProviderRecord("include:spf.protection.outlook.com", lookup_count=2, priority=10, rank=1)
+SENDGRID = ProviderRecord("include:sendgrid.net", lookup_count=1, priority=20, rank=2)
+
+
+def test_compose_orders_the_mechanisms():
+    """Test the custom IP comes first, then the providers by priority and their rank in the catalogue."""
+    result = compose([SENDGRID, OUTLOOK, GOOGLE], custom="ip4:192.0.2.1", all_mechanism="~all")
+
+    assert result.valid
+    assert result.lookups == 5
+    assert result.record == (
+        "v=spf1 ip4:192.0.2.1 include:_spf.google.com include:spf.protection.outlook.com include:sendgrid.net ~all"
+    )
+
+
+def test_compose_without_a_selection():
+    """Test a record needs a provider or a custom IP."""
+    assert compose([]).error == "Please select at least one email provider or enter a custom IP address"
+    assert compose([], custom="ip6:2001:db8::1").record == "v=spf1 ip6:2001:db8::1 -all"
+
+
+def test_compose_enforces_the_limits():
+    """Test the lookup limit and the length limit, which is checked before the record is joined."""
+    heavy = ProviderRecord("include:heavy.example.com", lookup_count=9, priority=30)
+    assert compose([GOOGLE, heavy]).error == "Total DNS lookups (11) exceeds maximum of 10"
+
+    # 7 + 243 + 5 characters is the longest record there can be
+    exact = ProviderRecord("a:" + "x" * 241, lookup_count=1, priority=1)
+    assert len(compose([exact]).record) == 255
+    assert compose([exact], all_mechanism="~all").valid
+    assert compose([exact], custom="ip4:192.0.2.1").error == "Combined SPF record exceeds 255 characters"
+    assert check([exact, GOOGLE]).error == "Combined SPF record exceeds 255 characters"
+
+
+def test_ip_mechanism():
+    """Test IP addresses are turned into `ip4` and `ip6` mechanisms."""
+    assert ip_mechanism("192.0.2.1") == "ip4:192.0.2.1"
+    assert ip_mechanism("2001:db8::1") == "ip6:2001:db8::1"
+    with pytest.raises(ValueError, match="valid IP address"):
+        ip_mechanism("example.com")
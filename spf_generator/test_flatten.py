@@ -0,0 +1,122 @@
+"""Tests for flattening SPF records."""
+
+import pytest
+from spf_generator.engine import ProviderRecord
+from spf_generator.flatten import FlattenError, Split, Term, flatten, split_strings
+from spf_generator.resolvers import StaticResolver
+
+ZONE = {
+    ("_spf.google.com", "TXT"): [
+        "v=spf1 include:_netblocks.google.com include:_netblocks2.google.com ~all",
+        "google-site-verification=abc",
+    ],
+    ("_netblocks.google.com", "TXT"): ["v=spf1 ip4:35.190.247.0/24 ip4:64.233.160.0/20 ip4:64.233.176.0/20 ~all"],
+    ("_netblocks2.google.com", "TXT"): ["v=spf1 ip6:2001:4860:4000::/36 ip6:2404:6800:4000::/36 ~all"],
+    ("mailgun.org", "TXT"): ["v=spf1 redirect=_spf.mailgun.org"],
+    ("_spf.mailgun.org", "TXT"): ["v=spf1 a:mx.mailgun.org/31 mx:mailgun.org -all ip4:203.0.113.99"],
+    ("mx.mailgun.org", "A"): ["198.51.100.10"],
+    ("mailgun.org", "MX"): ["mxa.mailgun.org"],
+    ("mxa.mailgun.org", "A"): ["198.51.100.12"],
+    ("mxa.mailgun.org", "AAAA"): ["2001:db8::12"],
+    ("exists.example.com", "TXT"): ["v=spf1 ip4:192.0.2.1 exists:%{i}.allow.example.com -all"],
+    ("loop.example.com", "TXT"): ["v=spf1 include:loop.example.com -all"],
+    ("open.example.com", "TXT"): ["v=spf1 ip4:192.0.2.2 +all"],
+    ("bare.example.com", "TXT"): ["v=spf1 ip4:192.0.2.3 all"],
+    ("neutral.example.com", "TXT"): ["v=spf1 ip4:192.0.2.4 ?all"],
+}
+
+GOOGLE = ProviderRecord("include:_spf.google.com", lookup_count=3, priority=10)
+MAILGUN = ProviderRecord("include:mailgun.org", lookup_count=3, priority=20)
+
+
+@pytest.fixture
+def resolver():
+    return StaticResolver(ZONE, ttl=3600)
+
+
+def test_parse_term():
+    """Test mechanisms, their qualifiers and prefix lengths, and modifiers are parsed."""
+    assert Term.parse("~all") == Term("all", qualifier="~")
+    assert Term.parse("ip6:2001:db8::/32") == Term("ip6", "2001:db8::/32")
+    assert Term.parse("a:example.com/24//64") == Term("a", "example.com", cidr4=24, cidr6=64)
+    assert Term.parse("MX/28") == Term("mx", cidr4=28)
+    assert Term.parse("redirect=example.com") == Term("redirect", "example.com", modifier=True)
+
+
+def test_flatten_follows_includes_redirects_a_and_mx(resolver):
+    """Test the networks of every mechanism are collected and collapsed, without any lookups left."""
+    flattened = flatten([MAILGUN, GOOGLE], resolver, custom="ip4:35.190.246.1")
+
+    assert flattened.record == (
+        "v=spf1 ip4:35.190.246.1 ip4:35.190.247.0/24 ip4:64.233.160.0/19 ip4:198.51.100.10/31 ip4:198.51.100.12 "
+        "ip6:2001:db8::12 ip6:2001:4860:4000::/36 ip6:2404:6800:4000::/36 -all"
+    )
+    assert flattened.lookups == 0
+    assert flattened.ttl == 3600
+    # The address after Mailgun's `-all` isn't evaluated, so it isn't allowed
+    assert "203.0.113.99" not in flattened.record
+
+
+def test_mechanisms_that_cant_be_flattened_are_kept(resolver):
+    """Test a record that depends on the sender is kept as an include, with its lookups."""
+    exists = ProviderRecord("include:exists.example.com", lookup_count=2, priority=1)
+    flattened = flatten([GOOGLE, exists], resolver, all_mechanism="~all")
+
+    assert flattened.record.endswith(" include:exists.example.com ~all")
+    assert "192.0.2.1" not in flattened.record
+    assert flattened.lookups == 2
+
+
+@pytest.mark.parametrize(("domain", "flattenable"), [("open", False), ("bare", False), ("neutral", True)])
+def test_records_that_pass_all_are_kept(resolver, domain, flattenable):
+    """Test a record ending with an `all` that passes allows every sender, so it isn't flattened."""
+    provider = ProviderRecord(f"include:{domain}.example.com", lookup_count=1, priority=1)
+    flattened = flatten([provider], resolver)
+
+    assert (flattened.record == f"v=spf1 include:{domain}.example.com -all") is not flattenable
+    assert flattened.lookups == (0 if flattenable else 1)
+
+
+def test_flatten_errors(resolver):
+    """Test missing and looping records, and selections with nothing to flatten, can't be flattened."""
+    with pytest.raises(FlattenError, match="no SPF records"):
+        flatten([ProviderRecord("include:missing.example.com", 1, 1)], resolver)
+    with pytest.raises(FlattenError, match="includes itself"):
+        flatten([ProviderRecord("include:loop.example.com", 1, 1)], resolver)
+    with pytest.raises(FlattenError, match="select at least one"):
+        flatten([], resolver)
+
+
+def long_resolver(count):
+    addresses = " ".join(f"ip4:198.51.{i // 100}.{i % 100 * 2}" for i in range(count))
+    return StaticResolver({("many.example.com", "TXT"): [f"v=spf1 {addresses} -all"]})
+
+
+def test_long_records_are_split_into_strings():
+    """Test a record that's too long is split into strings, which join back into the record."""
+    flattened = flatten([ProviderRecord("include:many.example.com", 1, 1)], long_resolver(40))
+
+    (record,) = flattened.records
+    assert len(record.strings) > 1
+    assert all(len(string) <= 255 for string in record.strings)
+    assert record.value.split() == ["v=spf1", *(f"ip4:198.51.0.{i * 2}" for i in range(40)), "-all"]
+    assert split_strings("v=spf1 -all") == ("v=spf1 -all",)
+
+
+def test_long_records_are_split_into_subdomains():
+    """Test a record that's too long can include records on sub-domains, which count as lookups."""
+    flattened = flatten(
+        [ProviderRecord("include:many.example.com", 1, 1)],
+        long_resolver(40),
+        domain="example.org",
+        split=Split.SUBDOMAINS,
+    )
+
+    domain, *subdomains = flattened.records
+    assert [record.name for record in subdomains] == ["_spf1.example.org", "_spf2.example.org", "_spf3.example.org"]
+    assert domain.value == ("v=spf1 include:_spf1.example.org include:_spf2.example.org include:_spf3.example.org -all")
+    assert flattened.lookups == 3
+    assert all(len(record.value) <= 255 for record in subdomains)
+
+    with pytest.raises(FlattenError, match="A domain is needed"):
+        flatten([GOOGLE], long_resolver(1), split=Split.SUBDOMAINS)
@@ -0,0 +1,70 @@
+"""Tests for the DNS resolvers."""
+
+import httpx
+import pytest
+from django.core.cache import caches
+from spf_generator import resolvers
+from spf_generator.resolvers import CachingResolver, DnsError, DohResolver, StaticResolver
+
+
+def test_caching_resolver_honours_ttls(monkeypatch):
+    """Test answers are cached until their TTL runs out, and their TTL counts down."""
+    now = 1000.0
+    monkeypatch.setattr(resolvers.time, "time", lambda: now)
+    static = StaticResolver({("example.com", "A"): ["192.0.2.1"]}, ttl=60)
+    resolver = CachingResolver(static)
+
+    assert resolver.resolve("Example.com.", "A").records == ("192.0.2.1",)
+    now += 45
+    assert resolver.resolve("example.com", "A").ttl == 15
+    assert len(static.queries) == 1
+
+    now += 15
+    assert resolver.resolve("example.com", "A").ttl == 60
+    assert len(static.queries) == 2
+
+
+def test_caching_resolver_keeps_failures_briefly(monkeypatch):
+    """Test a name that can't be resolved isn't asked for again until the failure expires."""
+    calls = []
+
+    class FailingResolver:
+        def resolve(self, name, rdtype):
+            calls.append((name, rdtype))
+            msg = f"Couldn't look up the {rdtype} records of {name}"
+            raise DnsError(msg)
+
+    caches["default"].clear()
+    resolver = CachingResolver(FailingResolver())
+
+    for _ in range(2):
+        with pytest.raises(DnsError, match="Couldn't look up the TXT records of broken.example"):
+            resolver.resolve("broken.example", "TXT")
+    assert calls == [("broken.example", "TXT")]
+
+    caches["default"].delete(resolvers.DNS_FAILURE_KEY.format(rdtype="TXT", name="broken.example"))
+    with pytest.raises(DnsError):
+        resolver.resolve("broken.example", "TXT")
+    assert len(calls) == 2
+
+
+def test_doh_resolver(monkeypatch):
+    """Test the JSON answers are parsed, and failures are reported."""
+    answers = {
+        "TXT": {"Status": 0, "Answer": [{"type": 16, "TTL": 300, "data": '"v=spf1 ip4:192.0.2.1" " -all"'}]},
+        "MX": {"Status": 0, "Answer": [{"type": 15, "TTL": 60, "data": "10 MX.Example.com."}]},
+        "A": {"Status": 3, "Authority": [{"type": 6, "TTL": 900, "data": "ns.example.com. ..."}]},
+        "AAAA": {"Status": 2},
+    }
+
+    def get(url, params, **kwargs):
+        return httpx.Response(200, json=answers[params["type"]], request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(httpx, "get", get)
+    resolver = DohResolver()
+
+    assert resolver.resolve("example.com", "TXT").records == ("v=spf1 ip4:192.0.2.1 -all",)
+    assert resolver.resolve("example.com", "MX").records == ("mx.example.com",)
+    assert resolver.resolve("example.com", "A") == resolvers.Answer((), 900)
+    with pytest.raises(DnsError, match="DNS status 2"):
+        resolver.resolve("example.com", "AAAA")
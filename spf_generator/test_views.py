@@ -1,9 +1,12 @@
 """Basic tests for the views.py file."""
 
 import pytest
+from django.core.cache import caches
 from django.test import Client, RequestFactory
 from django.urls import reverse
+from spf_generator.catalogue import get_catalogue
 from spf_generator.models import EmailProvider, ProviderCategory, SpfMechanism
+from spf_generator.resolvers import CachingResolver, DnsError, StaticResolver
 from spf_generator.views import generate_spf_record
 
 
@@ -51,7 +54,8 @@ class TestSpfGenerator:
         url = reverse("spf_generator:spf_generator")
         response = client.get(url)
         assert response.status_code == 200
-        assert "form" in response.context
+        assert b'name="all_mechanism"' in response.content
+        assert b'name="csrfmiddlewaretoken"' in response.content
 
     def test_post_without_providers(self, client):
         """Test submission without selecting any providers."""
@@ -133,3 +137,184 @@ class TestSpfGenerator:
         content = response.content.decode()
         # Check that Google Workspace (priority 10) comes before SendGrid (priority 20)
         assert content.index("_spf.google.com") < content.index("sendgrid.net")
+
+    def test_post_queries_dont_grow_with_selection(self, client, email_providers, django_assert_num_queries):
+        """Test the selected providers are resolved from the catalogue, however many are selected."""
+        get_catalogue()
+        url = reverse("spf_generator:spf_generator")
+        with django_assert_num_queries(0):
+            client.post(url, {"all_mechanism": "-all", f"provider_{email_providers[0].id}": True})
+
+        data = {"all_mechanism": "-all", **{f"provider_{provider.id}": True for provider in email_providers}}
+        with django_assert_num_queries(0):
+            response = client.post(url, data)
+        assert b"include:spf.protection.outlook.com" in response.content
+
+
+@pytest.mark.django_db
+class TestSpfRecordsApi:
+    def test_list_providers(self, client, email_providers):
+        """Test the providers that can be selected are listed."""
+        response = client.get(reverse("spf_generator:spf_records_api"))
+        data = response.json()
+        assert data["version"] == get_catalogue().version
+        assert [provider["name"] for provider in data["providers"]] == ["Google Workspace", "Office 365", "SendGrid"]
+        assert data["providers"][0]["mechanism"] == "include:_spf.google.com"
+
+    def test_batch(self, client, email_providers, django_assert_num_queries):
+        """Test each selection gets its record or error, in order, without querying the providers."""
+        google, sendgrid, outlook = (provider.pk for provider in email_providers)
+        selections = [
+            {"providers": [sendgrid, google]},
+            {"providers": [outlook], "custom_ip": "192.0.2.1", "all_mechanism": "~all"},
+            {"providers": []},
+            {"providers": [google, 0]},
+            {"providers": [google], "custom_ip": "example.com"},
+            {"providers": [google], "all_mechanism": "+all"},
+            {"providers": "all"},
+            [google],
+        ]
+        get_catalogue()
+        with django_assert_num_queries(0):
+            response = client.post(
+                reverse("spf_generator:spf_records_api"),
+                {"all_mechanism": "?all", "selections": selections},
+                content_type="application/json",
+            )
+
+        results = response.json()["results"]
+        assert results[0] == {
+            "record": "v=spf1 include:_spf.google.com include:sendgrid.net ?all",
+            "lookups": 3,
+            "error": None,
+        }
+        assert results[1]["record"] == "v=spf1 ip4:192.0.2.1 include:spf.protection.outlook.com ~all"
+        assert [result["error"] for result in results[2:]] == [
+            "Please select at least one email provider or enter a custom IP address",
+            "Unknown providers: 0",
+            "Please enter a valid IP address",
+            "Invalid all mechanism: +all",
+            "Providers must be a list of provider IDs",
+            "Invalid selection",
+        ]
+
+    def test_invalid_requests(self, client, monkeypatch):
+        """Test requests without a list of selections, or with too many, are rejected."""
+        url = reverse("spf_generator:spf_records_api")
+        assert client.post(url, "{", content_type="application/json").status_code == 400
+        assert client.post(url, {"selections": {}}, content_type="application/json").status_code == 400
+
+        monkeypatch.setattr("spf_generator.views.MAX_BATCH_SIZE", 1)
+        response = client.post(url, {"selections": [{}, {}]}, content_type="application/json")
+        assert response.status_code == 400
+
+        monkeypatch.setattr("spf_generator.views.MAX_FLATTENED_SELECTIONS", 1)
+        response = client.post(url, {"selections": [{"flatten": True}] * 2}, content_type="application/json")
+        assert response.status_code == 400
+        assert client.put(url).status_code == 405
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    resolver = StaticResolver(
+        {
+            ("_spf.google.com", "TXT"): ["v=spf1 ip4:64.233.160.0/19 ip6:2001:4860:4000::/36 ~all"],
+            ("spf.protection.outlook.com", "TXT"): ["v=spf1 ip4:40.92.0.0/15 ip4:40.107.0.0/16 -all"],
+            ("sendgrid.net", "TXT"): ["v=spf1 ip4:167.89.0.0/17 ~all"],
+            ("test.com", "TXT"): ["v=spf1 ip4:192.0.2.0/24 -all"],
+        },
+    )
+    # The answers cached by other tests would be used instead
+    caches["default"].clear()
+    monkeypatch.setattr("spf_generator.views.get_resolver", lambda: CachingResolver(resolver))
+    return resolver
+
+
+@pytest.mark.django_db
+class TestFlattening:
+    def test_flattened_record_isnt_limited_to_ten_lookups(self, client, email_providers, resolver):
+        """Test a selection with too many lookups can be flattened."""
+        high_lookup_provider = EmailProvider.objects.create(
+            name="High Lookup Provider",
+            category=ProviderCategory.OTHER,
+            mechanism_type=SpfMechanism.INCLUDE,
+            mechanism_value="test.com",
+            lookup_count=9,
+            priority=30,
+        )
+        url = reverse("spf_generator:spf_generator")
+        data = {
+            "all_mechanism": "-all",
+            "flatten": True,
+            f"provider_{email_providers[0].id}": True,
+            f"provider_{high_lookup_provider.pk}": True,
+        }
+
+        response = client.post(url, data)
+
+        assert b"v=spf1 ip4:64.233.160.0/19 ip4:192.0.2.0/24 ip6:2001:4860:4000::/36 -all" in response.content
+        assert b"Flattened" in response.content
+
+    def test_flattening_errors_are_shown(self, client, email_providers, resolver):
+        """Test a provider without an SPF record can't be flattened."""
+        email_providers[1].mechanism_value = "missing.example.com"
+        email_providers[1].save()
+        url = reverse("spf_generator:spf_generator")
+        response = client.post(
+            url, {"all_mechanism": "-all", "flatten": True, f"provider_{email_providers[1].id}": True}
+        )
+        assert b"missing.example.com has no SPF records" in response.content
+
+    def test_batch_flattening(self, client, email_providers, resolver):
+        """Test selections can be flattened, and split across sub-domains of their domain."""
+        ids = [provider.pk for provider in email_providers]
+        selections = [
+            {"providers": ids, "flatten": True},
+            {"providers": ids, "flatten": True, "domain": "example.org"},
+            {"providers": ids, "flatten": True, "domain": 1},
+            {"providers": ids, "flatten": True, "domain": "a b"},
+        ]
+        response = client.post(
+            reverse("spf_generator:spf_records_api"),
+            {"selections": selections},
+            content_type="application/json",
+        )
+
+        first, second, third, fourth = response.json()["results"]
+        assert first["record"] == (
+            "v=spf1 ip4:40.92.0.0/15 ip4:40.107.0.0/16 ip4:64.233.160.0/19 ip4:167.89.0.0/17 "
+            "ip6:2001:4860:4000::/36 -all"
+        )
+        assert first["records"] == [{"name": "@", "strings": [first["record"]]}]
+        assert first["lookups"] == 0
+        assert first["ttl"] == 300
+        # The record is short enough not to be split, so it's published on the domain
+        assert second["records"] == [{"name": "example.org", "strings": [first["record"]]}]
+        assert third["error"] == "The domain must be a string"
+        assert fourth["error"] == "Invalid domain: a b"
+        # The providers were only looked up for the first selection
+        assert len(resolver.queries) == 3
+
+    def test_batch_flattening_failures_are_cached(self, client, email_providers, monkeypatch):
+        """Test a provider that can't be looked up is only asked for once, however many selections include it."""
+        queries = []
+
+        class FailingResolver:
+            def resolve(self, name, rdtype):
+                queries.append((name, rdtype))
+                msg = f"Couldn't look up the {rdtype} records of {name}: timed out"
+                raise DnsError(msg)
+
+        caches["default"].clear()
+        monkeypatch.setattr("spf_generator.views.get_resolver", lambda: CachingResolver(FailingResolver()))
+        selections = [{"providers": [email_providers[1].pk], "flatten": True}] * 3
+
+        response = client.post(
+            reverse("spf_generator:spf_records_api"),
+            {"selections": selections},
+            content_type="application/json",
+        )
+
+        errors = [result["error"] for result in response.json()["results"]]
+        assert errors == ["Couldn't look up the TXT records of sendgrid.net: timed out"] * 3
+        assert queries == [("sendgrid.net", "TXT")]
@@ -3,11 +3,12 @@
 from django.urls import path
 
 from contact_form.views import contact_form
-from spf_generator.views import generate_spf_record
+from spf_generator.views import generate_spf_record, spf_records_api
 
 app_name = "spf_generator"
 
 urlpatterns = [
     path("contact/", contact_form, {"contact_form_title": "Request a New SPF Record"}, name="contact_form"),
+    path("api/records/", spf_records_api, name="spf_records_api"),
     path("", generate_spf_record, name="spf_generator"),
 ]
@@ -1,14 +1,71 @@
 """Views for the SPF Generator app."""
 
-from typing import TYPE_CHECKING
+import json
+from typing import TYPE_CHECKING, Any
 
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.core.validators import DomainNameValidator
+from django.http import HttpResponseBadRequest, JsonResponse
 from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
 
+from spf_generator.catalogue import CATALOGUE_CACHE_ALIAS, get_catalogue
+from spf_generator.engine import DEFAULT_ALL_MECHANISM, compose, ip_mechanism
+from spf_generator.flatten import FlattenError, Split, flatten
 from spf_generator.forms import ProviderSelectForm
-from spf_generator.models import EmailProvider, ProviderCategory, SpfAllMechanism
+from spf_generator.models import ProviderCategory, SpfAllMechanism
+from spf_generator.resolvers import get_resolver
 
 if TYPE_CHECKING:
     from django.http import HttpRequest, HttpResponse
+    from django.utils.safestring import SafeString
+
+    from spf_generator.catalogue import Catalogue
+    from spf_generator.engine import ProviderRecord
+    from spf_generator.resolvers import Resolver
+
+FORM_FIELDS_KEY = "spf_generator:form_fields:{version}"
+# The fragment of an old version of the catalogue is never used again, so it's left to expire
+FORM_FIELDS_TIMEOUT = 24 * 60 * 60
+
+# The domains records are flattened for are written into the records, so they must be plain ASCII host names
+validate_domain = DomainNameValidator(accept_idna=False)
+
+# The most selections the batch API composes records for in one request
+MAX_BATCH_SIZE = 1000
+# The most selections the batch API flattens in one request, as each can need up to `MAX_QUERIES` DNS queries
+MAX_FLATTENED_SELECTIONS = 10
+
+
+def render_form_fields(catalogue: Catalogue) -> SafeString:
+    """Render the form's fields, including the provider grid, once for each version of the provider catalogue.
+
+    The fields are the same for every visitor, so the rendered fragment is cached. The CSRF token is added by the page.
+
+    Args:
+        catalogue: The provider catalogue
+
+    Returns:
+        SafeString: The rendered fields
+    """
+    cache = caches[CATALOGUE_CACHE_ALIAS]
+    key = FORM_FIELDS_KEY.format(version=catalogue.version)
+    fragment = cache.get(key)
+    if fragment is None:
+        fragment = render_to_string(
+            "spf_generator/partials/form_fields.html",
+            {
+                "form": ProviderSelectForm(catalogue=catalogue),
+                "categories": ProviderCategory.choices,
+                "providers": catalogue.providers,
+            },
+        )
+        cache.set(key, fragment, timeout=FORM_FIELDS_TIMEOUT)
+
+    return fragment
 
 
 def generate_spf_record(request: HttpRequest) -> HttpResponse:
@@ -26,58 +83,31 @@ def generate_spf_record(request: HttpRequest) -> HttpResponse:
     if request.method == "POST":
         form = ProviderSelectForm(request.POST)
         if form.is_valid():
-            # Get selected providers
-            selected_providers: list[EmailProvider] = []
-            for field_name, value in form.cleaned_data.items():
-                if value and field_name.startswith("provider_"):
-                    provider_id = int(field_name.split("_")[1])
-                    provider = EmailProvider.objects.get(id=provider_id)
-                    selected_providers.append(provider)
-
-            # Check if either providers are selected or custom IP is provided
-            custom_ip = form.cleaned_data.get("custom_ip", "")
-            if not selected_providers and not custom_ip:
-                return render(
-                    request,
-                    "spf_generator/partials/error.html",
-                    {"error": "Please select at least one email provider or enter a custom IP address"},
-                )
-            # Check total lookup count
-            total_lookups = sum(p.lookup_count for p in selected_providers)
-            max_dns_lookups = 10
-            if total_lookups > max_dns_lookups:
-                return render(
-                    request,
-                    "spf_generator/partials/error.html",
-                    {"error": f"Total DNS lookups ({total_lookups}) exceeds maximum of 10"},
-                )
-
-            # Generate SPF record
-            mechanisms = []
-
-            # Add custom IP first if provided
-            if custom_ip:
-                mechanisms.append(custom_ip)
-
-            # Add provider mechanisms
-            mechanisms.extend(
-                p.get_mechanism()
-                for p in sorted(
-                    selected_providers,
-                    key=lambda x: x.priority,
-                )
-            )
+            # The selected providers come from the catalogue, without querying the database
+            context: dict[str, Any] = {}
+            if form.cleaned_data["flatten"]:
+                try:
+                    flattened = flatten(
+                        form.selected_records(),
+                        get_resolver(),
+                        custom=form.cleaned_data.get("custom_ip", ""),
+                        all_mechanism=form.cleaned_data["all_mechanism"],
+                    )
+                except FlattenError as exc:
+                    return render(request, "spf_generator/partials/error.html", {"error": str(exc)})
 
-            spf_record = f"v=spf1 {' '.join(mechanisms)} {form.cleaned_data['all_mechanism']}"
-
-            # Check record length
-            max_record_length = 255
-            if len(spf_record) > max_record_length:
-                return render(
-                    request,
-                    "spf_generator/partials/error.html",
-                    {"error": "Combined SPF record exceeds 255 characters"},
+                # A record that's too long is shown as the quoted strings of one TXT record
+                context["spf_record"] = '" "'.join(flattened.records[0].strings)
+                context["flattened"] = flattened
+            else:
+                result = compose(
+                    form.selected_records(),
+                    custom=form.cleaned_data.get("custom_ip", ""),
+                    all_mechanism=form.cleaned_data["all_mechanism"],
                 )
+                if not result.valid:
+                    return render(request, "spf_generator/partials/error.html", {"error": result.error})
+                context["spf_record"] = result.record
 
             all_mechanism = SpfAllMechanism(form.cleaned_data["all_mechanism"])
 
@@ -86,7 +116,7 @@ def generate_spf_record(request: HttpRequest) -> HttpResponse:
                 request,
                 "spf_generator/partials/result.html",
                 {
-                    "spf_record": spf_record,
+                    **context,
                     "all_mechanism": all_mechanism.label,
                     "all_mechanism_description": all_mechanism.description,
                 },
@@ -99,12 +129,174 @@ def generate_spf_record(request: HttpRequest) -> HttpResponse:
             {"error": "Invalid form submission - please check if you've entered an invalid IP address"},
         )
 
-    # GET request - display form
-    providers = {provider.pk: provider for provider in EmailProvider.objects.filter(active=True)}
+    # GET request - display form, with the fields rendered once for the current version of the catalogue
+    context = {"form_fields": render_form_fields(get_catalogue())}
+    return render(request, "spf_generator/generator.html", context)
 
-    context = {
-        "form": ProviderSelectForm(),
-        "categories": ProviderCategory.choices,
-        "providers": providers,  # Add this line
+
+def parse_selection(
+    catalogue: Catalogue,
+    selection: dict[str, Any],
+    default_all_mechanism: str,
+) -> tuple[list[ProviderRecord], str, str]:
+    """Return the providers' records, the custom IP's mechanism and the `all` mechanism of a selection.
+
+    Args:
+        catalogue: The provider catalogue
+        selection: The selection
+        default_all_mechanism: The `all` mechanism to use if the selection doesn't have one
+
+    Returns:
+        tuple[list[ProviderRecord], str, str]: The providers' records, the custom mechanism and the `all` mechanism
+
+    Raises:
+        ValueError: If the selection isn't valid
+    """
+    ids = selection.get("providers", [])
+    all_mechanism = selection.get("all_mechanism", default_all_mechanism)
+    if not isinstance(ids, list) or not all(type(pk) is int for pk in ids):
+        msg = "Providers must be a list of provider IDs"
+        raise ValueError(msg)
+    if all_mechanism not in SpfAllMechanism.values:
+        msg = f"Invalid all mechanism: {all_mechanism}"
+        raise ValueError(msg)
+    if unknown := [pk for pk in ids if pk not in catalogue.records]:
+        msg = f"Unknown providers: {', '.join(map(str, unknown))}"
+        raise ValueError(msg)
+    domain = selection.get("domain") or ""
+    if not isinstance(domain, str):
+        msg = "The domain must be a string"
+        raise ValueError(msg)  # noqa: TRY004
+    if domain:
+        try:
+            validate_domain(domain)
+        except ValidationError as exc:
+            msg = f"Invalid domain: {domain}"
+            raise ValueError(msg) from exc
+
+    custom_ip = str(selection.get("custom_ip") or "").strip()
+    custom = ip_mechanism(custom_ip) if custom_ip else ""
+
+    # Each provider is only counted once, however many times it's listed
+    return catalogue.select_records(dict.fromkeys(ids)), custom, all_mechanism
+
+
+def compose_selection(
+    catalogue: Catalogue,
+    selection: object,
+    default_all_mechanism: str,
+    resolver: Resolver,
+) -> dict[str, Any]:
+    """Compose the SPF record for one selection of the batch API.
+
+    Args:
+        catalogue: The provider catalogue
+        selection: The selection, as `{"providers": [<id>, ...], "custom_ip": "...", "all_mechanism": "...",
+            "flatten": false, "domain": "..."}`
+        default_all_mechanism: The `all` mechanism to use if the selection doesn't have one
+        resolver: The resolver to flatten records with
+
+    Returns:
+        dict[str, Any]: The record, the number of DNS lookups and the error, if there is one. A flattened record also
+            has the TXT records to publish and their TTL.
+    """
+    if not isinstance(selection, dict):
+        return {"record": None, "lookups": 0, "error": "Invalid selection"}
+
+    domain = selection.get("domain")
+    try:
+        records, custom, all_mechanism = parse_selection(catalogue, selection, default_all_mechanism)
+        if not selection.get("flatten"):
+            result = compose(records, custom=custom, all_mechanism=all_mechanism)
+            return {"record": result.record, "lookups": result.lookups, "error": result.error}
+
+        flattened = flatten(
+            records,
+            resolver,
+            custom=custom,
+            all_mechanism=all_mechanism,
+            domain=domain,
+            split=Split.SUBDOMAINS if domain else Split.STRINGS,
+        )
+    except (ValueError, FlattenError) as exc:
+        return {"record": None, "lookups": 0, "error": str(exc)}
+
+    return {
+        "record": flattened.record,
+        "lookups": flattened.lookups,
+        "error": None,
+        "records": [{"name": record.name, "strings": record.strings} for record in flattened.records],
+        "ttl": flattened.ttl,
     }
-    return render(request, "spf_generator/generator.html", context)
+
+
+# The API has no side effects and is called by provisioning tools, which don't have a CSRF token
+@csrf_exempt
+@require_http_methods(["GET", "POST"])
+def spf_records_api(request: HttpRequest) -> HttpResponse:
+    """Generate SPF records for many selections of providers in one request.
+
+    GET requests list the providers that can be selected, as `{"version": "...", "providers": [{"id": 1, "name": "...",
+    "category": "...", "mechanism": "...", "lookup_count": 1, "priority": 10}, ...]}`.
+
+    POST requests send `{"all_mechanism": "-all", "selections": [{"providers": [1, 2], "custom_ip": "192.0.2.1",
+    "all_mechanism": "~all"}, ...]}`, where only `selections` and each selection's `providers` are required. The
+    response has a result for each selection, in order, as `{"record": "...", "lookups": 3, "error": null}`. A selection
+    that isn't valid has a null record and the error, and doesn't affect the other selections.
+
+    A selection with `"flatten": true` is flattened, and its result also has the TXT records to publish, as `"records":
+    [{"name": "...", "strings": ["..."]}]`, and the number of seconds they're right for, as `"ttl"`. A flattened record
+    that's too long is split into the strings of one TXT record, or into records on sub-domains of the selection's
+    `domain`, if it has one. No more than `MAX_FLATTENED_SELECTIONS` selections can be flattened in one request. The
+    DNS answers are cached for their TTL, and failures for a minute, so the same providers are only looked up once for
+    the batch.
+
+    Args:
+        request: The HTTP request object
+
+    Returns:
+        HttpResponse containing the JSON providers or results
+    """
+    catalogue = get_catalogue()
+    if request.method == "GET":
+        return JsonResponse(
+            {
+                "version": catalogue.version,
+                "providers": [
+                    {
+                        "id": provider.pk,
+                        "name": provider.name,
+                        "category": provider.category,
+                        "mechanism": provider.get_mechanism(),
+                        "lookup_count": provider.lookup_count,
+                        "priority": provider.priority,
+                    }
+                    for provider in catalogue.providers.values()
+                ],
+            },
+        )
+
+    try:
+        data = json.loads(request.body)
+    except ValueError:
+        return HttpResponseBadRequest("Invalid JSON")
+
+    if not isinstance(data, dict) or not isinstance(selections := data.get("selections"), list):
+        return HttpResponseBadRequest("Selections must be a list")
+    if len(selections) > MAX_BATCH_SIZE:
+        return HttpResponseBadRequest(f"No more than {MAX_BATCH_SIZE} selections can be sent in one request")
+    flattened = sum(1 for selection in selections if isinstance(selection, dict) and selection.get("flatten"))
+    if flattened > MAX_FLATTENED_SELECTIONS:
+        msg = f"No more than {MAX_FLATTENED_SELECTIONS} selections can be flattened in one request"
+        return HttpResponseBadRequest(msg)
+
+    resolver = get_resolver()
+    return JsonResponse(
+        {
+            "version": catalogue.version,
+            "results": [
+                compose_selection(catalogue, selection, data.get("all_mechanism", DEFAULT_ALL_MECHANISM), resolver)
+                for selection in selections
+            ],
+        },
+    )
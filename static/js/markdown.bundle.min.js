@@ -1 +1,245 @@
-(()=>{var e,t={},n={};function r(e){var o=n[e];if(void 0!==o)return o.exports;var i=n[e]={exports:{}};return t[e](i,i.exports,r),i.exports}r.m=t,r.d=(e,t)=>{for(var n in t)r.o(t,n)&&!r.o(e,n)&&Object.defineProperty(e,n,{enumerable:!0,get:t[n]})},r.f={},r.e=e=>Promise.all(Object.keys(r.f).reduce((t,n)=>(r.f[n](e,t),t),[])),r.u=e=>e+".bundle.min.js",r.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(e){if("object"==typeof window)return window}}(),r.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),e={},r.l=(t,n,o,i)=>{if(e[t])e[t].push(n);else{var a,c;if(void 0!==o)for(var l=document.getElementsByTagName("script"),u=0;u<l.length;u++){var d=l[u];if(d.getAttribute("src")==t){a=d;break}}a||(c=!0,(a=document.createElement("script")).charset="utf-8",r.nc&&a.setAttribute("nonce",r.nc),a.src=t),e[t]=[n];var s=(n,r)=>{a.onerror=a.onload=null,clearTimeout(g);var o=e[t];if(delete e[t],a.parentNode&&a.parentNode.removeChild(a),o&&o.forEach(e=>e(r)),n)return n(r)},g=setTimeout(s.bind(null,void 0,{type:"timeout",target:a}),12e4);a.onerror=s.bind(null,a.onerror),a.onload=s.bind(null,a.onload),c&&document.head.appendChild(a)}},r.r=e=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},(()=>{var e;r.g.importScripts&&(e=r.g.location+"");var t=r.g.document;if(!e&&t&&(t.currentScript&&"SCRIPT"===t.currentScript.tagName.toUpperCase()&&(e=t.currentScript.src),!e)){var n=t.getElementsByTagName("script");if(n.length)for(var o=n.length-1;o>-1&&(!e||!/^http(s?):/.test(e));)e=n[o--].src}if(!e)throw new Error("Automatic publicPath is not supported in this browser");e=e.replace(/^blob:/,"").replace(/#.*$/,"").replace(/\?.*$/,"").replace(/\/[^\/]+$/,"/"),r.p=e})(),(()=>{var e={764:0};r.f.j=(t,n)=>{var o=r.o(e,t)?e[t]:void 0;if(0!==o)if(o)n.push(o[2]);else{var i=new Promise((n,r)=>o=e[t]=[n,r]);n.push(o[2]=i);var a=r.p+r.u(t),c=new Error;r.l(a,n=>{if(r.o(e,t)&&(0!==(o=e[t])&&(e[t]=void 0),o)){var i=n&&("load"===n.type?"missing":n.type),a=n&&n.target&&n.target.src;c.message="Loading chunk "+t+" failed.\n("+i+": "+a+")",c.name="ChunkLoadError",c.type=i,c.request=a,o[1](c)}},"chunk-"+t,t)}};var t=(t,n)=>{var o,i,[a,c,l]=n,u=0;if(a.some(t=>0!==e[t])){for(o in c)r.o(c,o)&&(r.m[o]=c[o]);l&&l(r)}for(t&&t(n);u<a.length;u++)i=a[u],r.o(e,i)&&e[i]&&e[i][0](),e[i]=0},n=self.webpackChunk=self.webpackChunk||[];n.forEach(t.bind(null,0)),n.push=t.bind(null,n.push.bind(n))})(),document.addEventListener("DOMContentLoaded",async function(){const{default:e}=await r.e(557).then(r.bind(r,557)),{default:t}=await r.e(11).then(r.bind(r,392)),{default:n}=await r.e(359).then(r.bind(r,359)),{default:o}=await r.e(603).then(r.bind(r,603)),{default:i}=await r.e(510).then(r.bind(r,510)),{default:a}=await r.e(262).then(r.bind(r,262)),{default:c}=await r.e(753).then(r.bind(r,753));t.registerLanguage("html",n),t.registerLanguage("javascript",o),t.registerLanguage("bash",i),t.registerLanguage("python",a),t.registerLanguage("css",c);const l=document.getElementById("editor"),u=document.getElementById("preview"),d=new e({html:!0,highlight:function(e,n){if(n&&t.getLanguage(n))try{return t.highlight(e,{language:n}).value}catch(e){}return""}});function s(){const e=l.value,t=d.render(e);u.innerHTML=t}function g(e){const t=l.selectionStart,n=l.selectionEnd,r=l.value.substring(t,n);if(t!==n){const o=`${e}${r}${e}`;l.value=l.value.substring(0,t)+o+l.value.substring(n),l.focus();const i=e.length;l.setSelectionRange(t+i,n+i),s()}}function m(e,t=!0){const n=l.selectionStart,r=l.selectionEnd,o=l.value;let i=n;for(;i>0&&"\n"!==o[i-1];)i--;const a=o.substring(i,r).split("\n").map((n,r)=>0!==r||t?n.trimStart().startsWith(e.trimStart())?n:"1. "===e&&r>0?`${r+1}. ${n.trimStart()}`:`${e}${n.trimStart()}`:n).join("\n");l.value=o.substring(0,i)+a+o.substring(r),l.focus();const c=i+a.length;l.setSelectionRange(c,c),s()}l.addEventListener("input",s),s(),document.getElementById("copymarkdown-button").addEventListener("click",function(){navigator.clipboard.writeText(l.value).catch(e=>console.error("Failed to copy text: ",e))}),document.getElementById("copyhtml-button").addEventListener("click",function(){navigator.clipboard.writeText(u.innerHTML).catch(e=>console.error("Failed to copy text: ",e))}),document.getElementById("bold-button").addEventListener("click",()=>{g("**")}),document.getElementById("italic-button").addEventListener("click",()=>{g("_")}),document.getElementById("h1-button").addEventListener("click",()=>{m("# ")}),document.getElementById("h2-button").addEventListener("click",()=>{m("## ")}),document.getElementById("h3-button").addEventListener("click",()=>{m("### ")}),document.getElementById("ul-button").addEventListener("click",()=>{m("- ")}),document.getElementById("ol-button").addEventListener("click",()=>{m("1. ")}),document.getElementById("link-button").addEventListener("click",function(){const e=l.selectionStart,t=l.selectionEnd;let n=l.value.substring(e,t).trim();n||(n="link text");const r=`[${n}](url)`;l.value=l.value.substring(0,e)+r+l.value.substring(t),l.focus();const o=e+n.length+3,i=o+3;l.setSelectionRange(o,i),s()}),document.getElementById("blockquote-button").addEventListener("click",()=>{m("> ")}),document.getElementById("code-button")?.addEventListener("click",()=>{g("`")})})})();
+(()=>{document.addEventListener('DOMContentLoaded', function () {
+  const editor = document.getElementById('editor');
+  const preview = document.getElementById('preview');
+
+  // The preview is rendered on the server, by the renderer used for posts. Each block of the document is rendered on
+  // its own, and the server leaves out the HTML of the blocks we already have, so only the edited blocks are rendered,
+  // sent and patched into the page.
+  const previewUrl = preview.dataset.previewUrl;
+  const csrfToken = preview.dataset.csrfToken;
+
+  // The rendered HTML of each block, by the hash of its markdown
+  let renderedBlocks = new Map();
+  // The hash and element of each block shown in the preview, in document order
+  let shownBlocks = [];
+  let pendingRequest = null;
+  let updateTimer = null;
+
+  function blockElement(html) {
+    const element = document.createElement('div');
+    // The wrapper doesn't change the layout of the rendered HTML
+    element.style.display = 'contents';
+    element.innerHTML = html;
+    return element;
+  }
+
+  function patchPreview(blocks) {
+    // The elements of the blocks that are already shown, which are moved rather than rendered again
+    const elements = new Map();
+    for (const block of shownBlocks) {
+      if (!elements.has(block.hash)) {
+        elements.set(block.hash, []);
+      }
+      elements.get(block.hash).push(block.element);
+    }
+
+    const nextRenderedBlocks = new Map();
+    shownBlocks = blocks.map((block) => {
+      const html = block.html ?? renderedBlocks.get(block.hash) ?? '';
+      nextRenderedBlocks.set(block.hash, html);
+      const element = elements.get(block.hash)?.shift() ?? blockElement(html);
+      return { hash: block.hash, element: element };
+    });
+    renderedBlocks = nextRenderedBlocks;
+
+    preview.replaceChildren(...shownBlocks.map((block) => block.element));
+  }
+
+  async function updatePreview() {
+    clearTimeout(updateTimer);
+
+    // A newer edit replaces a preview that hasn't arrived yet
+    pendingRequest?.abort();
+    pendingRequest = new AbortController();
+
+    try {
+      const response = await fetch(previewUrl, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json', 'X-CSRFToken': csrfToken },
+        body: JSON.stringify({ markdown: editor.value, known: [...renderedBlocks.keys()] }),
+        signal: pendingRequest.signal,
+      });
+      if (!response.ok) {
+        throw new Error(`Preview failed: ${response.status}`);
+      }
+      const data = await response.json();
+      patchPreview(data.blocks);
+    } catch (err) {
+      if (err.name !== 'AbortError') {
+        console.error('Failed to update the preview: ', err);
+      }
+    }
+  }
+
+  function schedulePreview() {
+    // Typing only sends a preview request once there's a short pause
+    clearTimeout(updateTimer);
+    updateTimer = setTimeout(updatePreview, 150);
+  }
+
+  function previewHtml() {
+    return shownBlocks.map((block) => renderedBlocks.get(block.hash)).join('\n');
+  }
+
+  editor.addEventListener('input', schedulePreview);
+  updatePreview();
+
+  // Toolbar Functions
+
+  // Function to wrap selected text with formatting markers
+  function applyInlineFormatting(marker) {
+    // Get current selection
+    const start = editor.selectionStart;
+    const end = editor.selectionEnd;
+    const selectedText = editor.value.substring(start, end);
+
+    // Only proceed if something is selected
+    if (start !== end) {
+      // Create formatted text by wrapping selection with markers
+      const formattedText = `${marker}${selectedText}${marker}`;
+
+      // Insert the formatted text
+      editor.value =
+        editor.value.substring(0, start) +
+        formattedText +
+        editor.value.substring(end);
+
+      // Restore focus to the editor
+      editor.focus();
+
+      // Set selection to include the new formatting
+      const markerLength = marker.length;
+      editor.setSelectionRange(start + markerLength, end + markerLength);
+
+      // Manually trigger update
+      updatePreview();
+    }
+  }
+
+  // Function to apply line-based formatting (headers, lists)
+  function applyLineFormatting(prefix, ensureLineStart = true) {
+    const start = editor.selectionStart;
+    const end = editor.selectionEnd;
+    const value = editor.value;
+
+    // Find the start of the line where the cursor/selection begins
+    let lineStart = start;
+    while (lineStart > 0 && value[lineStart - 1] !== '\n') {
+      lineStart--;
+    }
+
+    // Find all lines in the selection
+    const selectedLines = value.substring(lineStart, end).split('\n');
+
+    // Apply formatting to each line
+    const formattedLines = selectedLines.map((line, index) => {
+      // For the first line, consider the possibility that we're in the middle of a line
+      if (index === 0 && !ensureLineStart) {
+        return line;
+      }
+
+      // If line already has the prefix, don't add it again
+      if (line.trimStart().startsWith(prefix.trimStart())) {
+        return line;
+      }
+
+      // For numbered lists, we add the index + 1 to create sequential numbers
+      if (prefix === '1. ' && index > 0) {
+        return `${index + 1}. ${line.trimStart()}`;
+      }
+
+      return `${prefix}${line.trimStart()}`;
+    });
+
+    // Replace the text
+    const replacement = formattedLines.join('\n');
+    editor.value =
+      value.substring(0, lineStart) +
+      replacement +
+      value.substring(end);
+
+    // Restore cursor position
+    editor.focus();
+    const newEnd = lineStart + replacement.length;
+    editor.setSelectionRange(newEnd, newEnd);
+
+    // Manually trigger update
+    updatePreview();
+  }
+
+  function insertLink() {
+    const selectionStart = editor.selectionStart;
+    const selectionEnd = editor.selectionEnd;
+
+    let selectedText = editor.value.substring(selectionStart, selectionEnd).trim();
+    if (!selectedText) {
+      selectedText = 'link text';
+    }
+
+    const linkText = `[${selectedText}](url)`;
+    editor.value =
+      editor.value.substring(0, selectionStart) +
+      linkText +
+      editor.value.substring(selectionEnd);
+
+    editor.focus();
+
+    // Position cursor to select just the "url" text
+    const urlStartPos = selectionStart + selectedText.length + 3; // +3 for "[](""
+    const urlEndPos = urlStartPos + 3; // "url" is 3 characters
+    editor.setSelectionRange(urlStartPos, urlEndPos);
+
+    // Manually trigger update
+    updatePreview();
+  }
+
+  // Buttons
+
+  document.getElementById('copymarkdown-button').addEventListener('click', function () {
+    navigator.clipboard.writeText(editor.value)
+      .catch(err => console.error('Failed to copy text: ', err));
+  });
+
+  document.getElementById('copyhtml-button').addEventListener('click', function () {
+    navigator.clipboard.writeText(previewHtml())
+      .catch(err => console.error('Failed to copy text: ', err));
+  });
+
+  document.getElementById('bold-button').addEventListener('click', () => {
+    applyInlineFormatting('**');
+  });
+
+  document.getElementById('italic-button').addEventListener('click', () => {
+    applyInlineFormatting('_');
+  });
+
+  document.getElementById('h1-button').addEventListener('click', () => {
+    applyLineFormatting('# ');
+  });
+
+  document.getElementById('h2-button').addEventListener('click', () => {
+    applyLineFormatting('## ');
+  });
+
+  document.getElementById('h3-button').addEventListener('click', () => {
+    applyLineFormatting('### ');
+  });
+
+  document.getElementById('ul-button').addEventListener('click', () => {
+    applyLineFormatting('- ');
+  });
+
+  document.getElementById('ol-button').addEventListener('click', () => {
+    applyLineFormatting('1. ');
+  });
+
+  document.getElementById('link-button').addEventListener('click', insertLink);
+
+  document.getElementById('blockquote-button').addEventListener('click', () => {
+    applyLineFormatting('> ');
+  });
+
+  document.getElementById('code-button')?.addEventListener('click', () => {
+    applyInlineFormatting('`');
+  });
+});})();
@@ -0,0 +1,215 @@
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core.cache import caches
+
+from config.cache_backend import TieredSQLiteCache
+from config.caching import LRUCache
+
+
+def make_cache(path, **options):
+    options.setdefault("CULL_INTERVAL", 0)
+    return TieredSQLiteCache(path, {"OPTIONS": options})
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return make_cache(tmp_path / "cache.sqlite3")
+
+
+def test_lru_cache_timeout() -> None:
+    """Test values in the LRU cache expire after their timeout and can be deleted."""
+    lru = LRUCache(maxsize=2)
+    lru.set("a", 1, timeout=0.01)
+    lru.set("b", 2)
+    time.sleep(0.02)
+
+    assert lru.get("a") is None
+    assert len(lru) == 1
+    assert lru.delete("b")
+    assert not lru.delete("b")
+
+
+def test_set_and_get(cache) -> None:
+    """Test values round-trip through both tiers."""
+    cache.set("posts:1", {"title": "Hello"})
+
+    assert cache.get("posts:1") == {"title": "Hello"}
+    assert cache.get("posts:2", "missing") == "missing"
+
+    cache.memory.clear()
+    assert cache.get("posts:1") == {"title": "Hello"}
+
+
+def test_table_is_without_rowid(cache, tmp_path) -> None:
+    """Test the SQLite tier is in its own file, in a WITHOUT ROWID table."""
+    cache.set("key", "value")
+
+    connection = sqlite3.connect(tmp_path / "cache.sqlite3")
+    (sql,) = connection.execute("SELECT sql FROM sqlite_master WHERE name = 'cache'").fetchone()
+    assert "WITHOUT ROWID" in sql
+
+
+def test_values_are_shared_between_processes(tmp_path) -> None:
+    """Test a second instance, standing in for another worker process, sees the same values."""
+    first = make_cache(tmp_path / "cache.sqlite3")
+    second = make_cache(tmp_path / "cache.sqlite3")
+
+    first.set_many({"a": 1, "b": 2})
+
+    assert second.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+
+
+def test_memory_tier_timeout(tmp_path) -> None:
+    """Test a value changed by another process is only served from the memory tier until MEMORY_TIMEOUT."""
+    first = make_cache(tmp_path / "cache.sqlite3", MEMORY_TIMEOUT=0.05)
+    second = make_cache(tmp_path / "cache.sqlite3")
+
+    first.set("key", "old")
+    second.set("key", "new")
+    assert first.get("key") == "old"
+
+    time.sleep(0.06)
+    assert first.get("key") == "new"
+
+
+def test_expiry(cache) -> None:
+    """Test values expire from both tiers."""
+    cache.set("key", "value", timeout=0.05)
+    assert cache.get("key") == "value"
+
+    time.sleep(0.06)
+    assert cache.get("key") is None
+    assert not cache.has_key("key")
+
+
+def test_add_and_touch(cache) -> None:
+    """Test add only sets missing or expired values, and touch updates the timeout."""
+    assert cache.add("key", "first")
+    assert not cache.add("key", "second")
+    assert cache.get("key") == "first"
+
+    cache.set("expired", "old", timeout=0.01)
+    time.sleep(0.02)
+    assert cache.add("expired", "new")
+    assert cache.get("expired") == "new"
+
+    assert cache.touch("key", timeout=0.01)
+    assert not cache.touch("missing")
+    time.sleep(0.02)
+    assert cache.get("key") is None
+
+
+def test_delete(cache) -> None:
+    """Test values are deleted from both tiers."""
+    cache.set_many({"a": 1, "b": 2, "c": 3})
+
+    assert cache.delete("a")
+    assert not cache.delete("a")
+    cache.delete_many(["b", "c"])
+
+    assert cache.get_many(["a", "b", "c"]) == {}
+
+
+def test_get_many_batches_queries(cache) -> None:
+    """Test lookups with more keys than SQLite allows in one statement."""
+    data = {f"key-{i}": i for i in range(1200)}
+    cache.set_many(data)
+    cache.memory.clear()
+
+    assert cache.get_many(data) == data
+
+
+def test_incr(cache) -> None:
+    """Test the increment helpers from the base class work with the tiers."""
+    cache.set("count", 1)
+
+    assert cache.incr("count") == 2
+    assert cache.get("count") == 2
+
+
+def test_stats_by_prefix(cache) -> None:
+    """Test the counters are grouped by the key prefix."""
+    cache.set("markdown:abc", "html")
+    cache.get("markdown:abc")
+    cache.memory.clear()
+    cache.get("markdown:abc")
+    cache.get("markdown:missing")
+    cache.delete("plain")
+
+    stats = cache.stats()
+
+    assert stats["markdown"] == {"memory_hits": 1, "sqlite_hits": 1, "misses": 1, "sets": 1, "deletes": 0}
+    assert stats[""]["deletes"] == 1
+
+
+def test_cull(tmp_path) -> None:
+    """Test culling removes expired values, then the values that expire soonest."""
+    cache = make_cache(tmp_path / "cache.sqlite3", MAX_ENTRIES=5, CULL_FREQUENCY=2)
+    cache.set("expired", "value", timeout=0.01)
+    for i in range(8):
+        cache.set(f"key-{i}", i, timeout=100 + i)
+    cache.set("forever", "value", timeout=None)
+    time.sleep(0.02)
+
+    # Nothing is culled on the request path
+    assert cache.get("expired") is None
+    (count,) = cache._connection().execute("SELECT COUNT(*) FROM cache").fetchone()
+    assert count == 10
+
+    assert cache.cull() == 5
+    cache.memory.clear()
+    assert cache.get_many([f"key-{i}" for i in range(8)]) == {"key-4": 4, "key-5": 5, "key-6": 6, "key-7": 7}
+    assert cache.get("forever") == "value"
+
+
+def test_background_culler(tmp_path) -> None:
+    """Test the background thread culls expired values."""
+    cache = make_cache(tmp_path / "cache.sqlite3", CULL_INTERVAL=0.02)
+    cache.set("key", "value", timeout=0.01)
+
+    time.sleep(0.1)
+
+    (count,) = cache._connection().execute("SELECT COUNT(*) FROM cache").fetchone()
+    assert count == 0
+
+
+def test_concurrent_load(tmp_path) -> None:
+    """Test several threads and instances reading and writing at once."""
+    instances = [make_cache(tmp_path / "cache.sqlite3", MEMORY_MAX_ENTRIES=50) for _ in range(3)]
+
+    def work(worker: int) -> int:
+        cache = instances[worker % len(instances)]
+        for i in range(200):
+            key = f"worker-{worker}:{i % 40}"
+            cache.set(key, (worker, i))
+            assert cache.get(key)[0] == worker
+            cache.get_many([f"worker-{(worker + 1) % 8}:{j}" for j in range(10)])
+            if i % 10 == 0:
+                cache.delete(key)
+        return worker
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert sorted(executor.map(work, range(8))) == list(range(8))
+
+    cache = make_cache(tmp_path / "cache.sqlite3")
+    assert cache.get("worker-3:39") == (3, 199)
+    assert len(instances[0].memory) <= 50
+
+
+def test_configured_as_django_cache(settings, tmp_path) -> None:
+    """Test the backend works as a drop-in CACHES backend."""
+    settings.CACHES = {
+        "tiered": {
+            "BACKEND": "config.cache_backend.TieredSQLiteCache",
+            "LOCATION": tmp_path / "cache.sqlite3",
+            "OPTIONS": {"CULL_INTERVAL": 0},
+        },
+    }
+
+    caches["tiered"].set("key", "value", version=2)
+
+    assert caches["tiered"].get("key", version=2) == "value"
+    assert caches["tiered"].get("key") is None
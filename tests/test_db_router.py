@@ -0,0 +1,84 @@
+import sqlite3
+
+import pytest
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, router
+from django.http import HttpResponse
+from django.test import RequestFactory
+from djpress.models import Post
+
+from config.db_router import READER_ALIAS, ReadOnlyRequestMiddleware, is_read_only_request, read_only_request
+from config.sqlite_backend.base import DatabaseWrapper
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "expected"),
+    [
+        ("get", "/", True),
+        ("head", "/", True),
+        ("get", "/sitemap.xml", True),
+        ("get", "/utils/spf/", True),
+        ("get", "/healthcheck/", True),
+        ("post", "/utils/spf/", False),
+        ("get", f"/{settings.ADMIN_URL}/", False),
+        ("get", "/utils/timezones/", False),
+    ],
+)
+def test_read_only_requests(rf, method, path, expected) -> None:
+    """Test only GET and HEAD requests to the public views are read-only."""
+    assert is_read_only_request(getattr(rf, method)(path)) is expected
+
+
+def test_reads_are_routed_during_read_only_requests() -> None:
+    """Test the middleware routes reads to the reader while handling a read-only request, and writes to the writer."""
+    routes = []
+
+    def get_response(request):
+        routes.append((router.db_for_read(Post), router.db_for_write(Post)))
+        return HttpResponse()
+
+    middleware = ReadOnlyRequestMiddleware(get_response)
+    middleware(RequestFactory().get("/"))
+    middleware(RequestFactory().post("/"))
+
+    assert routes == [(READER_ALIAS, DEFAULT_DB_ALIAS), (DEFAULT_DB_ALIAS, DEFAULT_DB_ALIAS)]
+    assert not read_only_request.get()
+
+
+@pytest.mark.django_db
+def test_reads_in_a_transaction_use_the_writer() -> None:
+    """Test reads inside a transaction on the writer see the transaction's writes."""
+    token = read_only_request.set(True)
+    try:
+        assert router.db_for_read(Post) == DEFAULT_DB_ALIAS
+    finally:
+        read_only_request.reset(token)
+
+
+def test_reader_is_not_migrated() -> None:
+    """Test migrations only run on the writer."""
+    assert not router.allow_migrate(READER_ALIAS, "djpress")
+    assert router.allow_migrate(DEFAULT_DB_ALIAS, "djpress")
+
+
+def test_reader_cannot_write(tmp_path, django_db_blocker) -> None:
+    """Test the reader's connection options open the database read-only."""
+    path = tmp_path / "db.sqlite3"
+    sqlite3.connect(path).execute("CREATE TABLE item (name TEXT)").connection.close()
+    settings_dict = {
+        **connections.settings["default"],
+        "NAME": f"{path.as_uri()}?mode=ro",
+        "OPTIONS": settings.SQLITE_READER_OPTIONS | {"pool_size": 0},
+    }
+    reader = DatabaseWrapper(settings_dict, alias=READER_ALIAS)
+
+    with django_db_blocker.unblock(), reader.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM item")
+        with pytest.raises(OperationalError, match="readonly"):
+            cursor.execute("INSERT INTO item VALUES ('written')")
+    reader.close()
+
+
+def test_reader_is_not_optimized() -> None:
+    """Test the reader's pooled connections don't run PRAGMA optimize, which can write to the database."""
+    assert settings.SQLITE_READER_OPTIONS["optimize_interval"] == 0
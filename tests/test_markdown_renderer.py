@@ -0,0 +1,227 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from config.caching import LRUCache
+
+from config.markdown_renderer import (
+    MARKDOWN_POOL_SIZE,
+    RENDERER_FINGERPRINT,
+    WORDS_PER_MINUTE,
+    Heading,
+    MarkdownMetadata,
+    _markdown_pool,
+    borrow_markdown,
+    create_markdown,
+    _lexer_registry,
+    collect_html_metadata,
+    get_html_metadata,
+    get_lexer,
+    get_markdown_metadata,
+    get_renderer_fingerprint,
+    highlight_cache,
+    highlight_code,
+    html_metadata_cache,
+    mistune_renderer,
+    render_cache,
+    render_markdown,
+    render_markdown_document,
+    warm_lexers,
+    warm_preloaded_lexers,
+)
+
+
+def test_mistune_renderer_matches_new_pipeline() -> None:
+    """Test the pooled pipeline renders the same output as a new pipeline."""
+    text = "# Title\n\nSome *text*.[^1]\n\n```python\nprint('hi')\n```\n\n[^1]: A footnote."
+    expected = str(create_markdown()(text))
+
+    assert mistune_renderer(text) == expected
+    # The second render re-uses the pooled pipeline
+    assert mistune_renderer(text) == expected
+
+
+def test_mistune_renderer_isolates_renders() -> None:
+    """Test that state such as footnotes does not leak between renders."""
+    first = mistune_renderer("First.[^a]\n\n[^a]: Footnote A.")
+    second = mistune_renderer("Second.")
+
+    assert "Footnote A." in first
+    assert "Footnote A." not in second
+    assert "footnotes" not in second
+
+
+def test_borrow_markdown_is_exclusive() -> None:
+    """Test that nested borrows get different pipelines."""
+    with borrow_markdown() as outer, borrow_markdown() as inner:
+        assert outer is not inner
+
+
+def test_pool_is_bounded() -> None:
+    """Test that the pool never holds more than the maximum number of pipelines."""
+    with ThreadPoolExecutor(max_workers=MARKDOWN_POOL_SIZE * 2) as executor:
+        results = list(executor.map(mistune_renderer, [f"Post **{i}**" for i in range(100)]))
+
+    assert results == [f"<p>Post <strong>{i}</strong></p>\n" for i in range(100)]
+    assert _markdown_pool.qsize() <= MARKDOWN_POOL_SIZE
+
+
+def test_mistune_renderer_caches_html() -> None:
+    """Test that rendered HTML is cached in memory and in the persistent tier."""
+    render_cache.clear()
+    text = "A post that is *cached*."
+
+    html = mistune_renderer(text)
+    assert mistune_renderer(text) == html
+    stats = render_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["persistent_misses"] == 1
+
+    # A new worker process starts with an empty in-process tier but finds the HTML in the persistent tier
+    render_cache.memory.clear()
+    assert mistune_renderer(text) == html
+    assert render_cache.stats()["persistent_hits"] == 1
+
+
+def test_render_cache_key_includes_fingerprint() -> None:
+    """Test that the cache is invalidated when the renderer configuration changes."""
+    assert RENDERER_FINGERPRINT in render_cache.prefix
+    assert get_renderer_fingerprint() == RENDERER_FINGERPRINT
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    """Test the LRU cache evicts the least recently used value."""
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+
+def test_lexer_registry_uses_language_name() -> None:
+    """Test that lexers are registered under the language name, not the full info string."""
+    _lexer_registry.pop("python", None)
+
+    html = render_markdown("```python linenums\nprint('lexer registry')\n```")
+    assert '<div class="highlight">' in html
+    assert _lexer_registry["python"] is get_lexer("Python")
+    assert "python linenums" not in _lexer_registry
+
+
+def test_unknown_language_uses_text_lexer() -> None:
+    """Test that unknown languages are highlighted as plain text."""
+    assert get_lexer("not-a-real-language").name == "Text only"
+    assert '<span class="nb">' not in render_markdown("```not-a-real-language\nprint('hi')\n```")
+
+
+def test_warm_lexers() -> None:
+    """Test that warming the registry loads the lexers."""
+    warm_lexers(["toml", "yaml"])
+    assert _lexer_registry["toml"].name == "TOML"
+    assert _lexer_registry["yaml"].name == "YAML"
+
+
+def test_lexers_are_warmed_by_the_first_highlighted_code() -> None:
+    """Test that creating a pipeline doesn't load any lexers, and highlighting the first code block loads them all."""
+    _lexer_registry.clear()
+    warm_preloaded_lexers.cache_clear()
+
+    create_markdown()
+    assert not _lexer_registry
+
+    highlight_code("a = 1", "python")
+    assert _lexer_registry["css"].name == "CSS"
+
+
+def test_highlighted_code_is_cached() -> None:
+    """Test that highlighted code is shared between documents."""
+    highlight_cache.clear()
+    code = "```python\nimport this\n```"
+
+    first = render_markdown(f"# First\n\n{code}")
+    second = render_markdown(f"# Second\n\n{code}")
+
+    assert first.split("</h1>")[1] == second.split("</h1>")[1]
+    assert highlight_cache.stats()["hits"] == 1
+
+
+def test_render_collects_metadata() -> None:
+    """Test the metadata is collected during the render."""
+    text = (
+        "# Intro\n\nOne two three.\n\n## Setup &amp; *install*\n\n![Alt](/static/a.png)\n\n"
+        "```Python\nprint('not counted')\n```\n\n## Intro\n\n![Other](/static/b.png)\n\n```bash\nls\n```"
+    )
+
+    rendered = render_markdown_document(text)
+    metadata = rendered.metadata
+
+    assert [(heading.level, heading.title, heading.slug) for heading in metadata.headings] == [
+        (1, "Intro", "intro"),
+        (2, "Setup & install", "setup-install"),
+        (2, "Intro", "intro-1"),
+    ]
+    assert '<h2 id="intro-1">Intro</h2>' in rendered.html
+    assert metadata.word_count == 8
+    assert metadata.reading_time == 1
+    assert metadata.first_image == "/static/a.png"
+    assert metadata.code_languages == ("python", "bash")
+
+
+def test_metadata_does_not_leak_between_renders() -> None:
+    """Test a pooled pipeline starts each render with fresh metadata."""
+    render_markdown_document("# Title\n\nSome words here.\n\n![Alt](/a.png)")
+
+    metadata = render_markdown_document("# Title").metadata
+
+    assert metadata.headings == (Heading(level=1, title="Title", slug="title"),)
+    assert metadata.word_count == 1
+    assert metadata.first_image is None
+
+
+def test_reading_time() -> None:
+    """Test the reading time is rounded up, and zero for empty documents."""
+    assert MarkdownMetadata().reading_time == 0
+    assert MarkdownMetadata(word_count=WORDS_PER_MINUTE + 1).reading_time == 2
+
+
+def test_metadata_is_cached_with_html() -> None:
+    """Test the metadata comes from the same cache entry as the rendered HTML."""
+    text = "## Cached metadata heading\n\nWords."
+    render_cache.clear()
+
+    assert mistune_renderer(text) == '<h2 id="cached-metadata-heading">Cached metadata heading</h2>\n<p>Words.</p>\n'
+    metadata = get_markdown_metadata(text)
+
+    assert metadata.headings[0].slug == "cached-metadata-heading"
+    assert render_cache.stats()["hits"] == 1
+
+
+def test_collect_html_metadata() -> None:
+    """Test the metadata is collected from HTML rendered by another content renderer."""
+    html = (
+        '<h1 id="intro">Intro</h1><p>One <strong>two</strong> three.</p><h2>No id</h2>'
+        '<p><img src="/static/a.png" alt="Alt"></p><pre><code class="language-Python">print("not counted")</code></pre>'
+        '<h2 id="setup">Setup &amp; <em>install</em></h2>'
+    )
+
+    metadata = collect_html_metadata(html)
+
+    assert metadata.headings == (
+        Heading(level=1, title="Intro", slug="intro"),
+        Heading(level=2, title="Setup & install", slug="setup"),
+    )
+    assert metadata.word_count == 9
+    assert metadata.first_image == "/static/a.png"
+    assert metadata.code_languages == ("python",)
+
+
+def test_html_metadata_is_cached() -> None:
+    """Test the metadata collected from HTML is cached by a hash of the HTML."""
+    html_metadata_cache.clear()
+
+    assert get_html_metadata("<p>Cached words.</p>").word_count == 2
+    assert get_html_metadata("<p>Cached words.</p>").word_count == 2
+    assert html_metadata_cache.stats()["hits"] == 1
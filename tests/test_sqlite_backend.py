@@ -0,0 +1,108 @@
+import time
+
+import pytest
+from django.db import connections
+
+from config.sqlite_backend.base import DatabaseWrapper, pool_stats
+
+
+def make_wrapper(name, **options):
+    options.setdefault("pool_size", 2)
+    options.setdefault("init_command", "PRAGMA journal_mode = WAL;PRAGMA cache_size = 1234;")
+    settings_dict = {**connections.settings["default"], "NAME": name, "OPTIONS": options}
+    return DatabaseWrapper(settings_dict, alias="pooled")
+
+
+@pytest.fixture
+def database(tmp_path):
+    return tmp_path / "db.sqlite3"
+
+
+@pytest.fixture(autouse=True)
+def close_pools(database, django_db_blocker):
+    # The wrappers connect to their own databases rather than the test database
+    with django_db_blocker.unblock():
+        yield
+    wrapper = make_wrapper(database)
+    wrapper.get_connection_params()
+    wrapper.pool.clear()
+
+
+def test_closed_connection_is_reused(database) -> None:
+    """Test a closed connection is returned to the pool, and its PRAGMAs aren't run again."""
+    wrapper = make_wrapper(database)
+    wrapper.ensure_connection()
+    connection = wrapper.connection
+    wrapper.close()
+
+    other = make_wrapper(database)
+    other.ensure_connection()
+
+    assert other.connection is connection
+    with other.cursor() as cursor:
+        cursor.execute("PRAGMA cache_size")
+        assert cursor.fetchone() == (1234,)
+    other.close()
+    assert other.pool.stats() == {"hits": 1, "opens": 1, "closes": 0, "optimizes": 0, "idle": 1}
+    assert pool_stats()[str(database)]["hits"] == 1
+
+
+def test_pool_is_bounded(database) -> None:
+    """Test connections beyond the pool size are closed."""
+    wrappers = [make_wrapper(database, pool_size=1) for _ in range(2)]
+    for wrapper in wrappers:
+        wrapper.ensure_connection()
+    for wrapper in wrappers:
+        wrapper.close()
+
+    assert wrappers[0].pool.stats() == {"hits": 0, "opens": 2, "closes": 1, "optimizes": 0, "idle": 1}
+
+
+def test_open_transaction_is_rolled_back(database) -> None:
+    """Test a connection returned to the pool doesn't keep an open transaction."""
+    wrapper = make_wrapper(database)
+    with wrapper.cursor() as cursor:
+        cursor.execute("CREATE TABLE item (name TEXT)")
+    wrapper.connection.execute("BEGIN")
+    wrapper.connection.execute("INSERT INTO item VALUES ('lost')")
+    wrapper.close()
+
+    with wrapper.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM item")
+        assert cursor.fetchone() == (0,)
+    assert not wrapper.connection.in_transaction
+    wrapper.close()
+
+
+def test_connection_closed_in_atomic_block_is_not_reused(database) -> None:
+    """Test a connection closed inside an atomic block is closed rather than shared."""
+    wrapper = make_wrapper(database)
+    wrapper.ensure_connection()
+    # As if the connection were closed after an error inside `transaction.atomic()`
+    wrapper.in_atomic_block = True
+    wrapper.close()
+
+    assert wrapper.closed_in_transaction
+    assert wrapper.pool.stats()["closes"] == 1
+    assert wrapper.pool.stats()["idle"] == 0
+
+
+def test_optimize_runs_periodically(database) -> None:
+    """Test `PRAGMA optimize` runs when a connection is returned after the interval."""
+    wrapper = make_wrapper(database, optimize_interval=0.01)
+    wrapper.ensure_connection()
+    wrapper.close()
+    wrapper.ensure_connection()
+    time.sleep(0.02)
+    wrapper.close()
+
+    assert wrapper.pool.stats()["optimizes"] == 1
+
+
+def test_in_memory_database_is_not_pooled() -> None:
+    """Test in-memory databases, such as the test database, use Django's own behaviour."""
+    wrapper = make_wrapper(":memory:")
+    wrapper.ensure_connection()
+
+    assert wrapper.pool is None
+    wrapper.connection.close()